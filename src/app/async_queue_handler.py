@@ -0,0 +1,376 @@
+"""Asyncio-native queue consumer for RabbitMQ (aio-pika) or SQS (aiobotocore).
+
+Counterpart of `app.queue_handler` for QUEUE_BACKEND=asyncio. A single event
+loop receives messages, groups them into batches, and keeps up to
+MAX_INFLIGHT_BATCHES batches in flight at once, without a thread per connection.
+"""
+
+import asyncio
+import inspect
+import signal
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+import app.config_shared as config
+from app.async_queue_sender import bind_event_loop, close_publishers
+from app.queue_handler import (
+    run_shutdown_hooks,
+    safe_log,
+)
+from app.utils import message_codec, sqs_batching
+from app.utils.metrics import record_ack_metrics, set_inflight_batches
+from app.utils.setup_logger import setup_logger
+
+try:
+    import aio_pika
+except ImportError:
+    aio_pika = None  # type: ignore[assignment]  # Required only for QUEUE_BACKEND=asyncio with RabbitMQ
+
+try:
+    from aiobotocore.session import get_session
+except ImportError:
+    get_session = None  # Required only for QUEUE_BACKEND=asyncio with SQS
+
+logger = setup_logger(__name__)
+
+BatchCallback = Callable[[list[dict[str, Any]]], Awaitable[None] | None]
+
+
+async def consume_messages(callback: BatchCallback) -> None:
+    """Start the asyncio message consumer using the configured QUEUE_TYPE.
+
+    The callback may be a coroutine function or a regular function; regular
+    functions run in the default thread pool so they do not block the loop.
+
+    Args:
+        callback (BatchCallback): Processing function for a batch of messages.
+
+    Raises:
+        ValueError: If QUEUE_TYPE is not supported.
+
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, _graceful_shutdown, stop_event)
+
+    queue_type = config.get_queue_type().lower()
+    if queue_type == "rabbitmq":
+        consumer = _consume_rabbitmq
+    elif queue_type == "sqs":
+        consumer = _consume_sqs
+    else:
+        raise ValueError("Unsupported QUEUE_TYPE: [REDACTED]")
+
+    bind_event_loop(loop)
+    try:
+        await consumer(callback, stop_event)
+    finally:
+        await asyncio.to_thread(run_shutdown_hooks)
+        await close_publishers()
+        bind_event_loop(None)
+
+
+def _graceful_shutdown(stop_event: asyncio.Event) -> None:
+    """Signal the consumer loop to stop after in-flight batches finish.
+
+    Args:
+        stop_event (asyncio.Event): Event watched by the consumer loop.
+
+    """
+    logger.info("🛑 Shutdown signal received, stopping listener...")
+    stop_event.set()
+
+
+def _require(dependency: Any, package: str) -> None:
+    """Fail fast when an optional asyncio dependency is missing.
+
+    Args:
+        dependency (Any): Imported module or attribute, or None if the import failed.
+        package (str): Package name to install.
+
+    Raises:
+        RuntimeError: If the dependency is not installed.
+
+    """
+    if dependency is None:
+        raise RuntimeError(f"QUEUE_BACKEND=asyncio requires the '{package}' package.")
+
+
+async def _run_callback(callback: BatchCallback, payloads: list[dict[str, Any]]) -> None:
+    """Invoke the batch callback without blocking the event loop.
+
+    Args:
+        callback (BatchCallback): Processing function for a batch of messages.
+        payloads (list[dict]): Decoded messages.
+
+    """
+    if inspect.iscoroutinefunction(callback):
+        await callback(payloads)
+    else:
+        await asyncio.to_thread(callback, payloads)
+
+
+async def _collect_batch(
+    deliveries: asyncio.Queue[Any],
+    max_size: int,
+    max_wait: float,
+) -> list[Any]:
+    """Collect up to `max_size` deliveries, waiting at most `max_wait` after the first one.
+
+    Args:
+        deliveries (asyncio.Queue): Queue fed by the broker consumer.
+        max_size (int): Maximum number of messages in a batch.
+        max_wait (float): Seconds to wait for a batch to fill after its first message.
+
+    Returns:
+        list[Any]: Collected deliveries; empty if nothing arrived within one second.
+
+    """
+    try:
+        batch = [await asyncio.wait_for(deliveries.get(), timeout=1.0)]
+    except asyncio.TimeoutError:
+        return []
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+    while len(batch) < max_size:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(deliveries.get(), timeout=remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _consume_rabbitmq(callback: BatchCallback, stop_event: asyncio.Event) -> None:
+    """Consume RabbitMQ messages with aio-pika until shutdown.
+
+    Args:
+        callback (BatchCallback): Processing function for a batch of messages.
+        stop_event (asyncio.Event): Event that stops the consumer.
+
+    """
+    _require(aio_pika, "aio-pika")
+    batch_size = max(1, config.get_batch_size())
+    max_wait = config.get_batch_max_wait()
+    max_inflight = config.get_max_inflight_batches()
+
+    connection = await aio_pika.connect_robust(
+        host=config.get_rabbitmq_host(),
+        port=config.get_rabbitmq_port(),
+        login=config.get_rabbitmq_user(),
+        password=config.get_rabbitmq_password(),
+        virtualhost=config.get_rabbitmq_vhost(),
+    )
+    try:
+        channel = await connection.channel()
+        await channel.set_qos(prefetch_count=batch_size * max_inflight)
+        queue = await channel.declare_queue(config.get_rabbitmq_queue(), durable=True)
+
+        deliveries: asyncio.Queue[Any] = asyncio.Queue()
+        consumer_tag = await queue.consume(deliveries.put)
+        logger.info(safe_log("🚀 Consuming RabbitMQ messages from queue (asyncio)"))
+
+        slots = asyncio.Semaphore(max_inflight)
+        tasks: set[asyncio.Task[None]] = set()
+        while not stop_event.is_set():
+            batch = await _collect_batch(deliveries, batch_size, max_wait)
+            if not batch:
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(_process_rabbitmq_batch(callback, batch))
+            _track(tasks, task, slots, "rabbitmq")
+
+        await queue.cancel(consumer_tag)
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        await connection.close()
+        logger.info("🛑 RabbitMQ listener stopped.")
+
+
+async def _process_rabbitmq_batch(callback: BatchCallback, batch: list[Any]) -> None:
+    """Decode, process, and acknowledge one batch of RabbitMQ deliveries.
+
+    Args:
+        callback (BatchCallback): Processing function for a batch of messages.
+        batch (list[Any]): aio-pika incoming messages.
+
+    """
+    payloads: list[dict[str, Any]] = []
+    decoded: list[Any] = []
+    for message in batch:
+        try:
+            payloads.append(
+                message_codec.decode(message.body, message.content_type, message.content_encoding)
+            )
+            decoded.append(message)
+        except Exception:
+            logger.error("❌ RabbitMQ message could not be decoded (details redacted)")
+            await message.nack(requeue=False)
+            record_ack_metrics("rabbitmq", "failure")
+
+    if not payloads:
+        return
+
+    try:
+        await _run_callback(callback, payloads)
+    except Exception:
+        logger.error("❌ RabbitMQ batch processing failed (details redacted)")
+        for message in decoded:
+            await message.nack(requeue=False)
+        record_ack_metrics("rabbitmq", "failure", len(decoded))
+        return
+
+    for message in decoded:
+        await message.ack()
+    record_ack_metrics("rabbitmq", "success", len(decoded))
+    logger.debug("✅ RabbitMQ batch of %d message(s) processed and acknowledged.", len(decoded))
+
+
+async def _consume_sqs(callback: BatchCallback, stop_event: asyncio.Event) -> None:
+    """Poll SQS with aiobotocore until shutdown, processing batches concurrently.
+
+    Args:
+        callback (BatchCallback): Processing function for a batch of messages.
+        stop_event (asyncio.Event): Event that stops the consumer.
+
+    """
+    _require(get_session, "aiobotocore")
+    queue_url = config.get_sqs_queue_url()
+    slots = asyncio.Semaphore(config.get_max_inflight_batches())
+    tasks: set[asyncio.Task[None]] = set()
+
+    async with get_session().create_client("sqs", region_name=config.get_sqs_region()) as sqs:
+        logger.info(safe_log("🚀 Polling SQS queue (asyncio)"))
+
+        while not stop_event.is_set():
+            await slots.acquire()
+            try:
+                response = await sqs.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=config.get_batch_size(),
+                    WaitTimeSeconds=10,
+                    MessageAttributeNames=message_codec.SQS_ATTRIBUTE_NAMES,
+                )
+            except (BotoCoreError, ClientError):
+                slots.release()
+                logger.error("❌ SQS error encountered (details redacted)")
+                await asyncio.sleep(5)
+                continue
+
+            messages = response.get("Messages", [])
+            if not messages:
+                slots.release()
+                continue
+
+            task = asyncio.create_task(_process_sqs_batch(sqs, queue_url, callback, messages))
+            _track(tasks, task, slots, "sqs")
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    logger.info("🛑 SQS polling stopped.")
+
+
+async def _process_sqs_batch(
+    sqs: Any,
+    queue_url: str,
+    callback: BatchCallback,
+    messages: list[dict[str, Any]],
+) -> None:
+    """Decode, process, and delete one batch of SQS messages.
+
+    Args:
+        sqs (Any): aiobotocore SQS client.
+        queue_url (str): Queue the messages were received from.
+        callback (BatchCallback): Processing function for a batch of messages.
+        messages (list[dict[str, Any]]): Raw SQS messages.
+
+    """
+    payloads: list[dict[str, Any]] = []
+    receipt_handles: list[str] = []
+    for msg in messages:
+        try:
+            payloads.append(message_codec.decode_sqs_message(msg))
+            receipt_handles.append(msg["ReceiptHandle"])
+        except Exception:
+            logger.warning("⚠️ Failed to parse SQS message body (redacted)")
+
+    if not payloads:
+        return
+
+    try:
+        await _run_callback(callback, payloads)
+    except Exception:
+        logger.error("❌ SQS batch processing failed (details redacted)")
+        record_ack_metrics("sqs", "failure", len(receipt_handles))
+        return
+
+    await _delete_sqs_messages(sqs, queue_url, receipt_handles)
+    logger.debug("✅ SQS: Processed and acknowledged %d message(s)", len(payloads))
+
+
+async def _delete_sqs_messages(sqs: Any, queue_url: str, receipt_handles: list[str]) -> int:
+    """Delete processed SQS messages using DeleteMessageBatch.
+
+    Entries that fail for a non-sender reason are retried up to
+    SQS_DELETE_MAX_ATTEMPTS times in total, as in the threaded consumer.
+    Messages that still fail to delete become visible again after the
+    visibility timeout and will be redelivered.
+
+    Args:
+        sqs (Any): aiobotocore SQS client.
+        queue_url (str): Queue the messages were received from.
+        receipt_handles (list[str]): Receipt handles of processed messages.
+
+    Returns:
+        int: Number of messages that could not be deleted.
+
+    """
+    failed = 0
+    for entries in sqs_batching.delete_entries(receipt_handles):
+        for attempt in range(1, sqs_batching.SQS_DELETE_MAX_ATTEMPTS + 1):
+            try:
+                response = await sqs.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+            except (BotoCoreError, ClientError):
+                failed += sqs_batching.record_delete_error(entries)
+                break
+
+            permanent, entries = sqs_batching.handle_delete_response(response, entries, attempt)
+            failed += permanent
+            if not entries:
+                break
+
+    return failed
+
+
+def _track(
+    tasks: set[asyncio.Task[None]],
+    task: asyncio.Task[None],
+    slots: asyncio.Semaphore,
+    queue_type: str,
+) -> None:
+    """Keep a reference to a batch task and free its in-flight slot when it finishes.
+
+    Args:
+        tasks (set[asyncio.Task]): Set of running batch tasks.
+        task (asyncio.Task): Newly created batch task.
+        slots (asyncio.Semaphore): In-flight limit released when the task completes.
+        queue_type (str): Queue type label for the in-flight gauge.
+
+    """
+    tasks.add(task)
+    set_inflight_batches(queue_type, len(tasks))
+
+    def on_done(finished: asyncio.Task[None]) -> None:
+        tasks.discard(finished)
+        slots.release()
+        set_inflight_batches(queue_type, len(tasks))
+
+    task.add_done_callback(on_done)
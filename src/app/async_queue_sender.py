@@ -0,0 +1,422 @@
+"""Asyncio-native message publisher for RabbitMQ (aio-pika) or AWS SQS (aiobotocore).
+
+Counterpart of `app.queue_sender` for QUEUE_BACKEND=asyncio. Keeps one robust
+RabbitMQ connection and one SQS client open and publishes the messages of a
+batch concurrently on the running event loop, with RabbitMQ publisher confirms.
+Output sinks running in worker threads publish through `publish_from_thread`.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any
+
+from app import config_shared
+from app.queue_sender import (
+    RABBITMQ_PUBLISH_MAX_ATTEMPTS,
+    REDACT_SENSITIVE_LOGS,
+    RabbitMQPublishError,
+    SQSMessageSendError,
+)
+from app.utils import message_codec, sqs_batching
+from app.utils.metrics import (
+    queue_publish_counter,
+    queue_publish_latency,
+    record_connection_event,
+    record_publish_confirms,
+)
+from app.utils.safe_logger import safe_error, safe_info
+
+try:
+    import aio_pika
+    from aio_pika.exceptions import DeliveryError
+except ImportError:
+    aio_pika = None  # type: ignore[assignment]  # Required only for QUEUE_BACKEND=asyncio with RabbitMQ
+    DeliveryError = None  # type: ignore[assignment, misc]
+
+try:
+    from aiobotocore.session import get_session
+except ImportError:
+    get_session = None  # Required only for QUEUE_BACKEND=asyncio with SQS
+
+
+class AsyncRabbitMQPublisher:
+    """Long-lived aio-pika publisher sharing one robust connection and channel.
+
+    With publisher confirms enabled, the messages of a batch are published
+    concurrently (at most RABBITMQ_MAX_UNCONFIRMED awaiting their broker ack
+    at once); only the messages that were nacked or timed out are published again. Must be used from a single event loop.
+    """
+
+    def __init__(self, confirms: bool | None = None) -> None:
+        """Initialize the publisher without opening a connection.
+
+        Args:
+            confirms (Optional[bool]): Use publisher confirms; defaults to
+                RABBITMQ_PUBLISHER_CONFIRMS.
+
+        """
+        self._confirms = (
+            config_shared.get_rabbitmq_publisher_confirms() if confirms is None else confirms
+        )
+        self._connection: Any = None
+        self._channel: Any = None
+        self._exchanges: dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+
+    async def publish_batch(
+        self,
+        bodies: list[bytes],
+        exchange: str,
+        routing_key: str,
+        content_type: str = message_codec.JSON_CONTENT_TYPE,
+        content_encodings: list[str | None] | None = None,
+    ) -> None:
+        """Publish several message bodies concurrently, re-publishing only failed ones.
+
+        Args:
+            bodies (list[bytes]): Encoded message bodies.
+            exchange (str): Exchange to publish to ("" for the default exchange).
+            routing_key (str): Routing key for every message.
+            content_type (str): Content type the bodies are encoded as.
+            content_encodings (Optional[list[Optional[str]]]): Compression applied to
+                each body, in the same order (None for uncompressed bodies).
+
+        Raises:
+            RabbitMQPublishError: If any message still failed after
+                RABBITMQ_PUBLISH_MAX_ATTEMPTS rounds.
+
+        """
+        encodings = content_encodings or [None] * len(bodies)
+        confirm_timeout = config_shared.get_rabbitmq_confirm_timeout()
+        window = max(1, config_shared.get_rabbitmq_max_unconfirmed())
+        pending = list(range(len(bodies)))
+
+        for attempt in range(1, RABBITMQ_PUBLISH_MAX_ATTEMPTS + 1):
+            target = await self._get_exchange(exchange)
+            start = time.perf_counter()
+            results: list[Any] = []
+            for offset in range(0, len(pending), window):
+                results += await asyncio.gather(
+                    *(
+                        target.publish(
+                            aio_pika.Message(
+                                body=bodies[index],
+                                content_type=content_type,
+                                content_encoding=encodings[index],
+                            ),
+                            routing_key=routing_key,
+                            timeout=confirm_timeout,
+                        )
+                        for index in pending[offset : offset + window]
+                    ),
+                    return_exceptions=True,
+                )
+            duration = time.perf_counter() - start
+
+            failed = [
+                index
+                for index, result in zip(pending, results)
+                if isinstance(result, BaseException)
+            ]
+            if self._confirms:
+                record_publish_confirms("rabbitmq", "ack", len(pending) - len(failed))
+                for result in results:
+                    if isinstance(result, BaseException):
+                        record_publish_confirms("rabbitmq", _confirm_result(result))
+            if len(pending) > len(failed):
+                queue_publish_counter.labels(queue_type="rabbitmq", status="success").inc(
+                    len(pending) - len(failed)
+                )
+            queue_publish_latency.labels(
+                queue_type="rabbitmq", status="failure" if failed else "success"
+            ).observe(duration)
+
+            pending = failed
+            if not pending:
+                return
+            if attempt < RABBITMQ_PUBLISH_MAX_ATTEMPTS:
+                await asyncio.sleep(min(2**attempt, 10))
+
+        queue_publish_counter.labels(queue_type="rabbitmq", status="failure").inc(len(pending))
+        safe_error("RabbitMQ async publish failed", {"failed": len(pending), "total": len(bodies)})
+        raise RabbitMQPublishError(f"{len(pending)} of {len(bodies)} RabbitMQ message(s) failed")
+
+    async def close(self) -> None:
+        """Close the underlying connection."""
+        connection, self._connection, self._channel = self._connection, None, None
+        self._exchanges = {}
+        if connection is not None and not connection.is_closed:
+            await connection.close()
+
+    async def _get_channel(self) -> Any:
+        """Return the open channel, connecting on first use.
+
+        Returns:
+            Any: An aio-pika channel.
+
+        """
+        async with self._lock:
+            if self._channel is not None and not self._channel.is_closed:
+                record_connection_event("rabbitmq_async_publisher", "reuse")
+                return self._channel
+
+            if self._connection is None or self._connection.is_closed:
+                self._connection = await aio_pika.connect_robust(
+                    host=config_shared.get_rabbitmq_host(),
+                    port=config_shared.get_rabbitmq_port(),
+                    login=config_shared.get_rabbitmq_user(),
+                    password=config_shared.get_rabbitmq_password(),
+                    virtualhost=config_shared.get_rabbitmq_vhost(),
+                )
+                record_connection_event("rabbitmq_async_publisher", "open")
+            else:
+                record_connection_event("rabbitmq_async_publisher", "reconnect")
+
+            self._channel = await self._connection.channel(publisher_confirms=self._confirms)
+            self._exchanges = {}
+            return self._channel
+
+    async def _get_exchange(self, name: str) -> Any:
+        """Return a cached exchange handle.
+
+        Args:
+            name (str): Exchange name ("" for the default exchange).
+
+        Returns:
+            Any: An aio-pika exchange.
+
+        """
+        channel = await self._get_channel()
+        if not name:
+            return channel.default_exchange
+        exchange = self._exchanges.get(name)
+        if exchange is None:
+            exchange = await channel.get_exchange(name, ensure=False)
+            self._exchanges[name] = exchange
+        return exchange
+
+
+def _confirm_result(error: BaseException) -> str:
+    """Classify a failed confirmed publish for the confirms metric.
+
+    Args:
+        error (BaseException): Exception returned by the publish.
+
+    Returns:
+        str: "nack", "timeout", or "lost".
+
+    """
+    if DeliveryError is not None and isinstance(error, DeliveryError):
+        return "nack"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    return "lost"
+
+
+_rabbitmq_publisher: AsyncRabbitMQPublisher | None = None
+_sqs_client: Any = None
+_sqs_exit_stack: contextlib.AsyncExitStack | None = None
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_rabbitmq_publisher() -> AsyncRabbitMQPublisher:
+    """Return the shared async RabbitMQ publisher.
+
+    Returns:
+        AsyncRabbitMQPublisher: Publisher bound to the running event loop.
+
+    Raises:
+        RuntimeError: If aio-pika is not installed.
+
+    """
+    global _rabbitmq_publisher
+    if aio_pika is None:
+        raise RuntimeError("QUEUE_BACKEND=asyncio requires the 'aio-pika' package.")
+    if _rabbitmq_publisher is None:
+        _rabbitmq_publisher = AsyncRabbitMQPublisher()
+    return _rabbitmq_publisher
+
+
+async def _get_sqs_client() -> Any:
+    """Return the shared aiobotocore SQS client, creating it on first use.
+
+    Returns:
+        Any: An aiobotocore SQS client.
+
+    Raises:
+        RuntimeError: If aiobotocore is not installed.
+
+    """
+    global _sqs_client, _sqs_exit_stack
+    if get_session is None:
+        raise RuntimeError("QUEUE_BACKEND=asyncio requires the 'aiobotocore' package.")
+    if _sqs_client is None:
+        _sqs_exit_stack = contextlib.AsyncExitStack()
+        _sqs_client = await _sqs_exit_stack.enter_async_context(
+            get_session().create_client("sqs", region_name=config_shared.get_sqs_region())
+        )
+    return _sqs_client
+
+
+async def close_publishers() -> None:
+    """Close the shared RabbitMQ connection and SQS client."""
+    global _rabbitmq_publisher, _sqs_client, _sqs_exit_stack
+    if _rabbitmq_publisher is not None:
+        await _rabbitmq_publisher.close()
+        _rabbitmq_publisher = None
+    if _sqs_exit_stack is not None:
+        await _sqs_exit_stack.aclose()
+    _sqs_client, _sqs_exit_stack = None, None
+
+
+async def publish_to_queue(
+    payload: list[dict[str, Any]],
+    queue: str | None = None,
+    exchange: str | None = None,
+) -> None:
+    """Publish a batch of processed messages to the configured queue.
+
+    Args:
+        payload (list[dict[str, Any]]): List of messages to send.
+        queue (Optional[str]): Optional override for queue name or routing key.
+        exchange (Optional[str]): Optional override for RabbitMQ exchange.
+
+    """
+    if not isinstance(payload, list):
+        safe_error("Invalid payload type", {"expected": "list", "got": str(type(payload).__name__)})
+        return
+    if not payload:
+        return
+
+    queue_type: str = config_shared.get_queue_type().lower()
+
+    if queue_type == "rabbitmq":
+        bodies, content_types, content_encodings = zip(
+            *(message_codec.encode_published_message(message) for message in payload)
+        )
+        await get_rabbitmq_publisher().publish_batch(
+            list(bodies),
+            exchange=exchange or config_shared.get_rabbitmq_exchange(),
+            routing_key=queue or config_shared.get_rabbitmq_routing_key(),
+            content_type=content_types[0],
+            content_encodings=list(content_encodings),
+        )
+        safe_info("Published batch to RabbitMQ", {"messages": len(payload)})
+    elif queue_type == "sqs":
+        await _send_batch_to_sqs(payload, queue)
+    else:
+        safe_error(
+            "Invalid QUEUE_TYPE",
+            {"queue_type": "[REDACTED]" if REDACT_SENSITIVE_LOGS else queue_type},
+        )
+
+
+def bind_event_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """Set the event loop `publish_from_thread` schedules publishes on.
+
+    Args:
+        loop (Optional[asyncio.AbstractEventLoop]): The consumer's loop, or None to unbind.
+
+    """
+    global _event_loop
+    _event_loop = loop
+
+
+def publish_from_thread(
+    payload: list[dict[str, Any]],
+    queue: str | None = None,
+    exchange: str | None = None,
+) -> None:
+    """Publish from a worker thread on the asyncio consumer's event loop.
+
+    Synchronous batch callbacks run in the default thread pool; this lets them
+    use the loop's shared connections and wait for the publish to finish.
+
+    Args:
+        payload (list[dict[str, Any]]): List of messages to send.
+        queue (Optional[str]): Optional override for queue name or routing key.
+        exchange (Optional[str]): Optional override for RabbitMQ exchange.
+
+    Raises:
+        RuntimeError: If no consumer loop is bound, or if called on the loop itself.
+
+    """
+    loop = _event_loop
+    if loop is None or loop.is_closed():
+        raise RuntimeError("No asyncio consumer loop is running to publish on.")
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("publish_from_thread() must not be called on the event loop.")
+    asyncio.run_coroutine_threadsafe(publish_to_queue(payload, queue, exchange), loop).result()
+
+
+async def _send_batch_to_sqs(payload: list[dict[str, Any]], queue_name: str | None = None) -> None:
+    """Send messages to SQS with concurrent SendMessageBatch calls.
+
+    Args:
+        payload (list[dict[str, Any]]): Messages to send.
+        queue_name (Optional[str]): Optional override for SQS queue URL.
+
+    Raises:
+        SQSMessageSendError: If any entry still failed after retries.
+
+    """
+    sqs_url: str = queue_name or config_shared.get_sqs_queue_url()
+    sqs_client = await _get_sqs_client()
+    results = await asyncio.gather(
+        *(
+            _send_sqs_batch_chunk(sqs_client, sqs_url, entries)
+            for entries in sqs_batching.build_send_batches(payload)
+        )
+    )
+    failed = sum(results)
+
+    safe_info(
+        "Published batch to SQS",
+        {"queue_url": sqs_url, "messages": len(payload), "failed": failed},
+    )
+    if failed:
+        raise SQSMessageSendError(f"{failed} of {len(payload)} SQS message(s) failed to send")
+
+
+async def _send_sqs_batch_chunk(
+    sqs_client: Any, sqs_url: str, entries: list[dict[str, Any]]
+) -> int:
+    """Send one SendMessageBatch chunk, retrying only the entries that failed.
+
+    Args:
+        sqs_client (Any): aiobotocore SQS client.
+        sqs_url (str): Target queue URL.
+        entries (list[dict[str, Any]]): Batch entries to send.
+
+    Returns:
+        int: Number of entries that could not be delivered.
+
+    """
+    pending = entries
+    failed = 0
+
+    for attempt in range(1, sqs_batching.SQS_BATCH_MAX_ATTEMPTS + 1):
+        start: float = time.perf_counter()
+        try:
+            response = await sqs_client.send_message_batch(QueueUrl=sqs_url, Entries=pending)
+        except sqs_batching.SQS_CALL_ERRORS as e:
+            lost = sqs_batching.record_send_error(e, pending, attempt, time.perf_counter() - start)
+            if lost:
+                return failed + lost
+            await asyncio.sleep(min(2**attempt, 10))
+            continue
+
+        rejected, pending = sqs_batching.handle_send_response(
+            response, pending, attempt, time.perf_counter() - start
+        )
+        failed += rejected
+        if not pending:
+            return failed
+        await asyncio.sleep(min(2**attempt, 10))
+
+    return failed
@@ -8,7 +8,7 @@ from functools import lru_cache
 
 from app.utils.config_utils import get_config_bool
 from app.utils.types import OutputMode
-from app.utils.vault_client import get_config_value_cached
+from app.utils.vault_client import get_config_value_cached, get_secret_store
 
 
 @lru_cache
@@ -63,6 +63,58 @@ def get_batch_size() -> int:
     return int(get_config_value_cached("BATCH_SIZE", "10"))
 
 
+@lru_cache
+def get_batch_max_wait() -> float:
+    """Retrieve the maximum time to wait for a batch to fill before processing it.
+
+    Returns:
+        float: Seconds to wait after the first message of a batch arrives.
+
+    Defaults to 1.0 if not set.
+
+    """
+    return float(get_config_value_cached("BATCH_MAX_WAIT_SECONDS", "1.0"))
+
+
+@lru_cache
+def get_worker_count() -> int:
+    """Retrieve the number of workers that run the message callback concurrently.
+
+    Returns:
+        int: Worker count (0 = process batches on the consumer thread).
+
+    Defaults to 0 if not set.
+
+    """
+    return int(get_config_value_cached("WORKER_COUNT", "0"))
+
+
+@lru_cache
+def get_worker_mode() -> str:
+    """Retrieve the worker pool type used when WORKER_COUNT is greater than 0.
+
+    Returns:
+        str: 'thread' or 'process'.
+
+    Defaults to 'thread' if not set.
+
+    """
+    return get_config_value_cached("WORKER_MODE", "thread").lower()
+
+
+@lru_cache
+def get_max_inflight_batches() -> int:
+    """Retrieve the maximum number of batches being processed at once.
+
+    Returns:
+        int: In-flight batch limit used for consumer backpressure.
+
+    Defaults to the worker count (minimum 1) if not set.
+
+    """
+    return int(get_config_value_cached("MAX_INFLIGHT_BATCHES", str(max(get_worker_count(), 1))))
+
+
 @lru_cache
 def get_rate_limit() -> int:
     """Retrieve the rate limit in requests per second.
@@ -76,6 +128,90 @@ def get_rate_limit() -> int:
     return int(get_config_value_cached("RATE_LIMIT", "0"))
 
 
+@lru_cache
+def get_rate_limit_backend() -> str:
+    """Retrieve where rate limiter token buckets are stored.
+
+    Returns:
+        str: 'local' (per process), 'memory' (shared in-process store), or
+        'redis' (shared by all replicas).
+
+    Defaults to 'local' if not set.
+
+    """
+    return get_config_value_cached("RATE_LIMIT_BACKEND", "local").lower()
+
+
+@lru_cache
+def get_rate_limit_redis_url() -> str:
+    """Retrieve the Redis URL used when RATE_LIMIT_BACKEND is 'redis'.
+
+    Returns:
+        str: Redis connection URL.
+
+    Defaults to 'redis://localhost:6379/0' if not set.
+
+    """
+    return get_config_value_cached("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+
+
+@lru_cache
+def get_rate_limit_redis_timeout() -> float:
+    """Retrieve the Redis connect/socket timeout for the rate limit backend.
+
+    Returns:
+        float: Timeout in seconds.
+
+    Defaults to 0.5 if not set.
+
+    """
+    return float(get_config_value_cached("RATE_LIMIT_REDIS_TIMEOUT", "0.5"))
+
+
+@lru_cache
+def get_rate_limit_backend_retry_seconds() -> float:
+    """Retrieve how long rate limiters use their local bucket after a backend failure.
+
+    Returns:
+        float: Seconds before the shared backend is tried again.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("RATE_LIMIT_BACKEND_RETRY_SECONDS", "30"))
+
+
+@lru_cache
+def get_rate_limit_adaptive() -> bool:
+    """Retrieve whether provider rate limiters adapt to throttling feedback.
+
+    Returns:
+        bool: True if RATE_LIMIT_ADAPTIVE is enabled, else False.
+
+    Defaults to False if not set.
+
+    """
+    return get_config_bool("RATE_LIMIT_ADAPTIVE", False)
+
+
+@lru_cache
+def get_rate_limit_burst(provider: str) -> int:
+    """Retrieve the burst capacity for a provider's rate limiter.
+
+    Reads `<PROVIDER>_RATE_LIMIT_BURST` (e.g., POLYGON_RATE_LIMIT_BURST).
+
+    Args:
+        provider (str): Provider name as used by the rate limiter registry.
+
+    Returns:
+        int: Maximum tokens the bucket can hold (0 = same as the refill limit).
+
+    Defaults to 0 if not set.
+
+    """
+    return int(get_config_value_cached(f"{provider.upper()}_RATE_LIMIT_BURST", "0"))
+
+
 @lru_cache
 def get_output_mode() -> OutputMode:
     """Retrieve the configured output mode (e.g., 'queue', 'db', 's3').
@@ -111,6 +247,64 @@ def get_queue_type() -> str:
     return get_config_value_cached("QUEUE_TYPE", "rabbitmq")
 
 
+@lru_cache
+def get_queue_backend() -> str:
+    """Retrieve the I/O backend used for queue consumers and publishers.
+
+    Returns:
+        str: 'blocking' (pika/boto3) or 'asyncio' (aio-pika/aiobotocore).
+
+    Defaults to 'blocking' if not set.
+
+    """
+    return get_config_value_cached("QUEUE_BACKEND", "blocking").lower()
+
+
+@lru_cache
+def get_queue_wire_format() -> str:
+    """Retrieve the wire format used to encode published queue messages.
+
+    Consumers always decode by each message's content type, so this only
+    affects publishing.
+
+    Returns:
+        str: 'json' or 'msgpack'.
+
+    Defaults to 'json' if not set.
+
+    """
+    return get_config_value_cached("QUEUE_WIRE_FORMAT", "json").lower()
+
+
+@lru_cache
+def get_queue_compression() -> str:
+    """Retrieve the compression algorithm for large published queue messages.
+
+    Consumers decompress by each message's content encoding, so enable this
+    only after every consumer of the queue supports it.
+
+    Returns:
+        str: 'none', 'gzip', or 'zstd'.
+
+    Defaults to 'none' if not set.
+
+    """
+    return get_config_value_cached("QUEUE_COMPRESSION", "none").lower()
+
+
+@lru_cache
+def get_queue_compression_min_bytes() -> int:
+    """Retrieve the encoded size at which published queue messages are compressed.
+
+    Returns:
+        int: Minimum body size in bytes.
+
+    Defaults to 1024 if not set.
+
+    """
+    return int(get_config_value_cached("QUEUE_COMPRESSION_MIN_BYTES", "1024"))
+
+
 @lru_cache
 def get_rabbitmq_host() -> str:
     """Retrieve the hostname of the RabbitMQ broker.
@@ -206,6 +400,45 @@ def get_rabbitmq_routing_key() -> str:
     return get_config_value_cached("RABBITMQ_ROUTING_KEY", "stock_data")
 
 
+@lru_cache
+def get_rabbitmq_publisher_confirms() -> bool:
+    """Retrieve whether RabbitMQ publishers wait for broker confirms.
+
+    Returns:
+        bool: True if RABBITMQ_PUBLISHER_CONFIRMS is enabled, else False.
+
+    Defaults to True if not set.
+
+    """
+    return get_config_bool("RABBITMQ_PUBLISHER_CONFIRMS", True)
+
+
+@lru_cache
+def get_rabbitmq_confirm_timeout() -> float:
+    """Retrieve how long a publisher waits for outstanding broker confirms.
+
+    Returns:
+        float: Seconds to wait before unconfirmed messages are published again.
+
+    Defaults to 30.0 if not set.
+
+    """
+    return float(get_config_value_cached("RABBITMQ_CONFIRM_TIMEOUT", "30"))
+
+
+@lru_cache
+def get_rabbitmq_max_unconfirmed() -> int:
+    """Retrieve how many published messages may await a broker confirm at once.
+
+    Returns:
+        int: Maximum unconfirmed messages in flight per publisher.
+
+    Defaults to 1000 if not set.
+
+    """
+    return int(get_config_value_cached("RABBITMQ_MAX_UNCONFIRMED", "1000"))
+
+
 @lru_cache
 def get_rabbitmq_queue() -> str:
     """Retrieve the name of the RabbitMQ queue to consume from.
@@ -258,6 +491,19 @@ def get_sqs_region() -> str:
     return get_config_value_cached("SQS_REGION", "us-east-1")
 
 
+@lru_cache
+def get_sqs_async_ack() -> bool:
+    """Retrieve whether SQS deletes are handed off to a background ack thread.
+
+    Returns:
+        bool: True if SQS_ASYNC_ACK is enabled, else False.
+
+    Defaults to False if not set.
+
+    """
+    return get_config_bool("SQS_ASYNC_ACK", False)
+
+
 @lru_cache
 def get_log_level() -> str:
     """Retrieve the application log level.
@@ -1607,6 +1853,112 @@ def get_s3_output_prefix() -> str:
     return get_config_value_cached("S3_OUTPUT_KEY_PREFIX", "output/")
 
 
+@lru_cache
+def get_s3_output_format() -> str:
+    """Retrieve the object format written by the S3 output sink.
+
+    Returns:
+        str: One of 'json', 'ndjson', 'ndjson.gz', 'ndjson.zst', or 'parquet'.
+
+    Defaults to 'json' if not set.
+
+    """
+    return get_config_value_cached("S3_OUTPUT_FORMAT", "json").lower()
+
+
+@lru_cache
+def get_s3_multipart_part_size() -> int:
+    """Retrieve the part size used for S3 multipart uploads.
+
+    Objects larger than one part are uploaded in parts of this size (minimum 5 MiB).
+
+    Returns:
+        int: Part size in bytes.
+
+    Defaults to 8388608 (8 MiB) if not set.
+
+    """
+    return int(get_config_value_cached("S3_MULTIPART_PART_SIZE", "8388608"))
+
+
+@lru_cache
+def get_s3_multipart_concurrency() -> int:
+    """Retrieve how many S3 multipart parts are uploaded concurrently.
+
+    Returns:
+        int: Maximum concurrent part uploads per object.
+
+    Defaults to 4 if not set.
+
+    """
+    return int(get_config_value_cached("S3_MULTIPART_CONCURRENCY", "4"))
+
+
+@lru_cache
+def get_s3_buffered_output() -> bool:
+    """Retrieve whether the S3 sink buffers records into larger objects.
+
+    Returns:
+        bool: True if S3_BUFFERED_OUTPUT is enabled, else False.
+
+    Defaults to False if not set.
+
+    """
+    return get_config_bool("S3_BUFFERED_OUTPUT", False)
+
+
+@lru_cache
+def get_s3_buffer_max_bytes() -> int:
+    """Retrieve the buffered S3 sink's size threshold.
+
+    Returns:
+        int: Encoded bytes buffered before an object is written.
+
+    Defaults to 8388608 (8 MiB) if not set.
+
+    """
+    return int(get_config_value_cached("S3_BUFFER_MAX_BYTES", "8388608"))
+
+
+@lru_cache
+def get_s3_buffer_max_records() -> int:
+    """Retrieve the buffered S3 sink's record-count threshold.
+
+    Returns:
+        int: Records buffered before an object is written.
+
+    Defaults to 10000 if not set.
+
+    """
+    return int(get_config_value_cached("S3_BUFFER_MAX_RECORDS", "10000"))
+
+
+@lru_cache
+def get_s3_buffer_max_age() -> float:
+    """Retrieve the buffered S3 sink's age threshold.
+
+    Returns:
+        float: Seconds after the first buffered record before an object is written.
+
+    Defaults to 60 if not set.
+
+    """
+    return float(get_config_value_cached("S3_BUFFER_MAX_AGE_SECONDS", "60"))
+
+
+@lru_cache
+def get_s3_buffer_max_failed_bytes() -> int:
+    """Retrieve how many bytes of failed S3 objects are kept for retry.
+
+    Returns:
+        int: Bytes retained; the oldest failed objects are dropped beyond this.
+
+    Defaults to 67108864 (64 MiB) if not set.
+
+    """
+    return int(get_config_value_cached("S3_BUFFER_MAX_FAILED_BYTES", "67108864"))
+
+
 @lru_cache
 def get_database_connection_url() -> str:
     """Retrieve the database connection URL for output.
@@ -1646,6 +1998,101 @@ def get_database_insert_sql() -> str:
     return get_config_value_cached("DATABASE_INSERT_SQL", "")
 
 
+@lru_cache
+def get_database_write_mode() -> str:
+    """Retrieve how the database sink writes batches: 'auto', 'copy', or 'insert'.
+
+    'auto' uses PostgreSQL COPY when the output database is PostgreSQL and
+    DATABASE_COPY_TABLE is set, and batched inserts otherwise.
+
+    Returns:
+        str: Database write mode.
+
+    Defaults to 'auto' if not set.
+
+    """
+    return get_config_value_cached("DATABASE_WRITE_MODE", "auto").lower()
+
+
+@lru_cache
+def get_database_copy_table() -> str:
+    """Retrieve the target table for COPY-based database output.
+
+    Returns:
+        str: Table name, optionally schema-qualified (e.g. 'analytics.signals').
+
+    Defaults to empty string if not set.
+
+    """
+    return get_config_value_cached("DATABASE_COPY_TABLE", "")
+
+
+@lru_cache
+def get_database_copy_columns() -> list[str]:
+    """Retrieve the columns written by COPY-based database output.
+
+    Returns:
+        List[str]: Column names parsed from comma-separated config.
+
+    Defaults to empty list if not set, meaning the union of the batch's keys.
+
+    """
+    columns = get_config_value_cached("DATABASE_COPY_COLUMNS", "")
+    return [c.strip() for c in columns.split(",") if c.strip()]
+
+
+@lru_cache
+def get_database_pool_size() -> int:
+    """Retrieve the number of pooled connections kept open by the database sink.
+
+    Returns:
+        int: Connection pool size.
+
+    Defaults to 5 if not set.
+
+    """
+    return int(get_config_value_cached("DATABASE_POOL_SIZE", "5"))
+
+
+@lru_cache
+def get_database_max_overflow() -> int:
+    """Retrieve how many connections may be opened beyond the pool size.
+
+    Returns:
+        int: Maximum pool overflow.
+
+    Defaults to 10 if not set.
+
+    """
+    return int(get_config_value_cached("DATABASE_MAX_OVERFLOW", "10"))
+
+
+@lru_cache
+def get_database_pool_timeout() -> float:
+    """Retrieve how long to wait for a pooled database connection.
+
+    Returns:
+        float: Pool checkout timeout in seconds.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("DATABASE_POOL_TIMEOUT", "30"))
+
+
+@lru_cache
+def get_database_pool_recycle() -> int:
+    """Retrieve the maximum age of a pooled database connection.
+
+    Returns:
+        int: Seconds after which connections are recycled (-1 disables).
+
+    Defaults to 1800 if not set.
+
+    """
+    return int(get_config_value_cached("DATABASE_POOL_RECYCLE", "1800"))
+
+
 @lru_cache
 def get_output_modes() -> list[str]:
     """Retrieve a list of enabled output modes.
@@ -1660,6 +2107,118 @@ def get_output_modes() -> list[str]:
     return [m.strip().lower() for m in modes.split(",") if m.strip()]
 
 
+@lru_cache
+def get_output_parallel() -> bool:
+    """Retrieve whether output is dispatched to all configured sinks concurrently.
+
+    Returns:
+        bool: True if OUTPUT_PARALLEL is enabled, else False.
+
+    Defaults to False if not set.
+
+    """
+    return get_config_bool("OUTPUT_PARALLEL", False)
+
+
+@lru_cache
+def get_output_sink_timeout() -> float:
+    """Retrieve how long a parallel dispatch waits for each sink to finish.
+
+    Returns:
+        float: Timeout in seconds.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("OUTPUT_SINK_TIMEOUT", "30"))
+
+
+@lru_cache
+def get_output_sink_timeout_override(mode: str) -> float:
+    """Retrieve a per-sink override of OUTPUT_SINK_TIMEOUT.
+
+    Reads `OUTPUT_SINK_TIMEOUT_<MODE>` (e.g., OUTPUT_SINK_TIMEOUT_REST).
+
+    Args:
+        mode (str): Output mode name.
+
+    Returns:
+        float: Timeout in seconds (0 = use OUTPUT_SINK_TIMEOUT).
+
+    Defaults to 0 if not set.
+
+    """
+    return float(get_config_value_cached(f"OUTPUT_SINK_TIMEOUT_{mode.upper()}", "0"))
+
+
+@lru_cache
+def get_rest_pool_size() -> int:
+    """Retrieve the number of keep-alive connections pooled by the REST sink.
+
+    Returns:
+        int: Maximum pooled connections per host.
+
+    Defaults to 10 if not set.
+
+    """
+    return int(get_config_value_cached("REST_POOL_SIZE", "10"))
+
+
+@lru_cache
+def get_rest_gzip() -> bool:
+    """Retrieve whether REST output request bodies are gzip-compressed.
+
+    Returns:
+        bool: True if REST_GZIP is enabled, else False.
+
+    Defaults to False if not set.
+
+    """
+    return get_config_bool("REST_GZIP", False)
+
+
+@lru_cache
+def get_rest_chunk_size() -> int:
+    """Retrieve how many records the REST sink sends per request.
+
+    Returns:
+        int: Records per chunk; 0 sends each batch as a single request.
+
+    Defaults to 0 if not set.
+
+    """
+    return int(get_config_value_cached("REST_CHUNK_SIZE", "0"))
+
+
+@lru_cache
+def get_rest_max_concurrency() -> int:
+    """Retrieve how many REST chunks are posted concurrently.
+
+    Returns:
+        int: Maximum concurrent REST requests per batch.
+
+    Defaults to 4 if not set.
+
+    """
+    return int(get_config_value_cached("REST_MAX_CONCURRENCY", "4"))
+
+
+@lru_cache
+def get_rest_max_retries() -> int:
+    """Retrieve how many times a failed REST chunk is retried.
+
+    Only throttled (429), timed-out, and 5xx responses or connection errors
+    are retried.
+
+    Returns:
+        int: Maximum retries per chunk.
+
+    Defaults to 3 if not set.
+
+    """
+    return int(get_config_value_cached("REST_MAX_RETRIES", "3"))
+
+
 @lru_cache
 def get_rest_output_url() -> str:
     """Retrieve the REST endpoint URL for output dispatch.
@@ -1672,3 +2231,18 @@ def get_rest_output_url() -> str:
 
     """
     return get_config_value_cached("REST_OUTPUT_URL")
+
+
+def clear_config_cache() -> None:
+    """Clear every cached config getter so the next call re-reads its value.
+
+    Registered with the Vault secret store so rotated secrets reach the
+    getters after a background refresh.
+    """
+    for value in list(globals().values()):
+        cache_clear = getattr(value, "cache_clear", None)
+        if callable(cache_clear):
+            cache_clear()
+
+
+get_secret_store().add_listener(clear_config_cache)
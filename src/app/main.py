@@ -4,11 +4,13 @@ Initializes logging, sets up metrics, validates configuration, and
 starts consuming messages using the configured output handler.
 """
 
+import asyncio
 import os
 import sys
 import traceback
 
 from app import config_shared
+from app.async_queue_handler import consume_messages as consume_messages_async
 from app.output_handler import output_handler
 from app.queue_handler import consume_messages
 from app.utils.metrics_server import start_metrics_server
@@ -77,7 +79,10 @@ def main() -> None:
     logger.info(
         "✅ Ready. Listening for messages on queue type: %s", config_shared.get_queue_type()
     )
-    consume_messages(output_handler.send)
+    if config_shared.get_queue_backend() == "asyncio":
+        asyncio.run(consume_messages_async(output_handler.send))
+    else:
+        consume_messages(output_handler.send)
 
 
 if __name__ == "__main__":
@@ -1,37 +1,251 @@
 """Module to handle output of analysis results to the configured target.
 
 Supports logging, stdout, queue publishing, REST, S3, and database sinks.
-Includes retry logic, validation, and optional metrics integration.
+Includes retry logic, validation, and optional metrics integration. With
+OUTPUT_PARALLEL enabled, a batch is sent to all sinks concurrently.
 """
 
-import json
+import csv
+import gzip
+import io
+import threading
 import time
 import uuid
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
 from typing import Any
 
+import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app import config_shared
+from app.queue_handler import register_shutdown_hook
+from app.async_queue_sender import publish_from_thread
 from app.queue_sender import publish_to_queue
+from app.utils import serialization
+from app.utils.http_session import RETRYABLE_STATUS_CODES, create_session, parse_retry_after
 from app.utils.metrics import (
+    record_db_pool_checkout,
+    record_db_write_metrics,
+    record_output_batch_metrics,
     record_output_metrics,
     record_paper_trade_metrics,
     record_sink_metrics,
 )
 from app.utils.redactor import redact_dict
+from app.utils.s3_encoders import get_encoder
+from app.utils.s3_writer import BufferedS3Writer, StreamingS3Upload
 from app.utils.setup_logger import setup_logger
 from app.utils.types import OutputMode, validate_list_of_dicts
 
 logger = setup_logger(__name__)
 
 
+# REST bodies smaller than this are sent uncompressed even with REST_GZIP.
+REST_GZIP_MIN_BYTES = 1024
+
+# Upper bound on a single REST retry wait, including server-provided Retry-After.
+REST_MAX_RETRY_DELAY = 60
+
+# Records encoded per slice when streaming a batch to S3.
+S3_ENCODE_CHUNK_RECORDS = 1000
+
+COPY_NULL = "\\N"
+
+
+class OutputSinkError(Exception):
+    """Raised by a sink that could not deliver its batch."""
+
+    pass
+
+
+_database_engines: dict[str, Any] = {}
+_database_engines_lock = threading.Lock()
+
+
+def _get_database_engine(url: str) -> Any:
+    """Return a pooled SQLAlchemy engine for the output database, created once per URL.
+
+    Args:
+        url (str): SQLAlchemy database URL.
+
+    Returns:
+        sqlalchemy.engine.Engine: Shared engine with a tuned connection pool.
+
+    """
+    import sqlalchemy
+
+    with _database_engines_lock:
+        engine = _database_engines.get(url)
+        if engine is None:
+            options: dict[str, Any] = {"pool_pre_ping": True}
+            if sqlalchemy.engine.make_url(url).get_backend_name() != "sqlite":
+                options.update(
+                    pool_size=config_shared.get_database_pool_size(),
+                    max_overflow=config_shared.get_database_max_overflow(),
+                    pool_timeout=config_shared.get_database_pool_timeout(),
+                    pool_recycle=config_shared.get_database_pool_recycle(),
+                )
+            engine = sqlalchemy.create_engine(url, **options)
+            _database_engines[url] = engine
+        return engine
+
+
+def _select_database_write_method(engine: Any) -> str:
+    """Choose between COPY and batched inserts for the database sink.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Output database engine.
+
+    Returns:
+        str: "copy" or "insert".
+
+    """
+    mode = config_shared.get_database_write_mode()
+    if mode == "insert":
+        return "insert"
+
+    copy_supported = engine.dialect.name == "postgresql" and bool(
+        config_shared.get_database_copy_table()
+    )
+    if copy_supported:
+        return "copy"
+    if mode == "copy":
+        logger.warning(
+            "⚠️ DATABASE_WRITE_MODE=copy requires PostgreSQL and DATABASE_COPY_TABLE; "
+            "using batched inserts."
+        )
+    return "insert"
+
+
+def _copy_value(value: Any) -> Any:
+    """Convert a record value to its PostgreSQL CSV COPY representation.
+
+    Args:
+        value (Any): Record value.
+
+    Returns:
+        Any: Value ready for csv.writer; None becomes the NULL marker.
+
+    """
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return serialization.dumps_str(value)
+    return value
+
+
+def _copy_rows(
+    conn: Any, table: str, rows: list[dict[str, Any]], columns: list[str] | None = None
+) -> int:
+    """Stream rows into a PostgreSQL table with COPY FROM STDIN (CSV).
+
+    Without explicit columns, the union of all rows' keys is written, in
+    first-seen order. With explicit columns (DATABASE_COPY_COLUMNS), rows
+    carrying other keys are rejected and logged rather than silently
+    truncated. Keys missing from a row are written as NULL. Works with
+    psycopg2 (copy_expert) and psycopg 3 (copy).
+
+    Args:
+        conn (sqlalchemy.engine.Connection): Connection inside an open transaction.
+        table (str): Target table, optionally schema-qualified.
+        rows (list[dict[str, Any]]): Records to load.
+        columns (Optional[list[str]]): Columns to write; None uses the rows' keys.
+
+    Returns:
+        int: Number of rows written.
+
+    """
+    if columns:
+        allowed = set(columns)
+        accepted = [row for row in rows if allowed.issuperset(row)]
+        if len(accepted) < len(rows):
+            unknown = sorted({key for row in rows for key in row} - allowed)
+            logger.warning(
+                "⚠️ Rejected %d record(s) with columns not in DATABASE_COPY_COLUMNS: %s",
+                len(rows) - len(accepted),
+                ", ".join(unknown),
+            )
+        rows = accepted
+        if not rows:
+            return 0
+    else:
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+
+    quote = conn.dialect.identifier_preparer.quote
+    sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '{}')".format(
+        ".".join(quote(part) for part in table.split(".")),
+        ", ".join(quote(column) for column in columns),
+        COPY_NULL,
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row.get(column)) for column in columns])
+    buffer.seek(0)
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(sql, buffer)
+        else:
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+    return len(rows)
+
+
+def _publish_to_queue(
+    payload: list[dict[str, Any]],
+    queue: str | None = None,
+    exchange: str | None = None,
+) -> None:
+    """Publish through the publisher of the configured QUEUE_BACKEND.
+
+    With QUEUE_BACKEND=asyncio the publish runs on the consumer's event loop,
+    reusing its aio-pika connection and aiobotocore client.
+
+    Args:
+        payload (list[dict[str, Any]]): Messages to publish.
+        queue (Optional[str]): Optional override for queue name or routing key.
+        exchange (Optional[str]): Optional override for RabbitMQ exchange.
+
+    """
+    if config_shared.get_queue_backend() == "asyncio":
+        publish_from_thread(payload, queue=queue, exchange=exchange)
+    else:
+        publish_to_queue(payload, queue=queue, exchange=exchange)
+
+
+def dispose_database_engines() -> None:
+    """Close pooled database connections and drop the cached engines."""
+    with _database_engines_lock:
+        engines = list(_database_engines.values())
+        _database_engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
 class OutputDispatcher:
     """Handles routing analysis output to different destinations (e.g., queue, REST, S3, DB)."""
 
     def __init__(self) -> None:
         """Initialize dispatcher with configured output modes."""
         self.output_modes = config_shared.get_output_modes()
+        self.parallel = config_shared.get_output_parallel()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._s3_client: Any = None
+        self._s3_writer: BufferedS3Writer | None = None
+        self._s3_lock = threading.Lock()
+        self._rest_session: requests.Session | None = None
+        self._rest_lock = threading.Lock()
 
     def send(self, data: list[dict[str, Any]]) -> None:
         """Dispatch processed analysis output to one or more configured destinations.
@@ -47,8 +261,8 @@ class OutputDispatcher:
                 paper_mode = config_shared.get_paper_trade_mode()
                 logger.debug("📄 Paper trading enabled — dispatching to %s mode", paper_mode)
                 try:
-                    dispatch_method = self._get_dispatch_method(OutputMode[paper_mode])
-                except KeyError:
+                    dispatch_method = self._get_dispatch_method(OutputMode(paper_mode))
+                except ValueError:
                     logger.warning("⚠️ Invalid paper trading output mode: %s", paper_mode)
                     return
                 if dispatch_method:
@@ -57,20 +271,111 @@ class OutputDispatcher:
                     logger.warning("⚠️ Invalid paper trading output mode: %s", paper_mode)
                 return
 
+            sinks: list[tuple[str, Callable[[list[dict[str, Any]]], None]]] = []
             for mode in self.output_modes:
                 try:
-                    dispatch_method = self._get_dispatch_method(OutputMode[mode])
-                except KeyError:
+                    dispatch_method = self._get_dispatch_method(OutputMode(mode))
+                except ValueError:
                     logger.warning("⚠️ Invalid output mode: %s", mode)
                     continue
                 if dispatch_method:
-                    dispatch_method(data)
+                    sinks.append((mode, dispatch_method))
                 else:
                     logger.warning("⚠️ Unhandled output mode: %s", mode)
 
+            start = time.perf_counter()
+            if self.parallel and len(sinks) > 1:
+                self._send_parallel(sinks, data)
+                record_output_batch_metrics("parallel", time.perf_counter() - start)
+            else:
+                for mode, dispatch_method in sinks:
+                    success, duration = self._run_sink(mode, dispatch_method, data)
+                    record_output_metrics(mode, success=success, duration_sec=duration)
+                record_output_batch_metrics("sequential", time.perf_counter() - start)
+
         except Exception as e:
             logger.error("❌ Failed to send output: %s", e)
 
+    def close(self) -> None:
+        """Release the dispatch thread pool and HTTP session, and flush buffered S3 output."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._s3_writer is not None:
+            self._s3_writer.close()
+            self._s3_writer = None
+        if self._rest_session is not None:
+            self._rest_session.close()
+            self._rest_session = None
+
+    def _send_parallel(
+        self,
+        sinks: list[tuple[str, Callable[[list[dict[str, Any]]], None]]],
+        data: list[dict[str, Any]],
+    ) -> None:
+        """Dispatch a batch to all sinks concurrently, each bounded by its own timeout.
+
+        A sink's timeout is OUTPUT_SINK_TIMEOUT_<MODE> if set, else
+        OUTPUT_SINK_TIMEOUT. A sink that exceeds it is reported as failed once;
+        it keeps running in the background since threads cannot be cancelled,
+        and its late result is only logged.
+
+        Args:
+            sinks (list[tuple[str, Callable]]): Output mode names and dispatch methods.
+            data (list[dict[str, Any]]): List of data payloads to send.
+
+        """
+        executor = self._get_executor()
+        started = time.monotonic()
+        futures = sorted(
+            (
+                (
+                    _sink_timeout(mode),
+                    mode,
+                    executor.submit(self._run_sink, mode, dispatch_method, data),
+                )
+                for mode, dispatch_method in sinks
+            ),
+            key=lambda item: item[0],
+        )
+        for timeout, mode, future in futures:
+            try:
+                success, duration = future.result(
+                    timeout=max(started + timeout - time.monotonic(), 0)
+                )
+            except FutureTimeoutError:
+                logger.error("⏱️ Output to %s timed out after %.1fs", mode, timeout)
+                record_output_metrics(mode, success=False, duration_sec=timeout)
+                future.add_done_callback(partial(_log_late_sink, mode))
+                continue
+            record_output_metrics(mode, success=success, duration_sec=duration)
+
+    def _run_sink(
+        self,
+        mode: str,
+        dispatch_method: Callable[[list[dict[str, Any]]], None],
+        data: list[dict[str, Any]],
+    ) -> tuple[bool, float]:
+        """Run one sink, isolating its failure from the other sinks.
+
+        Args:
+            mode (str): Output mode name.
+            dispatch_method (Callable): Sink dispatch method.
+            data (list[dict[str, Any]]): List of data payloads to send.
+
+        Returns:
+            tuple[bool, float]: Whether the sink succeeded, and its duration in seconds.
+
+        """
+        start = time.perf_counter()
+        try:
+            dispatch_method(data)
+        except Exception as e:
+            logger.error("❌ Output to %s failed: %s", mode, e)
+            return False, time.perf_counter() - start
+        return True, time.perf_counter() - start
+
     def send_trade_simulation(self, data: dict[str, Any]) -> None:
         """Send simulated trade data to the appropriate paper trade destination.
 
@@ -116,7 +421,7 @@ class OutputDispatcher:
 
         """
         for item in data:
-            logger.info("📝 Processed message:\n%s", json.dumps(redact_dict(item), indent=4))
+            logger.info("📝 Processed message:\n%s", serialization.dumps_pretty(redact_dict(item)))
 
     def _output_to_stdout(self, data: list[dict[str, Any]]) -> None:
         """Print each item in the data list to standard output.
@@ -126,7 +431,7 @@ class OutputDispatcher:
 
         """
         for item in data:
-            print(json.dumps(item, indent=4))
+            print(serialization.dumps_pretty(item))
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     def _output_to_queue(self, data: list[dict[str, Any]]) -> None:
@@ -138,59 +443,203 @@ class OutputDispatcher:
             data (list[dict[str, Any]]): Data to publish.
 
         """
-        publish_to_queue(data)
+        _publish_to_queue(data)
         logger.info("✅ Output published to queue: %d message(s)", len(data))
-        record_output_metrics("queue", success=True, duration_sec=0)
 
     def _output_to_rest(self, data: list[dict[str, Any]]) -> None:
         """Send the data to the configured REST endpoint.
 
+        Uses a shared keep-alive session; with REST_GZIP enabled, bodies of
+        REST_GZIP_MIN_BYTES or more are sent gzip-compressed. With
+        REST_CHUNK_SIZE set, the batch is split into chunks that are posted
+        concurrently (up to REST_MAX_CONCURRENCY); only failed chunks are retried.
+
         Args:
             data (list[dict[str, Any]]): Data to post to REST API.
 
         """
-        import requests
+        chunk_size = config_shared.get_rest_chunk_size()
+        if chunk_size <= 0 or len(data) <= chunk_size:
+            chunks = [data]
+        else:
+            chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        if len(chunks) == 1:
+            failed = 0 if self._post_rest_chunk(chunks[0]) else len(chunks[0])
+        else:
+            workers = min(config_shared.get_rest_max_concurrency(), len(chunks))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rest-chunk") as pool:
+                results = list(pool.map(self._post_rest_chunk, chunks))
+            failed = sum(len(chunk) for chunk, ok in zip(chunks, results) if not ok)
+
+        if failed:
+            raise OutputSinkError(f"REST output failed for {failed} of {len(data)} record(s)")
+        logger.info("🚀 Sent %d record(s) to REST in %d request(s)", len(data), len(chunks))
+
+    def _post_rest_chunk(self, chunk: list[dict[str, Any]]) -> bool:
+        """Post one chunk, retrying throttled and transient failures.
+
+        Honors Retry-After on 429/503 responses and otherwise backs off
+        exponentially. Latency of every attempt is recorded via record_sink_metrics.
+
+        Args:
+            chunk (list[dict[str, Any]]): Records to post in one request.
 
+        Returns:
+            bool: True if the chunk was accepted.
+
+        """
         url = config_shared.get_rest_output_url()
         headers = {"Content-Type": "application/json"}
-        start = time.perf_counter()
-        try:
-            response = requests.post(url, json=data, headers=headers, timeout=10)
-            duration = time.perf_counter() - start
-            record_sink_metrics("rest", str(response.status_code), duration, failed=not response.ok)
-
-            if response.ok:
-                logger.info("🚀 Sent data to REST: HTTP %d", response.status_code)
+        body = serialization.dumps(chunk)
+        if config_shared.get_rest_gzip() and len(body) >= REST_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+
+        max_retries = config_shared.get_rest_max_retries()
+        for attempt in range(max_retries + 1):
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                response = self._get_rest_session().post(
+                    url, data=body, headers=headers, timeout=config_shared.get_rest_timeout()
+                )
+            except requests.RequestException as e:
+                record_sink_metrics("rest", "exception", time.perf_counter() - start, failed=True)
+                logger.warning("⚠️ REST request error (attempt %d): %s", attempt + 1, e)
             else:
-                logger.error("❌ REST output failed: HTTP %d", response.status_code)
-        except Exception as e:
-            logger.error("❌ REST output error: %s", e)
-            record_sink_metrics("rest", "exception", 0, failed=True)
+                duration = time.perf_counter() - start
+                status = response.status_code
+                record_sink_metrics("rest", str(status), duration, failed=not response.ok)
+                if response.ok:
+                    return True
+                if status not in RETRYABLE_STATUS_CODES:
+                    logger.error("❌ REST output rejected: HTTP %d", status)
+                    return False
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                logger.warning("⚠️ REST output HTTP %d (attempt %d)", status, attempt + 1)
+
+            if attempt < max_retries:
+                delay = retry_after if retry_after is not None else min(2**attempt, 30)
+                time.sleep(min(delay, REST_MAX_RETRY_DELAY))
+
+        return False
 
     def _output_to_s3(self, data: list[dict[str, Any]]) -> None:
-        """Upload the data as a JSON file to an S3 bucket.
+        """Upload the data to an S3 bucket in the configured S3_OUTPUT_FORMAT.
+
+        Records are encoded in slices and streamed to S3, switching to a
+        concurrent multipart upload once the object outgrows one part, so a
+        large batch is never materialized as a single string. With
+        S3_BUFFERED_OUTPUT enabled, records are buffered and written as
+        larger time-partitioned objects instead of one object per batch.
 
         Args:
             data (list[dict[str, Any]]): Data to upload.
 
         """
-        import boto3
+        if config_shared.get_s3_buffered_output():
+            self._get_s3_writer().write(data)
+            return
 
-        s3 = boto3.client("s3")
         bucket = config_shared.get_s3_output_bucket()
-        key = f"outputs/{uuid.uuid4()}.json"
+        encoder = get_encoder(config_shared.get_s3_output_format())
+        key = f"outputs/{uuid.uuid4()}{encoder.extension}"
+        upload = StreamingS3Upload(
+            self._get_s3_client(),
+            bucket,
+            key,
+            content_type=encoder.content_type,
+            content_encoding=encoder.content_encoding,
+            part_size=config_shared.get_s3_multipart_part_size(),
+            max_concurrency=config_shared.get_s3_multipart_concurrency(),
+        )
         start = time.perf_counter()
         try:
-            s3.put_object(Bucket=bucket, Key=key, Body=json.dumps(data).encode("utf-8"))
+            for offset in range(0, len(data), S3_ENCODE_CHUNK_RECORDS):
+                upload.write(encoder.encode(data[offset : offset + S3_ENCODE_CHUNK_RECORDS]))
+            upload.write(encoder.finish())
+            upload.close()
             duration = time.perf_counter() - start
             record_sink_metrics("s3", "200", duration, failed=False)
-            logger.info("🚚 Uploaded output to S3: %s/%s", bucket, key)
+            logger.info("🚚 Uploaded output to S3: %s/%s (%d bytes)", bucket, key, upload.size)
         except Exception as e:
-            logger.error("❌ S3 upload failed: %s", e)
-            record_sink_metrics("s3", "exception", 0, failed=True)
+            upload.abort()
+            record_sink_metrics("s3", "exception", time.perf_counter() - start, failed=True)
+            raise OutputSinkError(f"S3 upload failed: {e}") from e
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the sink thread pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Pool with one worker per configured output mode.
+
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.output_modes), thread_name_prefix="output-sink"
+                )
+            return self._executor
+
+    def _get_rest_session(self) -> requests.Session:
+        """Return the shared REST session, creating it on first use.
+
+        Returns:
+            requests.Session: Keep-alive session with a REST_POOL_SIZE connection pool.
+
+        """
+        with self._rest_lock:
+            if self._rest_session is None:
+                self._rest_session = create_session("rest", config_shared.get_rest_pool_size())
+            return self._rest_session
+
+    def _get_s3_client(self) -> Any:
+        """Return the shared S3 client, creating it on first use.
+
+        Returns:
+            Any: boto3 S3 client.
+
+        """
+        with self._s3_lock:
+            if self._s3_client is None:
+                import boto3
+
+                region = config_shared.get_s3_output_region()
+                self._s3_client = boto3.client("s3", region_name=region or None)
+            return self._s3_client
+
+    def _get_s3_writer(self) -> BufferedS3Writer:
+        """Return the buffered S3 writer, creating it and its shutdown flush on first use.
+
+        Returns:
+            BufferedS3Writer: Writer configured from the S3_BUFFER_* settings.
+
+        """
+        client = self._get_s3_client()
+        with self._s3_lock:
+            if self._s3_writer is None:
+                self._s3_writer = BufferedS3Writer(
+                    bucket=config_shared.get_s3_output_bucket(),
+                    prefix=config_shared.get_s3_output_prefix(),
+                    max_bytes=config_shared.get_s3_buffer_max_bytes(),
+                    max_records=config_shared.get_s3_buffer_max_records(),
+                    max_age=config_shared.get_s3_buffer_max_age(),
+                    client=client,
+                    output_format=config_shared.get_s3_output_format(),
+                    part_size=config_shared.get_s3_multipart_part_size(),
+                    max_concurrency=config_shared.get_s3_multipart_concurrency(),
+                    max_failed_bytes=config_shared.get_s3_buffer_max_failed_bytes(),
+                )
+                register_shutdown_hook(self._s3_writer.close)
+            return self._s3_writer
 
     def _output_to_database(self, data: list[dict[str, Any]]) -> None:
-        """Write the data to the configured database using raw SQL inserts.
+        """Write the data to the configured database with one bulk operation per batch.
+
+        Uses a shared, pooled engine. PostgreSQL targets can be loaded with
+        COPY (see DATABASE_WRITE_MODE); otherwise the insert statement is
+        executed once with all rows (executemany).
 
         Args:
             data (list[dict[str, Any]]): Data records to insert.
@@ -198,21 +647,38 @@ class OutputDispatcher:
         """
         import sqlalchemy
 
-        engine = sqlalchemy.create_engine(config_shared.get_database_output_url())
+        rows = []
+        for item in data:
+            if not isinstance(item, dict):
+                logger.warning("⚠️ Invalid item in database batch: %s", item)
+                continue
+            rows.append(item)
+        if not rows:
+            return
+
+        engine = _get_database_engine(config_shared.get_database_output_url())
+        method = _select_database_write_method(engine)
         start = time.perf_counter()
         try:
             with engine.begin() as conn:
-                for item in data:
-                    if not isinstance(item, dict):
-                        logger.warning("⚠️ Invalid item in database batch: %s", item)
-                        continue
-                    conn.execute(sqlalchemy.text(config_shared.get_database_insert_sql()), **item)
+                record_db_pool_checkout(time.perf_counter() - start)
+                if method == "copy":
+                    written = _copy_rows(
+                        conn,
+                        config_shared.get_database_copy_table(),
+                        rows,
+                        config_shared.get_database_copy_columns(),
+                    )
+                else:
+                    written = len(rows)
+                    conn.execute(sqlalchemy.text(config_shared.get_database_insert_sql()), rows)
             duration = time.perf_counter() - start
             record_sink_metrics("db", "success", duration, failed=False)
-            logger.info("📊 Wrote %d records to database", len(data))
+            record_db_write_metrics(method, written, duration)
+            logger.info("📊 Wrote %d records to database (%s)", written, method)
         except Exception as e:
-            logger.error("❌ Database output failed: %s", e)
-            record_sink_metrics("db", "exception", 0, failed=True)
+            record_sink_metrics("db", "exception", time.perf_counter() - start, failed=True)
+            raise OutputSinkError(f"Database output failed: {e}") from e
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     def _output_paper_trade_to_queue(self, data: dict[str, Any]) -> None:
@@ -224,8 +690,10 @@ class OutputDispatcher:
         """
         queue_name = config_shared.get_paper_trading_queue_name()
         exchange = config_shared.get_paper_trading_exchange()
-        publish_to_queue([data], queue=queue_name, exchange=exchange)
-        logger.info("🪙 Paper trade sent to queue:\n%s", json.dumps(redact_dict(data), indent=4))
+        _publish_to_queue([data], queue=queue_name, exchange=exchange)
+        logger.info(
+            "🪙 Paper trade sent to queue:\n%s", serialization.dumps_pretty(redact_dict(data))
+        )
         record_paper_trade_metrics("queue", success=True, duration_sec=0)
 
     def _output_paper_trade_to_database(self, data: dict[str, Any]) -> None:
@@ -239,6 +707,39 @@ class OutputDispatcher:
         logger.info("📊 Skipped paper trade (DB output not implemented).")
 
 
+def _sink_timeout(mode: str) -> float:
+    """Return how long a parallel dispatch waits for one sink.
+
+    Args:
+        mode (str): Output mode name.
+
+    Returns:
+        float: OUTPUT_SINK_TIMEOUT_<MODE> if set, else OUTPUT_SINK_TIMEOUT.
+
+    """
+    return (
+        config_shared.get_output_sink_timeout_override(mode)
+        or config_shared.get_output_sink_timeout()
+    )
+
+
+def _log_late_sink(mode: str, future: Future[tuple[bool, float]]) -> None:
+    """Log the outcome of a sink that finished after its timeout was reported.
+
+    Args:
+        mode (str): Output mode name.
+        future (Future): The sink's completed future.
+
+    """
+    success, duration = future.result()
+    logger.warning(
+        "⚠️ Output to %s finished after its timeout (%s, %.1fs)",
+        mode,
+        "succeeded" if success else "failed",
+        duration,
+    )
+
+
 output_handler = OutputDispatcher()
 
 
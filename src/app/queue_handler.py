@@ -2,26 +2,47 @@
 
 This module supports consuming messages from either RabbitMQ or Amazon SQS.
 It provides batching, retry logic, graceful shutdown handling, and clean logging
-with optional redaction of sensitive values.
+with optional redaction of sensitive values. RabbitMQ deliveries are grouped
+into batches of up to BATCH_SIZE messages and acknowledged together; processed
+SQS messages are deleted with DeleteMessageBatch, optionally from a background
+ack thread. With WORKER_COUNT > 0, batches run on a thread or process pool
+while the listener keeps receiving, bounded by MAX_INFLIGHT_BATCHES.
+Callables registered with register_shutdown_hook run when the consumer stops.
+Each message is decoded according to its content type (JSON or MessagePack)
+and content encoding (gzip or zstd compression).
 """
 
-import json
+import multiprocessing.util
+import queue
 import signal
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any
 
 import boto3
 import pika
-from botocore.exceptions import BotoCoreError, NoCredentialsError
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from pika.adapters.blocking_connection import BlockingChannel
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 import app.config_shared as config
+from app.utils import healthcheck, message_codec, sqs_batching
+from app.utils.metrics import record_ack_metrics, set_inflight_batches
 from app.utils.setup_logger import setup_logger
 
 logger = setup_logger(__name__)
 shutdown_event = threading.Event()
+_shutdown_hooks: list[Callable[[], None]] = []
 
 REDACT_SENSITIVE_LOGS = (
     config.get_config_value_cached("REDACT_SENSITIVE_LOGS", "true").lower() == "true"
@@ -59,12 +80,80 @@ def consume_messages(callback: Callable[[list[dict]], None]) -> None:
 
     queue_type = config.get_queue_type().lower()
     if queue_type == "rabbitmq":
-        _start_rabbitmq_listener(callback)
+        listener = _start_rabbitmq_listener
     elif queue_type == "sqs":
-        _start_sqs_listener(callback)
+        listener = _start_sqs_listener
     else:
         raise ValueError("Unsupported QUEUE_TYPE: [REDACTED]")
 
+    executor = _create_executor()
+    try:
+        listener(callback, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        run_shutdown_hooks()
+
+
+def register_shutdown_hook(hook: Callable[[], None]) -> None:
+    """Register a callable to run once the consumer has stopped.
+
+    Hooks run after in-flight batches have finished, e.g. to flush buffered
+    output. In WORKER_MODE=process, hooks registered inside a worker run when
+    that worker exits.
+
+    Args:
+        hook (Callable[[], None]): Callback with no arguments.
+
+    """
+    if hook not in _shutdown_hooks:
+        _shutdown_hooks.append(hook)
+
+
+def run_shutdown_hooks() -> None:
+    """Run registered shutdown hooks, logging (not raising) their failures."""
+    for hook in list(_shutdown_hooks):
+        try:
+            hook()
+        except Exception as e:
+            logger.error("❌ Shutdown hook failed: %s", e)
+
+
+def _create_executor() -> Executor | None:
+    """Create the worker pool configured by WORKER_COUNT and WORKER_MODE.
+
+    In process mode the callback must be picklable (e.g., a module-level
+    function or a method of a module-level object).
+
+    Returns:
+        Optional[Executor]: Worker pool, or None to process on the consumer thread.
+
+    Raises:
+        ValueError: If WORKER_MODE is not 'thread' or 'process'.
+
+    """
+    workers = config.get_worker_count()
+    if workers <= 0:
+        return None
+
+    mode = config.get_worker_mode()
+    logger.info("🧵 Processing batches with %d %s worker(s)", workers, mode)
+    if mode == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="consumer-worker")
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_process)
+    raise ValueError(f"Unsupported WORKER_MODE: {mode}")
+
+
+def _init_worker_process() -> None:
+    """Run a pool worker's own shutdown hooks when the worker exits.
+
+    Hooks inherited from the parent by fork belong to the parent's objects and
+    are dropped, so only hooks registered inside the worker run here.
+    """
+    _shutdown_hooks.clear()
+    multiprocessing.util.Finalize(None, run_shutdown_hooks, exitpriority=10)
+
 
 def _graceful_shutdown(signum, frame) -> None:
     """Gracefully signal shutdown of the consumer loop.
@@ -79,11 +168,15 @@ def _graceful_shutdown(signum, frame) -> None:
 
 
 @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=2, max=10))
-def _start_rabbitmq_listener(callback: Callable[[list[dict]], None]) -> None:
+def _start_rabbitmq_listener(
+    callback: Callable[[list[dict]], None],
+    executor: Executor | None = None,
+) -> None:
     """Connect to RabbitMQ and start consuming messages from the configured queue.
 
     Args:
         callback (Callable[[list[dict]], None]): Handler function for batches of messages.
+        executor (Optional[Executor]): Worker pool for batches, or None to process inline.
 
     """
     connection = pika.BlockingConnection(
@@ -99,6 +192,16 @@ def _start_rabbitmq_listener(callback: Callable[[list[dict]], None]) -> None:
     channel = connection.channel()
     queue_name = config.get_rabbitmq_queue()
     channel.queue_declare(queue=queue_name, durable=True)
+    batch_size = config.get_batch_size()
+    max_inflight = config.get_max_inflight_batches() if executor is not None else 1
+    batch = _RabbitMQBatch(
+        channel,
+        callback,
+        batch_size,
+        config.get_batch_max_wait(),
+        executor=executor,
+        max_inflight=max_inflight,
+    )
 
     def on_message(ch: BlockingChannel, method, properties, body: bytes) -> None:
         """Callback invoked for each incoming RabbitMQ message.
@@ -115,46 +218,240 @@ def _start_rabbitmq_listener(callback: Callable[[list[dict]], None]) -> None:
             return
 
         try:
-            message = json.loads(body)
-            callback([message])
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            logger.debug("✅ RabbitMQ message processed and acknowledged.")
+            message = message_codec.decode(
+                body,
+                getattr(properties, "content_type", None),
+                getattr(properties, "content_encoding", None),
+            )
         except Exception:
-            logger.error("❌ RabbitMQ message processing failed (details redacted)")
+            logger.error("❌ RabbitMQ message could not be decoded (details redacted)")
             ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            record_ack_metrics("rabbitmq", "failure")
+            return
+
+        batch.add(method.delivery_tag, message)
 
     logger.info(safe_log("🚀 Consuming RabbitMQ messages from queue"))
 
     try:
-        channel.basic_qos(prefetch_count=config.get_batch_size())
+        # Allow enough unacked deliveries to keep every in-flight slot busy.
+        channel.basic_qos(prefetch_count=batch_size * max_inflight)
         channel.basic_consume(queue=queue_name, on_message_callback=on_message, auto_ack=False)
 
         while not shutdown_event.is_set():
-            connection.process_data_events(time_limit=1)
+            connection.process_data_events(time_limit=batch.seconds_until_due())
+            batch.acknowledge_completed()
+            batch.flush_if_due()
+
+        batch.drain()
     finally:
         connection.close()
         logger.info("🛑 RabbitMQ listener stopped.")
 
 
+class _RabbitMQBatch:
+    """Accumulates RabbitMQ deliveries and hands them to the callback as one batch.
+
+    A batch is processed once it reaches `max_size` messages or `max_wait`
+    seconds after its first message arrived, then acknowledged with a single
+    `basic_ack(multiple=True)`. When an executor is given, batches run on the
+    worker pool and are acknowledged strictly in delivery-tag order as they
+    complete, with at most `max_inflight` batches outstanding.
+    """
+
+    def __init__(
+        self,
+        channel: BlockingChannel,
+        callback: Callable[[list[dict]], None],
+        max_size: int,
+        max_wait: float,
+        executor: Executor | None = None,
+        max_inflight: int = 1,
+    ) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            channel (BlockingChannel): Channel the messages were delivered on.
+            callback (Callable[[list[dict]], None]): Handler function for a batch of messages.
+            max_size (int): Number of messages that triggers processing.
+            max_wait (float): Seconds after the first message before a partial batch is processed.
+            executor (Optional[Executor]): Worker pool, or None to run the callback inline.
+            max_inflight (int): Maximum number of batches submitted to the pool at once.
+
+        """
+        self._channel = channel
+        self._callback = callback
+        self._max_size = max(1, max_size)
+        self._max_wait = max_wait
+        self._executor = executor
+        self._max_inflight = max(1, max_inflight)
+        self._messages: list[dict[str, Any]] = []
+        self._last_tag: int | None = None
+        self._deadline: float | None = None
+        self._inflight: deque[tuple[int, int, Future[None]]] = deque()
+
+    def add(self, delivery_tag: int, message: dict[str, Any]) -> None:
+        """Add a decoded message, processing the batch if it is full.
+
+        Args:
+            delivery_tag (int): Delivery tag of the message.
+            message (dict): Decoded message body.
+
+        """
+        if not self._messages:
+            self._deadline = time.monotonic() + self._max_wait
+        self._messages.append(message)
+        self._last_tag = delivery_tag
+        if len(self._messages) >= self._max_size:
+            self.flush()
+
+    def seconds_until_due(self) -> float:
+        """Return how long the consumer may block before there is work to do.
+
+        Returns:
+            float: Seconds until the batch deadline, capped at one second, or
+            a short poll interval while batches are in flight.
+
+        """
+        limit = 0.05 if self._inflight else 1.0
+        if self._deadline is None:
+            return limit
+        return min(limit, max(0.0, self._deadline - time.monotonic()))
+
+    def flush_if_due(self) -> None:
+        """Process the pending batch if it is full or its max-wait deadline has passed."""
+        if not self._messages:
+            return
+        if len(self._messages) >= self._max_size or (
+            self._deadline is not None and time.monotonic() >= self._deadline
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Process pending messages, or submit them to the worker pool.
+
+        With a worker pool, the batch stays pending while `max_inflight`
+        batches are outstanding; prefetch stops further deliveries meanwhile.
+        """
+        if not self._messages or self._last_tag is None:
+            return
+        if self._executor is not None and len(self._inflight) >= self._max_inflight:
+            return
+
+        messages, last_tag = self._messages, self._last_tag
+        self._messages, self._last_tag, self._deadline = [], None, None
+
+        if self._executor is not None:
+            future = self._executor.submit(self._callback, messages)
+            self._inflight.append((last_tag, len(messages), future))
+            set_inflight_batches("rabbitmq", len(self._inflight))
+            return
+
+        try:
+            self._callback(messages)
+        except Exception:
+            self._reject(last_tag, len(messages))
+            return
+        self._acknowledge(last_tag, len(messages))
+
+    def acknowledge_completed(self) -> None:
+        """Acknowledge finished batches in delivery order, stopping at the first unfinished one."""
+        while self._inflight and self._inflight[0][2].done():
+            last_tag, count, future = self._inflight.popleft()
+            if future.exception() is not None:
+                self._reject(last_tag, count)
+            else:
+                self._acknowledge(last_tag, count)
+        if self._executor is not None:
+            set_inflight_batches("rabbitmq", len(self._inflight))
+
+    def drain(self) -> None:
+        """Process any pending messages and wait for every in-flight batch to finish."""
+        while self._messages or self._inflight:
+            self.flush()
+            if self._inflight:
+                wait([self._inflight[0][2]])
+            self.acknowledge_completed()
+
+    def _acknowledge(self, last_tag: int, count: int) -> None:
+        """Acknowledge every outstanding delivery up to and including `last_tag`."""
+        self._channel.basic_ack(delivery_tag=last_tag, multiple=True)
+        record_ack_metrics("rabbitmq", "success", count)
+        logger.debug("✅ RabbitMQ batch of %d message(s) processed and acknowledged.", count)
+
+    def _reject(self, last_tag: int, count: int) -> None:
+        """Reject every outstanding delivery up to and including `last_tag`."""
+        logger.error("❌ RabbitMQ batch processing failed (details redacted)")
+        self._channel.basic_nack(delivery_tag=last_tag, multiple=True, requeue=False)
+        record_ack_metrics("rabbitmq", "failure", count)
+
+
 @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=2, max=10))
-def _start_sqs_listener(callback: Callable[[list[dict]], None]) -> None:
+def _start_sqs_listener(
+    callback: Callable[[list[dict[str, Any]]], None],
+    executor: Executor | None = None,
+) -> None:
     """Connect to AWS SQS and start polling messages.
 
     Args:
         callback (Callable[[list[dict]], None]): Handler function for a batch of messages.
+        executor (Optional[Executor]): Worker pool for batches, or None to process inline.
 
     """
     sqs = boto3.client("sqs", region_name=config.get_sqs_region())
     queue_url = config.get_sqs_queue_url()
+    ack_worker = _SQSAckWorker(sqs, queue_url) if config.get_sqs_async_ack() else None
+    inflight: set[Future[None]] = set()
 
     logger.info(safe_log("🚀 Polling SQS queue"))
 
+    try:
+        _poll_sqs(sqs, queue_url, callback, ack_worker, executor, inflight)
+    finally:
+        if inflight:
+            wait(inflight)
+        if ack_worker is not None:
+            ack_worker.stop()
+
+    logger.info("🛑 SQS polling stopped.")
+
+
+def _poll_sqs(
+    sqs: Any,
+    queue_url: str,
+    callback: Callable[[list[dict[str, Any]]], None],
+    ack_worker: "_SQSAckWorker | None",
+    executor: Executor | None = None,
+    inflight: set[Future[None]] | None = None,
+) -> None:
+    """Receive, process, and acknowledge SQS messages until shutdown.
+
+    Args:
+        sqs (Any): boto3 SQS client.
+        queue_url (str): Queue to poll.
+        callback (Callable[[list[dict]], None]): Handler function for a batch of messages.
+        ack_worker (Optional[_SQSAckWorker]): Background deleter, or None to delete inline.
+        executor (Optional[Executor]): Worker pool for batches, or None to process inline.
+        inflight (Optional[set[Future]]): Tracks batches submitted to the worker pool.
+
+    """
+    inflight = inflight if inflight is not None else set()
+    max_inflight = config.get_max_inflight_batches()
+
     while not shutdown_event.is_set():
+        if executor is not None:
+            inflight.difference_update([future for future in inflight if future.done()])
+            set_inflight_batches("sqs", len(inflight))
+            if len(inflight) >= max_inflight:
+                wait(inflight, timeout=1, return_when=FIRST_COMPLETED)
+                continue
+
         try:
             response = sqs.receive_message(
                 QueueUrl=queue_url,
                 MaxNumberOfMessages=config.get_batch_size(),
                 WaitTimeSeconds=10,
+                MessageAttributeNames=message_codec.SQS_ATTRIBUTE_NAMES,
             )
             messages = response.get("Messages", [])
             if not messages:
@@ -165,20 +462,173 @@ def _start_sqs_listener(callback: Callable[[list[dict]], None]) -> None:
 
             for msg in messages:
                 try:
-                    payload = json.loads(msg["Body"])
+                    payload = message_codec.decode_sqs_message(msg)
                     payloads.append(payload)
                     receipt_handles.append(msg["ReceiptHandle"])
                 except Exception:
                     logger.warning("⚠️ Failed to parse SQS message body (redacted)")
 
-            if payloads:
+            if payloads and executor is not None:
+                future = executor.submit(callback, payloads)
+                future.add_done_callback(
+                    _make_sqs_completion_handler(sqs, queue_url, receipt_handles, ack_worker)
+                )
+                inflight.add(future)
+                set_inflight_batches("sqs", len(inflight))
+            elif payloads:
                 callback(payloads)
-                for handle in receipt_handles:
-                    sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=handle)
-                logger.debug("✅ SQS: Processed and deleted %d message(s)", len(payloads))
+                _acknowledge_sqs(sqs, queue_url, receipt_handles, ack_worker)
+                logger.debug("✅ SQS: Processed and acknowledged %d message(s)", len(payloads))
 
         except (BotoCoreError, NoCredentialsError):
             logger.error("❌ SQS error encountered (details redacted)")
             time.sleep(5)
 
-    logger.info("🛑 SQS polling stopped.")
+
+def _acknowledge_sqs(
+    sqs: Any,
+    queue_url: str,
+    receipt_handles: list[str],
+    ack_worker: "_SQSAckWorker | None",
+) -> None:
+    """Delete processed messages inline or hand them to the background ack thread.
+
+    Args:
+        sqs (Any): boto3 SQS client.
+        queue_url (str): Queue the messages were received from.
+        receipt_handles (list[str]): Receipt handles of processed messages.
+        ack_worker (Optional[_SQSAckWorker]): Background deleter, or None to delete inline.
+
+    """
+    if ack_worker is not None:
+        ack_worker.submit(receipt_handles)
+    else:
+        _delete_sqs_messages(sqs, queue_url, receipt_handles)
+
+
+def _make_sqs_completion_handler(
+    sqs: Any,
+    queue_url: str,
+    receipt_handles: list[str],
+    ack_worker: "_SQSAckWorker | None",
+) -> Callable[[Future[None]], None]:
+    """Build a done-callback that acknowledges a batch once its worker succeeds.
+
+    Failed batches are left undeleted so SQS redelivers them after the
+    visibility timeout.
+
+    Args:
+        sqs (Any): boto3 SQS client.
+        queue_url (str): Queue the messages were received from.
+        receipt_handles (list[str]): Receipt handles of the batch.
+        ack_worker (Optional[_SQSAckWorker]): Background deleter, or None to delete inline.
+
+    Returns:
+        Callable[[Future], None]: Callback for `Future.add_done_callback`.
+
+    """
+
+    def on_done(future: Future[None]) -> None:
+        if future.exception() is not None:
+            logger.error("❌ SQS batch processing failed (details redacted)")
+            record_ack_metrics("sqs", "failure", len(receipt_handles))
+            return
+        _acknowledge_sqs(sqs, queue_url, receipt_handles, ack_worker)
+        logger.debug("✅ SQS: Processed and acknowledged %d message(s)", len(receipt_handles))
+
+    return on_done
+
+
+def _delete_sqs_messages(sqs: Any, queue_url: str, receipt_handles: list[str]) -> int:
+    """Delete processed SQS messages using DeleteMessageBatch.
+
+    Entries that fail for a non-sender reason are retried up to
+    SQS_DELETE_MAX_ATTEMPTS times in total. Messages that
+    still fail to delete become visible again after the visibility timeout
+    and will be redelivered.
+
+    Args:
+        sqs (Any): boto3 SQS client.
+        queue_url (str): Queue the messages were received from.
+        receipt_handles (list[str]): Receipt handles of processed messages.
+
+    Returns:
+        int: Number of messages that could not be deleted.
+
+    """
+    failed = 0
+    for entries in sqs_batching.delete_entries(receipt_handles):
+        for attempt in range(1, sqs_batching.SQS_DELETE_MAX_ATTEMPTS + 1):
+            try:
+                response = sqs.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+            except (BotoCoreError, ClientError):
+                failed += sqs_batching.record_delete_error(entries)
+                break
+
+            permanent, entries = sqs_batching.handle_delete_response(response, entries, attempt)
+            failed += permanent
+            if not entries:
+                break
+
+    return failed
+
+
+class _SQSAckWorker:
+    """Background thread that deletes processed SQS messages in batches.
+
+    Lets the listener start its next long-poll immediately instead of waiting
+    for delete round trips. The thread survives unexpected errors, and its
+    liveness is reported through the healthcheck while it runs.
+    """
+
+    def __init__(self, sqs: Any, queue_url: str) -> None:
+        """Start the ack thread.
+
+        Args:
+            sqs (Any): boto3 SQS client.
+            queue_url (str): Queue the messages were received from.
+
+        """
+        self._sqs = sqs
+        self._queue_url = queue_url
+        self._pending: queue.Queue[list[str] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="sqs-ack", daemon=True)
+        self._thread.start()
+        healthcheck.register_liveness_check("sqs-ack", self._thread.is_alive)
+
+    def submit(self, receipt_handles: list[str]) -> None:
+        """Queue receipt handles for deletion.
+
+        Args:
+            receipt_handles (list[str]): Receipt handles of processed messages.
+
+        """
+        self._pending.put(list(receipt_handles))
+
+    def stop(self) -> None:
+        """Delete everything still queued, then stop the thread."""
+        healthcheck.unregister_liveness_check("sqs-ack")
+        self._pending.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Drain queued handles, coalescing them into full delete batches."""
+        stopping = False
+        while not stopping:
+            handles = self._pending.get()
+            if handles is None:
+                break
+            while len(handles) < sqs_batching.SQS_DELETE_BATCH_SIZE:
+                try:
+                    more = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    stopping = True
+                    break
+                handles.extend(more)
+            try:
+                _delete_sqs_messages(self._sqs, self._queue_url, handles)
+            except Exception:
+                logger.error("❌ SQS ack worker failed to delete a batch (details redacted)")
+                record_ack_metrics("sqs", "failure", len(handles))
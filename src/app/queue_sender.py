@@ -2,26 +2,45 @@
 
 Handles publishing of processed data to the appropriate messaging queue,
 with retry logic, structured logging, redaction, and Prometheus metrics.
+RabbitMQ messages are published over a long-lived, per-thread connection with
+pipelined publisher confirms (up to RABBITMQ_MAX_UNCONFIRMED in flight), so
+only messages the broker nacks, returns, or never confirms are published again;
+SQS messages are sent in SendMessageBatch calls on a cached client. Bodies are
+encoded in the QUEUE_WIRE_FORMAT (JSON or MessagePack), compressed with
+QUEUE_COMPRESSION when large, and tagged with their content type and encoding
+so consumers can decode mixed-format queues.
 """
 
-import json
+import threading
 import time
+import weakref
+from functools import lru_cache
 from typing import Any
 
 import boto3
 import pika
-from botocore.exceptions import BotoCoreError, NoCredentialsError
-from pika.exceptions import AMQPConnectionError
-from tenacity import retry, stop_after_attempt, wait_exponential
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.channel import Channel
+from pika.exceptions import AMQPChannelError, AMQPConnectionError
 
 from app import config_shared
-from app.utils.metrics import queue_publish_counter, queue_publish_latency
-from app.utils.safe_logger import safe_error, safe_info
+from app.queue_handler import register_shutdown_hook
+from app.utils import message_codec, serialization, sqs_batching
+from app.utils.metrics import (
+    queue_publish_counter,
+    queue_publish_latency,
+    record_connection_event,
+    record_publish_confirms,
+)
+from app.utils.safe_logger import safe_error, safe_info, safe_warning
 
 REDACT_SENSITIVE_LOGS: bool = (
     config_shared.get_config_value_cached("REDACT_SENSITIVE_LOGS", "true").lower() == "true"
 )
 
+# Publish rounds per batch; each round re-publishes only the messages that failed.
+RABBITMQ_PUBLISH_MAX_ATTEMPTS: int = 3
+
 
 class SQSMessageSendError(Exception):
     """Raised when SQS returns a non-200 HTTP status."""
@@ -29,6 +48,471 @@ class SQSMessageSendError(Exception):
     pass
 
 
+class RabbitMQPublishError(Exception):
+    """Raised when one or more RabbitMQ messages were not confirmed by the broker."""
+
+    pass
+
+
+class RabbitMQPublisher:
+    """Long-lived RabbitMQ publisher that reuses a single connection and channel.
+
+    BlockingConnection is not thread-safe, so each thread gets its own
+    publisher via `get_rabbitmq_publisher()`. Messages are published without
+    publisher confirms; see `ConfirmingRabbitMQPublisher` for confirmed,
+    pipelined publishing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the publisher without opening a connection."""
+        self._connection: pika.BlockingConnection | None = None
+        self._channel: BlockingChannel | None = None
+        self._has_connected = False
+
+    def publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: str | bytes,
+        properties: pika.BasicProperties | None = None,
+    ) -> None:
+        """Publish a message, reconnecting once if the connection was lost.
+
+        Args:
+            exchange (str): Exchange to publish to.
+            routing_key (str): Routing key for the message.
+            body (str | bytes): Encoded message body.
+            properties (Optional[pika.BasicProperties]): Message properties (e.g., content type).
+
+        Raises:
+            RabbitMQPublishError: If the message was not delivered after reconnecting.
+
+        """
+        for _ in range(2):
+            if not self.publish_batch(exchange, routing_key, [(body, properties)]):
+                return
+        raise RabbitMQPublishError("RabbitMQ did not accept the message")
+
+    def publish_batch(
+        self,
+        exchange: str,
+        routing_key: str,
+        messages: list[tuple[str | bytes, pika.BasicProperties | None]],
+    ) -> list[int]:
+        """Publish messages on one channel without waiting for the broker.
+
+        If the connection cannot be opened or is lost, the publisher is
+        closed, the unsent messages are reported as failed, and the next call
+        reconnects. Without confirms, nothing is known about messages the
+        broker drops after they were written.
+
+        Args:
+            exchange (str): Exchange to publish to.
+            routing_key (str): Routing key for every message.
+            messages (list[tuple[str | bytes, Optional[pika.BasicProperties]]]): Encoded
+                bodies and their properties.
+
+        Returns:
+            list[int]: Indexes of messages that were not sent; empty if every
+            message was written to the channel.
+
+        """
+        sent = 0
+        try:
+            channel = self._get_channel()
+            for body, properties in messages:
+                channel.basic_publish(
+                    exchange=exchange,
+                    routing_key=routing_key,
+                    body=body,
+                    properties=properties,
+                )
+                sent += 1
+        except (AMQPConnectionError, AMQPChannelError) as e:
+            safe_warning("RabbitMQ publisher connection lost, reconnecting", {"error": str(e)})
+            self.close()
+        return list(range(sent, len(messages)))
+
+    def close(self) -> None:
+        """Close the underlying connection, ignoring errors from an already-dead socket."""
+        connection, self._connection, self._channel = self._connection, None, None
+        if connection is not None and connection.is_open:
+            try:
+                connection.close()
+            except Exception as e:
+                safe_warning("Error while closing RabbitMQ publisher", {"error": str(e)})
+
+    def _get_channel(self) -> BlockingChannel:
+        """Return the open channel, creating a new connection if needed.
+
+        Returns:
+            BlockingChannel: An open channel ready for publishing.
+
+        """
+        if (
+            self._channel is not None
+            and self._channel.is_open
+            and self._connection is not None
+            and self._connection.is_open
+        ):
+            record_connection_event("rabbitmq_publisher", "reuse")
+            return self._channel
+
+        self.close()
+        self._connection = pika.BlockingConnection(_rabbitmq_connection_parameters())
+        self._channel = self._connection.channel()
+        record_connection_event(
+            "rabbitmq_publisher", "reconnect" if self._has_connected else "open"
+        )
+        self._has_connected = True
+        return self._channel
+
+
+class _ConfirmBatch:
+    """Delivery state of one `ConfirmingRabbitMQPublisher.publish_batch` call."""
+
+    def __init__(
+        self,
+        exchange: str,
+        routing_key: str,
+        messages: list[tuple[str | bytes, pika.BasicProperties | None]],
+    ) -> None:
+        """Initialize the batch with nothing published yet.
+
+        Args:
+            exchange (str): Exchange to publish to.
+            routing_key (str): Routing key for every message.
+            messages (list[tuple[str | bytes, Optional[pika.BasicProperties]]]): Encoded
+                bodies and their properties.
+
+        """
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self.messages = messages
+        self.next_index = 0
+        self.outstanding: dict[int, int] = {}  # delivery tag -> message index
+        self.nacked: set[int] = set()
+        self.returned: set[int] = set()
+        self.lost = False
+
+    @property
+    def done(self) -> bool:
+        """Whether every message has been published and settled."""
+        return self.next_index == len(self.messages) and not self.outstanding
+
+    def unsettled(self) -> list[int]:
+        """Return the indexes of messages that were not published or not confirmed."""
+        return [*self.outstanding.values(), *range(self.next_index, len(self.messages))]
+
+
+class ConfirmingRabbitMQPublisher(RabbitMQPublisher):
+    """RabbitMQ publisher that pipelines messages under publisher confirms.
+
+    Up to RABBITMQ_MAX_UNCONFIRMED messages are in flight at once and are
+    settled by the broker's Basic.Ack/Basic.Nack frames, including
+    `multiple=True` bulk acks, so a batch costs a round trip per window
+    rather than per message. Messages are published with `mandatory=True`,
+    so unroutable ones are returned and reported as failed.
+
+    Runs on a pika SelectConnection whose I/O loop is driven only while
+    `publish_batch` runs; like the blocking publisher, use one per thread.
+    """
+
+    def __init__(
+        self, max_unconfirmed: int | None = None, confirm_timeout: float | None = None
+    ) -> None:
+        """Initialize the publisher without opening a connection.
+
+        Args:
+            max_unconfirmed (Optional[int]): Messages allowed to await a confirm at
+                once; defaults to RABBITMQ_MAX_UNCONFIRMED.
+            confirm_timeout (Optional[float]): Seconds without a confirm before the
+                outstanding messages are reported as failed; defaults to
+                RABBITMQ_CONFIRM_TIMEOUT.
+
+        """
+        super().__init__()
+        self._max_unconfirmed = max(
+            1, max_unconfirmed or config_shared.get_rabbitmq_max_unconfirmed()
+        )
+        self._confirm_timeout = confirm_timeout or config_shared.get_rabbitmq_confirm_timeout()
+        self._select: pika.SelectConnection | None = None
+        self._select_channel: Channel | None = None
+        self._delivery_tag = 0
+        self._batch: _ConfirmBatch | None = None
+        self._timer: Any = None
+
+    def publish_batch(
+        self,
+        exchange: str,
+        routing_key: str,
+        messages: list[tuple[str | bytes, pika.BasicProperties | None]],
+    ) -> list[int]:
+        """Publish messages with a window of unconfirmed deliveries.
+
+        A nack or an unroutable return marks that message as failed without
+        stopping the batch. If the connection cannot be opened or is lost, or
+        no confirm arrives within the confirm timeout, the publisher is
+        closed, the unsettled messages are reported as failed, and the next
+        call reconnects.
+
+        Args:
+            exchange (str): Exchange to publish to.
+            routing_key (str): Routing key for every message.
+            messages (list[tuple[str | bytes, Optional[pika.BasicProperties]]]): Encoded
+                bodies and their properties.
+
+        Returns:
+            list[int]: Indexes of messages that were nacked, returned, or not
+            confirmed; empty if every message was confirmed.
+
+        """
+        if not messages:
+            return []
+
+        batch = self._batch = _ConfirmBatch(exchange, routing_key, messages)
+        try:
+            if self._is_open():
+                record_connection_event("rabbitmq_publisher", "reuse")
+                self._publish_window()
+            else:
+                self._open()
+            if not batch.done and not batch.lost and self._select is not None:
+                self._restart_timer()
+                self._select.ioloop.start()
+        except (AMQPConnectionError, AMQPChannelError) as e:
+            safe_warning("RabbitMQ publisher connection lost, reconnecting", {"error": str(e)})
+            batch.lost = True
+        finally:
+            self._batch = None
+            self._cancel_timer()
+
+        unsettled = batch.unsettled()
+        if batch.lost:
+            self.close()
+        failed = sorted({*batch.nacked, *batch.returned, *unsettled})
+        record_publish_confirms("rabbitmq", "ack", len(messages) - len(failed))
+        record_publish_confirms("rabbitmq", "nack", len(batch.nacked))
+        record_publish_confirms("rabbitmq", "returned", len(batch.returned - batch.nacked))
+        record_publish_confirms("rabbitmq", "lost", len(unsettled))
+        return failed
+
+    def close(self) -> None:
+        """Close the connection, waiting briefly for the close handshake."""
+        connection, self._select_channel = self._select, None
+        self._select = None
+        if connection is None or connection.is_closed:
+            return
+        try:
+            if not connection.is_closing:
+                connection.close()
+            connection.ioloop.call_later(5, connection.ioloop.stop)
+            connection.ioloop.start()
+        except Exception as e:
+            safe_warning("Error while closing RabbitMQ publisher", {"error": str(e)})
+
+    def _is_open(self) -> bool:
+        """Report whether the connection and confirm-mode channel are usable."""
+        return (
+            self._select is not None
+            and self._select.is_open
+            and self._select_channel is not None
+            and self._select_channel.is_open
+        )
+
+    def _open(self) -> None:
+        """Start connecting; publishing begins once the channel is in confirm mode."""
+        self.close()
+        self._select = pika.SelectConnection(
+            _rabbitmq_connection_parameters(),
+            on_open_callback=self._on_connection_open,
+            on_open_error_callback=self._on_connection_error,
+            on_close_callback=self._on_connection_closed,
+        )
+
+    def _on_connection_open(self, connection: pika.SelectConnection) -> None:
+        """Open the publishing channel once the connection is up."""
+        connection.channel(on_open_callback=self._on_channel_open)
+
+    def _on_channel_open(self, channel: Channel) -> None:
+        """Register callbacks and put the new channel in confirm mode."""
+        self._select_channel = channel
+        self._delivery_tag = 0
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.add_on_return_callback(self._on_return)
+        channel.confirm_delivery(self._on_confirm, callback=self._on_confirm_select_ok)
+
+    def _on_confirm_select_ok(self, _frame: Any) -> None:
+        """Start publishing once the broker accepted confirm mode."""
+        record_connection_event(
+            "rabbitmq_publisher", "reconnect" if self._has_connected else "open"
+        )
+        self._has_connected = True
+        self._publish_window()
+
+    def _on_connection_error(self, connection: pika.SelectConnection, error: Exception) -> None:
+        """Abort the batch when the connection cannot be opened."""
+        safe_warning("RabbitMQ publisher could not connect", {"error": str(error)})
+        self._abort(connection)
+
+    def _on_connection_closed(self, connection: pika.SelectConnection, reason: Exception) -> None:
+        """Abort the running batch when the connection closes."""
+        self._select_channel = None
+        if self._batch is not None:
+            safe_warning("RabbitMQ publisher connection lost, reconnecting", {"error": str(reason)})
+        self._abort(connection)
+
+    def _on_channel_closed(self, channel: Channel, reason: Exception) -> None:
+        """Close the connection when the broker closes the channel."""
+        self._select_channel = None
+        connection = self._select
+        if self._batch is not None:
+            safe_warning("RabbitMQ publisher channel closed", {"error": str(reason)})
+        if connection is not None and connection.is_open:
+            connection.close()
+
+    def _abort(self, connection: pika.SelectConnection) -> None:
+        """Mark the running batch as lost and leave the I/O loop."""
+        if self._batch is not None:
+            self._batch.lost = True
+        connection.ioloop.stop()
+
+    def _publish_window(self) -> None:
+        """Publish until the window of unconfirmed messages is full or the batch is sent."""
+        batch, channel = self._batch, self._select_channel
+        if batch is None or channel is None or self._select is None:
+            return
+        while (
+            batch.next_index < len(batch.messages)
+            and len(batch.outstanding) < self._max_unconfirmed
+        ):
+            body, properties = batch.messages[batch.next_index]
+            channel.basic_publish(
+                exchange=batch.exchange,
+                routing_key=batch.routing_key,
+                body=body,
+                properties=properties,
+                mandatory=True,
+            )
+            self._delivery_tag += 1
+            batch.outstanding[self._delivery_tag] = batch.next_index
+            batch.next_index += 1
+        if batch.done:
+            self._select.ioloop.stop()
+
+    def _on_confirm(self, frame: Any) -> None:
+        """Settle the messages covered by a Basic.Ack or Basic.Nack frame."""
+        batch = self._batch
+        if batch is None:
+            return
+        method = frame.method
+        if method.multiple:
+            tags = [tag for tag in batch.outstanding if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag]
+        acked = isinstance(method, pika.spec.Basic.Ack)
+        for tag in tags:
+            index = batch.outstanding.pop(tag, None)
+            if index is not None and not acked:
+                batch.nacked.add(index)
+        self._restart_timer()
+        self._publish_window()
+
+    def _on_return(self, _channel: Channel, _method: Any, _properties: Any, body: bytes) -> None:
+        """Mark an unroutable message as failed; its ack arrives afterwards."""
+        batch = self._batch
+        if batch is None:
+            return
+        for index in batch.outstanding.values():
+            sent = batch.messages[index][0]
+            if index not in batch.returned and (
+                sent == body or (isinstance(sent, str) and sent.encode("utf-8") == body)
+            ):
+                batch.returned.add(index)
+                return
+
+    def _on_confirm_timeout(self) -> None:
+        """Give up on the batch when no confirm arrived within the timeout."""
+        self._timer = None
+        if self._batch is not None and self._select is not None:
+            safe_warning(
+                "RabbitMQ confirms timed out",
+                {"unconfirmed": len(self._batch.outstanding), "timeout": self._confirm_timeout},
+            )
+            self._abort(self._select)
+
+    def _restart_timer(self) -> None:
+        """Restart the confirm timeout after progress on the batch."""
+        self._cancel_timer()
+        if self._select is not None:
+            self._timer = self._select.ioloop.call_later(
+                self._confirm_timeout, self._on_confirm_timeout
+            )
+
+    def _cancel_timer(self) -> None:
+        """Cancel the pending confirm timeout, if any."""
+        timer, self._timer = self._timer, None
+        if timer is not None and self._select is not None:
+            self._select.ioloop.remove_timeout(timer)
+
+
+_publisher_local = threading.local()
+_publishers: "weakref.WeakSet[RabbitMQPublisher]" = weakref.WeakSet()
+_publishers_lock = threading.Lock()
+
+
+def _rabbitmq_connection_parameters() -> pika.ConnectionParameters:
+    """Build RabbitMQ connection parameters from shared config.
+
+    Returns:
+        pika.ConnectionParameters: Parameters for a blocking connection.
+
+    """
+    credentials = pika.PlainCredentials(
+        config_shared.get_rabbitmq_user(),
+        config_shared.get_rabbitmq_password(),
+    )
+    return pika.ConnectionParameters(
+        host=config_shared.get_rabbitmq_host(),
+        port=config_shared.get_rabbitmq_port(),
+        virtual_host=config_shared.get_rabbitmq_vhost(),
+        credentials=credentials,
+        blocked_connection_timeout=30,
+    )
+
+
+def get_rabbitmq_publisher() -> RabbitMQPublisher:
+    """Return the RabbitMQ publisher bound to the current thread.
+
+    Returns:
+        RabbitMQPublisher: Publisher reused across calls on this thread.
+
+    """
+    publisher: RabbitMQPublisher | None = getattr(_publisher_local, "publisher", None)
+    if publisher is None:
+        if config_shared.get_rabbitmq_publisher_confirms():
+            publisher = ConfirmingRabbitMQPublisher()
+        else:
+            publisher = RabbitMQPublisher()
+        _publisher_local.publisher = publisher
+        with _publishers_lock:
+            _publishers.add(publisher)
+        register_shutdown_hook(close_rabbitmq_publishers)
+    return publisher
+
+
+def close_rabbitmq_publishers() -> None:
+    """Close the RabbitMQ connection of every thread's publisher.
+
+    Registered as a shutdown hook, so it runs once publishing threads have
+    finished. A publisher used again afterwards reconnects.
+    """
+    with _publishers_lock:
+        publishers = list(_publishers)
+    for publisher in publishers:
+        publisher.close()
+
+
 def safe_log_message(data: dict[str, Any]) -> str:
     """Return redacted or full version of a message for logging.
 
@@ -39,7 +523,7 @@ def safe_log_message(data: dict[str, Any]) -> str:
         str: Redacted placeholder or JSON-formatted string.
 
     """
-    return "[REDACTED]" if REDACT_SENSITIVE_LOGS else json.dumps(data, ensure_ascii=False)
+    return "[REDACTED]" if REDACT_SENSITIVE_LOGS else serialization.dumps_str(data)
 
 
 def publish_to_queue(
@@ -61,154 +545,171 @@ def publish_to_queue(
 
     queue_type: str = config_shared.get_queue_type().lower()
 
-    for message in payload:
-        if queue_type == "rabbitmq":
-            _send_to_rabbitmq(message, queue, exchange)
-        elif queue_type == "sqs":
-            _send_to_sqs(message, queue)
-        else:
-            safe_error(
-                "Invalid QUEUE_TYPE",
-                {"queue_type": "[REDACTED]" if REDACT_SENSITIVE_LOGS else queue_type},
-            )
+    if queue_type == "rabbitmq":
+        _send_batch_to_rabbitmq(payload, queue, exchange)
+    elif queue_type == "sqs":
+        _send_batch_to_sqs(payload, queue)
+    else:
+        safe_error(
+            "Invalid QUEUE_TYPE",
+            {"queue_type": "[REDACTED]" if REDACT_SENSITIVE_LOGS else queue_type},
+        )
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
-def _send_to_rabbitmq(
-    data: dict[str, Any],
+def _send_batch_to_rabbitmq(
+    payload: list[dict[str, Any]],
     routing_key: str | None = None,
     exchange: str | None = None,
 ) -> None:
-    """Send a single message to RabbitMQ.
+    """Publish a list of messages to RabbitMQ, re-publishing only unconfirmed ones.
 
     Args:
-        data (dict[str, Any]): The message payload.
+        payload (list[dict[str, Any]]): Messages to send.
         routing_key (Optional[str]): Optional routing key override.
         exchange (Optional[str]): Optional exchange override.
 
     Raises:
-        AMQPConnectionError: On RabbitMQ connection failure.
-        Exception: On publish failure.
+        RabbitMQPublishError: If any message was still unconfirmed after retries.
 
     """
-    start: float = time.perf_counter()
-    try:
-        credentials = pika.PlainCredentials(
-            config_shared.get_rabbitmq_user(),
-            config_shared.get_rabbitmq_password(),
-        )
-        parameters = pika.ConnectionParameters(
-            host=config_shared.get_rabbitmq_host(),
-            port=config_shared.get_rabbitmq_port(),
-            virtual_host=config_shared.get_rabbitmq_vhost(),
-            credentials=credentials,
-            blocked_connection_timeout=30,
+    if not payload:
+        return
+
+    resolved_exchange: str = exchange or config_shared.get_rabbitmq_exchange()
+    resolved_routing_key: str = routing_key or config_shared.get_rabbitmq_routing_key()
+    messages = []
+    for data in payload:
+        body, content_type, content_encoding = message_codec.encode_published_message(data)
+        properties = pika.BasicProperties(
+            content_type=content_type, content_encoding=content_encoding
         )
+        messages.append((body, properties))
+
+    pending = list(range(len(messages)))
+    for attempt in range(1, RABBITMQ_PUBLISH_MAX_ATTEMPTS + 1):
+        start: float = time.perf_counter()
+        try:
+            failed = get_rabbitmq_publisher().publish_batch(
+                resolved_exchange, resolved_routing_key, [messages[i] for i in pending]
+            )
+        except (AMQPConnectionError, AMQPChannelError) as e:
+            safe_error("RabbitMQ publish connection error", {"error": str(e), "attempt": attempt})
+            failed = list(range(len(pending)))
 
-        with pika.BlockingConnection(parameters) as connection:
-            channel = connection.channel()
-            resolved_exchange: str = exchange or config_shared.get_rabbitmq_exchange()
-            resolved_routing_key: str = routing_key or config_shared.get_rabbitmq_routing_key()
-            channel.basic_publish(
-                exchange=resolved_exchange,
-                routing_key=resolved_routing_key,
-                body=json.dumps(data, ensure_ascii=False),
+        duration = time.perf_counter() - start
+        status = "failure" if failed else "success"
+        queue_publish_latency.labels(queue_type="rabbitmq", status=status).observe(duration)
+        if len(pending) > len(failed):
+            queue_publish_counter.labels(queue_type="rabbitmq", status="success").inc(
+                len(pending) - len(failed)
             )
 
-        duration: float = time.perf_counter() - start
-        queue_publish_counter.labels(queue_type="rabbitmq", status="success").inc()
-        queue_publish_latency.labels(queue_type="rabbitmq", status="success").observe(duration)
-        safe_info(
-            "Published message to RabbitMQ",
-            {
-                "exchange": resolved_exchange,
-                "routing_key": resolved_routing_key,
-                "duration": duration,
-                "message": data,
-            },
+        pending = [pending[i] for i in failed]
+        if not pending:
+            break
+        if attempt < RABBITMQ_PUBLISH_MAX_ATTEMPTS:
+            time.sleep(min(2**attempt, 10))
+
+    safe_info(
+        "Published batch to RabbitMQ",
+        {
+            "exchange": resolved_exchange,
+            "routing_key": resolved_routing_key,
+            "messages": len(payload),
+            "failed": len(pending),
+        },
+    )
+    if pending:
+        queue_publish_counter.labels(queue_type="rabbitmq", status="failure").inc(len(pending))
+        raise RabbitMQPublishError(
+            f"{len(pending)} of {len(payload)} RabbitMQ message(s) were not confirmed"
         )
 
-    except AMQPConnectionError as e:
-        duration = time.perf_counter() - start
-        queue_publish_counter.labels(queue_type="rabbitmq", status="failure").inc()
-        queue_publish_latency.labels(queue_type="rabbitmq", status="failure").observe(duration)
-        safe_error("RabbitMQ publish connection error", {"error": str(e), "duration": duration})
-        raise
-    except Exception as e:
-        duration = time.perf_counter() - start
-        queue_publish_counter.labels(queue_type="rabbitmq", status="exception").inc()
-        queue_publish_latency.labels(queue_type="rabbitmq", status="exception").observe(duration)
-        safe_error(
-            "Unhandled error during RabbitMQ publish", {"error": str(e), "duration": duration}
-        )
-        raise
 
+@lru_cache
+def _get_sqs_client(region: str) -> Any:
+    """Return a cached SQS client for the given region.
+
+    boto3 clients are thread-safe, so one client is shared per region.
+
+    Args:
+        region (str): AWS region name.
+
+    Returns:
+        Any: A boto3 SQS client.
+
+    """
+    return boto3.client("sqs", region_name=region)
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
-def _send_to_sqs(
-    data: dict[str, Any],
+
+def _send_batch_to_sqs(
+    payload: list[dict[str, Any]],
     queue_name: str | None = None,
 ) -> None:
-    """Send a single message to AWS SQS.
+    """Send a list of messages to AWS SQS using SendMessageBatch.
 
     Args:
-        data (dict[str, Any]): The message payload.
+        payload (list[dict[str, Any]]): Messages to send.
         queue_name (Optional[str]): Optional override for SQS queue URL.
 
     Raises:
-        BotoCoreError: On SQS client error.
-        NoCredentialsError: If AWS credentials are not available.
-        SQSMessageSendError: If HTTP response code is not 200.
-        Exception: On publish failure.
+        SQSMessageSendError: If any entry still failed after retries.
 
     """
+    if not payload:
+        return
+
     sqs_url: str = queue_name or config_shared.get_sqs_queue_url()
-    region: str = config_shared.get_sqs_region()
-
-    start: float = time.perf_counter()
-    try:
-        sqs_client = boto3.client("sqs", region_name=region)
-        response = sqs_client.send_message(
-            QueueUrl=sqs_url,
-            MessageBody=json.dumps(data, ensure_ascii=False),
-        )
+    sqs_client = _get_sqs_client(config_shared.get_sqs_region())
+    failed = 0
+    for entries in sqs_batching.build_send_batches(payload):
+        failed += _send_sqs_batch_chunk(sqs_client, sqs_url, entries)
 
-        status_code: int = response["ResponseMetadata"]["HTTPStatusCode"]
-        duration: float = time.perf_counter() - start
-
-        if status_code != 200:
-            queue_publish_counter.labels(queue_type="sqs", status="failure").inc()
-            queue_publish_latency.labels(queue_type="sqs", status="failure").observe(duration)
-            safe_error(
-                "Failed to publish message to SQS",
-                {
-                    "http_status": status_code,
-                    "duration": duration,
-                    "queue_url": sqs_url,
-                },
-            )
-            raise SQSMessageSendError(f"SQS returned HTTP status {status_code}")
-
-        queue_publish_counter.labels(queue_type="sqs", status="success").inc()
-        queue_publish_latency.labels(queue_type="sqs", status="success").observe(duration)
-        safe_info(
-            "Published message to SQS",
-            {
-                "queue_url": sqs_url,
-                "duration": duration,
-                "message": data,
-            },
+    safe_info(
+        "Published batch to SQS",
+        {"queue_url": sqs_url, "messages": len(payload), "failed": failed},
+    )
+    if failed:
+        raise SQSMessageSendError(f"{failed} of {len(payload)} SQS message(s) failed to send")
+
+
+def _send_sqs_batch_chunk(sqs_client: Any, sqs_url: str, entries: list[dict[str, Any]]) -> int:
+    """Send one SendMessageBatch chunk, retrying only the entries that failed.
+
+    Entries rejected with SenderFault are not retried since resending them
+    cannot succeed. If the call itself keeps failing (client or service
+    error), every pending entry of the chunk counts as failed so the
+    remaining chunks are still sent.
+
+    Args:
+        sqs_client (Any): boto3 SQS client.
+        sqs_url (str): Target queue URL.
+        entries (list[dict[str, Any]]): Batch entries to send.
+
+    Returns:
+        int: Number of entries that could not be delivered.
+
+    """
+    pending = entries
+    failed = 0
+
+    for attempt in range(1, sqs_batching.SQS_BATCH_MAX_ATTEMPTS + 1):
+        start: float = time.perf_counter()
+        try:
+            response = sqs_client.send_message_batch(QueueUrl=sqs_url, Entries=pending)
+        except sqs_batching.SQS_CALL_ERRORS as e:
+            lost = sqs_batching.record_send_error(e, pending, attempt, time.perf_counter() - start)
+            if lost:
+                return failed + lost
+            time.sleep(min(2**attempt, 10))
+            continue
+
+        rejected, pending = sqs_batching.handle_send_response(
+            response, pending, attempt, time.perf_counter() - start
         )
+        failed += rejected
+        if not pending:
+            return failed
+        time.sleep(min(2**attempt, 10))
 
-    except (BotoCoreError, NoCredentialsError) as e:
-        duration = time.perf_counter() - start
-        queue_publish_counter.labels(queue_type="sqs", status="failure").inc()
-        queue_publish_latency.labels(queue_type="sqs", status="failure").observe(duration)
-        safe_error("SQS client error", {"error": str(e), "duration": duration})
-        raise
-    except Exception as e:
-        duration = time.perf_counter() - start
-        queue_publish_counter.labels(queue_type="sqs", status="exception").inc()
-        queue_publish_latency.labels(queue_type="sqs", status="exception").observe(duration)
-        safe_error("Unhandled error during SQS publish", {"error": str(e), "duration": duration})
-        raise
+    return failed
@@ -6,6 +6,7 @@ container orchestrators like Kubernetes or Docker.
 
 import logging
 import threading
+from collections.abc import Callable
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
 from app import config_shared
@@ -16,6 +17,9 @@ logger: logging.Logger = logging.getLogger(__name__)
 _readiness_flag: bool = False
 _health_flag: bool = True
 
+# Named checks for background workers; the service is unhealthy if any fails.
+_liveness_checks: dict[str, Callable[[], bool]] = {}
+
 
 def is_ready() -> bool:
     """Check if the service is ready to handle requests.
@@ -31,10 +35,37 @@ def is_healthy() -> bool:
     """Check if the service is currently healthy.
 
     Returns:
-        bool: True if the service is healthy and not in a failure state.
+        bool: True if the service is healthy and every liveness check passes.
+
+    """
+    if not _health_flag:
+        return False
+    for name, check in list(_liveness_checks.items()):
+        if not check():
+            logger.warning("❌ Liveness check failed: %s", name)
+            return False
+    return True
+
+
+def register_liveness_check(name: str, check: Callable[[], bool]) -> None:
+    """Register a check that must pass for /health to report healthy.
+
+    Args:
+        name (str): Unique check name; registering it again replaces the check.
+        check (Callable[[], bool]): Returns False when the component is dead.
+
+    """
+    _liveness_checks[name] = check
+
+
+def unregister_liveness_check(name: str) -> None:
+    """Remove a liveness check, e.g. when its worker stops on purpose.
+
+    Args:
+        name (str): Name the check was registered under.
 
     """
-    return _health_flag
+    _liveness_checks.pop(name, None)
 
 
 def set_ready() -> None:
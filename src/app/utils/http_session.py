@@ -0,0 +1,130 @@
+"""Pooled, instrumented `requests` sessions for long-lived HTTP clients.
+
+A session created here keeps TCP/TLS connections alive across requests in a
+sized connection pool and reports whether each request opened a new
+connection or reused a pooled one (`client_connection_events_total`). Also
+provides helpers for retrying throttled or failed requests.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.utils.metrics import record_connection_event
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that records connection open/reuse events per request."""
+
+    def __init__(self, client: str, pool_size: int) -> None:
+        """Initialize the adapter.
+
+        Args:
+            client (str): Client name used as the metric label.
+            pool_size (int): Maximum pooled connections per host.
+
+        """
+        self.client = client
+        self._local = threading.local()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=False)
+
+    def get_connection_with_tls_context(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the connection pool for a request, remembering it for `send`."""
+        return self._remember(super().get_connection_with_tls_context(*args, **kwargs))
+
+    def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the connection pool for a request (requests < 2.32)."""
+        return self._remember(super().get_connection(*args, **kwargs))
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float | None, float | None] | None = None,
+        verify: bool | str = True,
+        cert: str | tuple[str, str] | None = None,
+        proxies: dict[str, str] | None = None,
+    ) -> requests.Response:
+        """Send a request and record whether it opened a new connection.
+
+        Args:
+            request (requests.PreparedRequest): Request to send.
+            stream (bool): Whether to stream the response content.
+            timeout (float | tuple | None): Connect/read timeout.
+            verify (bool | str): TLS verification flag or CA bundle path.
+            cert (str | tuple[str, str] | None): Client certificate.
+            proxies (Optional[dict[str, str]]): Proxies for the request.
+
+        Returns:
+            requests.Response: The response.
+
+        """
+        self._local.pool = None
+        response = super().send(request, stream, timeout, verify, cert, proxies)
+        pool = self._local.pool
+        if pool is not None:
+            opened = pool.num_connections > self._local.opened_before
+            record_connection_event(self.client, "open" if opened else "reuse")
+        return response
+
+    def _remember(self, pool: Any) -> Any:
+        """Store the pool used by the current thread's request and its connection count.
+
+        Args:
+            pool (Any): urllib3 connection pool.
+
+        Returns:
+            Any: The same pool.
+
+        """
+        self._local.pool = pool
+        self._local.opened_before = pool.num_connections
+        return pool
+
+
+def create_session(client: str, pool_size: int = 10) -> requests.Session:
+    """Create a keep-alive session with an instrumented connection pool.
+
+    Args:
+        client (str): Client name used as the metric label (e.g., "rest").
+        pool_size (int): Maximum pooled connections per host.
+
+    Returns:
+        requests.Session: Session to reuse for all requests of this client.
+
+    """
+    session = requests.Session()
+    adapter = InstrumentedHTTPAdapter(client, pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Status codes worth retrying: throttling and transient server-side failures.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value (Optional[str]): Header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait (never negative), or None if absent or invalid.
+
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -0,0 +1,486 @@
+"""Wire formats for queue messages.
+
+Publishers encode messages as JSON (the default) or MessagePack, selected by
+QUEUE_WIRE_FORMAT, and tag every message with its content type: the AMQP
+`content_type` property on RabbitMQ and a `content_type` message attribute on
+SQS. Consumers decode each message according to its own tag and treat
+untagged messages, and legacy or unrecognized tags such as `text/plain`, as
+JSON, so a queue holding both formats keeps working while publishers are
+migrated.
+
+Bodies at or above QUEUE_COMPRESSION_MIN_BYTES can also be compressed with
+gzip or zstd; compressed messages carry the algorithm in the AMQP
+`content_encoding` property or a `content_encoding` SQS attribute and are
+decompressed transparently on consume. SQS bodies must be text, so binary and
+compressed bodies are base64-encoded there. `encode_published_message` and
+`encode_published_sqs_message` apply the configured format and compression and
+are shared by the threaded and asyncio publishers.
+"""
+
+import base64
+import gzip
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app import config_shared
+from app.utils import serialization
+from app.utils.metrics import (
+    record_compression_metrics,
+    record_compression_outcome,
+    record_content_type_fallback,
+)
+from app.utils.setup_logger import setup_logger
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # Required only for QUEUE_WIRE_FORMAT=msgpack
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]  # Required only for QUEUE_COMPRESSION=zstd
+
+logger = setup_logger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+WIRE_FORMATS = {"json": JSON_CONTENT_TYPE, "msgpack": MSGPACK_CONTENT_TYPE}
+
+# Content types other producers commonly use for the same encodings.
+_CONTENT_TYPE_ALIASES = {
+    "text/json": JSON_CONTENT_TYPE,
+    "application/x-msgpack": MSGPACK_CONTENT_TYPE,
+    "application/vnd.msgpack": MSGPACK_CONTENT_TYPE,
+}
+
+COMPRESSION_ALGORITHMS = ("gzip", "zstd")
+# Some AMQP clients put the text charset in content_encoding; treat those as uncompressed.
+_IDENTITY_ENCODINGS = frozenset({"identity", "utf-8", "utf8"})
+
+# SQS message attributes carrying the codec, and the names consumers request.
+CONTENT_TYPE_ATTRIBUTE = "content_type"
+CONTENT_ENCODING_ATTRIBUTE = "content_encoding"
+SQS_ATTRIBUTE_NAMES = [CONTENT_TYPE_ATTRIBUTE, CONTENT_ENCODING_ATTRIBUTE]
+
+# Unrecognized content types already logged, so each is warned about once.
+_warned_content_types: set[str] = set()
+
+# zstd compressor/decompressor objects are not safe for concurrent use.
+_zstd_local = threading.local()
+
+
+def content_type_for(wire_format: str) -> str:
+    """Resolve a QUEUE_WIRE_FORMAT value to its content type.
+
+    Args:
+        wire_format (str): 'json' or 'msgpack'.
+
+    Returns:
+        str: The content type publishers tag messages with.
+
+    Raises:
+        ValueError: If the wire format is not supported.
+        RuntimeError: If msgpack is requested but not installed.
+
+    """
+    content_type = WIRE_FORMATS.get(wire_format.lower())
+    if content_type is None:
+        raise ValueError(f"Unsupported QUEUE_WIRE_FORMAT: {wire_format}")
+    if content_type == MSGPACK_CONTENT_TYPE and msgpack is None:
+        raise RuntimeError("QUEUE_WIRE_FORMAT=msgpack requires the 'msgpack' package.")
+    return content_type
+
+
+def validate_compression(compression: str | None) -> str | None:
+    """Resolve a QUEUE_COMPRESSION value.
+
+    Args:
+        compression (Optional[str]): 'none', 'gzip', or 'zstd'.
+
+    Returns:
+        Optional[str]: The algorithm, or None when compression is disabled.
+
+    Raises:
+        ValueError: If the algorithm is not supported.
+        RuntimeError: If zstd is requested but zstandard is not installed.
+
+    """
+    if not compression or compression.lower() == "none":
+        return None
+    compression = compression.lower()
+    if compression not in COMPRESSION_ALGORITHMS:
+        raise ValueError(f"Unsupported QUEUE_COMPRESSION: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("QUEUE_COMPRESSION=zstd requires the 'zstandard' package.")
+    return compression
+
+
+def _zstd_compressor() -> Any:
+    """Return this thread's zstd compressor."""
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor
+
+
+def _zstd_decompressor() -> Any:
+    """Return this thread's zstd decompressor."""
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def compress(
+    body: bytes,
+    compression: str | None,
+    min_bytes: int = 0,
+    wire_size: Callable[[int], int] | None = None,
+    plain_size: int | None = None,
+) -> tuple[bytes, str | None]:
+    """Compress a message body if it is large enough and compression pays off.
+
+    Sizes are compared as they will be sent, so transports that re-encode
+    bodies (SQS base64) pass `wire_size` and `plain_size`.
+
+    Args:
+        body (bytes): Encoded message body.
+        compression (Optional[str]): 'gzip', 'zstd', or None to disable.
+        min_bytes (int): Bodies smaller than this on the wire are sent uncompressed.
+        wire_size (Optional[Callable[[int], int]]): Wire size of a compressed body
+            of the given length; the length itself if None.
+        plain_size (Optional[int]): Wire size of the uncompressed body; len(body) if None.
+
+    Returns:
+        tuple[bytes, Optional[str]]: The body to send and its content encoding,
+        or None if it was left uncompressed.
+
+    """
+    if compression is None:
+        return body, None
+    plain_size = len(body) if plain_size is None else plain_size
+    if plain_size < min_bytes:
+        record_compression_outcome(compression, "below_threshold")
+        return body, None
+
+    start = time.perf_counter()
+    if compression == "zstd":
+        compressed = _zstd_compressor().compress(body)
+    else:
+        compressed = gzip.compress(body, compresslevel=6, mtime=0)
+    compressed_size = len(compressed) if wire_size is None else wire_size(len(compressed))
+    record_compression_metrics(
+        compression, "compress", time.perf_counter() - start, plain_size, compressed_size
+    )
+
+    if compressed_size >= plain_size:
+        record_compression_outcome(compression, "not_smaller")
+        return body, None
+    record_compression_outcome(compression, "compressed")
+    return compressed, compression
+
+
+def decompress(body: bytes | bytearray | memoryview, content_encoding: str | None) -> bytes:
+    """Decompress a message body according to its content encoding.
+
+    Args:
+        body (bytes | bytearray | memoryview): Received message body.
+        content_encoding (Optional[str]): 'gzip', 'zstd', or None/'identity' for none.
+
+    Returns:
+        bytes: Uncompressed body.
+
+    Raises:
+        ValueError: If the encoding is not supported or the body is corrupt.
+        RuntimeError: If the body is zstd-compressed but zstandard is not installed.
+
+    """
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding in _IDENTITY_ENCODINGS:
+        return bytes(body)
+    if encoding not in COMPRESSION_ALGORITHMS:
+        raise ValueError(f"Unsupported message content encoding: {content_encoding}")
+    if encoding == "zstd" and zstandard is None:
+        raise RuntimeError("Decoding zstd-compressed messages requires the 'zstandard' package.")
+
+    start = time.perf_counter()
+    try:
+        data: bytes
+        if encoding == "zstd":
+            data = _zstd_decompressor().decompressobj().decompress(bytes(body))
+        else:
+            data = gzip.decompress(body)
+    except Exception as e:
+        raise ValueError(str(e)) from e
+    record_compression_metrics(encoding, "decompress", time.perf_counter() - start)
+    return data
+
+
+def _normalize(content_type: str | None) -> str:
+    """Map a content type header to JSON_CONTENT_TYPE or MSGPACK_CONTENT_TYPE.
+
+    Args:
+        content_type (Optional[str]): Header value; parameters such as charset are ignored.
+
+    Returns:
+        str: Normalized content type; missing headers mean JSON.
+
+    Raises:
+        ValueError: If the content type is not supported.
+
+    """
+    if not content_type:
+        return JSON_CONTENT_TYPE
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    media_type = _CONTENT_TYPE_ALIASES.get(media_type, media_type)
+    if media_type not in (JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE):
+        raise ValueError(f"Unsupported message content type: {content_type}")
+    return media_type
+
+
+def _decode_content_type(content_type: str | None) -> str:
+    """Map a received content type header to the decoder to use.
+
+    Types other than JSON and MessagePack (e.g. `text/plain` or
+    `application/octet-stream` from legacy producers, or vendor JSON types)
+    are decoded as JSON; they are counted, and logged once per type.
+
+    Args:
+        content_type (Optional[str]): Header value from the consumed message.
+
+    Returns:
+        str: JSON_CONTENT_TYPE or MSGPACK_CONTENT_TYPE.
+
+    """
+    try:
+        return _normalize(content_type)
+    except ValueError:
+        media_type = str(content_type).split(";", 1)[0].strip().lower()
+        record_content_type_fallback(media_type)
+        if media_type not in _warned_content_types:
+            _warned_content_types.add(media_type)
+            logger.warning("⚠️ Unrecognized message content type %s; decoding as JSON", media_type)
+        return JSON_CONTENT_TYPE
+
+
+def encode(obj: Any, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """Encode a message body.
+
+    Args:
+        obj (Any): Message payload.
+        content_type (str): Content type to encode as.
+
+    Returns:
+        bytes: Encoded body.
+
+    Raises:
+        TypeError: If the payload cannot be encoded.
+        ValueError: If the content type is not supported.
+
+    """
+    if _normalize(content_type) == JSON_CONTENT_TYPE:
+        return serialization.dumps(obj)
+    try:
+        packed: bytes = msgpack.packb(obj, use_bin_type=True)
+    except TypeError:
+        raise
+    except Exception as e:
+        raise TypeError(str(e)) from e
+    return packed
+
+
+def encode_message(
+    obj: Any,
+    content_type: str = JSON_CONTENT_TYPE,
+    compression: str | None = None,
+    min_bytes: int = 0,
+) -> tuple[bytes, str | None]:
+    """Encode and optionally compress a message body.
+
+    Args:
+        obj (Any): Message payload.
+        content_type (str): Content type to encode as.
+        compression (Optional[str]): 'gzip', 'zstd', or None to disable.
+        min_bytes (int): Bodies smaller than this are sent uncompressed.
+
+    Returns:
+        tuple[bytes, Optional[str]]: Body and its content encoding (None if uncompressed).
+
+    """
+    return compress(encode(obj, content_type), compression, min_bytes)
+
+
+def decode(
+    body: bytes | bytearray | memoryview | str,
+    content_type: str | None = None,
+    content_encoding: str | None = None,
+) -> Any:
+    """Decode a message body according to its content type and encoding.
+
+    Args:
+        body (bytes | bytearray | memoryview | str): Encoded body.
+        content_type (Optional[str]): Content type header; None or an
+            unrecognized type means JSON.
+        content_encoding (Optional[str]): Compression applied to the body, if any.
+
+    Returns:
+        Any: Decoded payload.
+
+    Raises:
+        ValueError: If the body cannot be decompressed or decoded.
+        RuntimeError: If the body is MessagePack but msgpack is not installed.
+
+    """
+    if content_encoding:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        body = decompress(body, content_encoding)
+    if _decode_content_type(content_type) == JSON_CONTENT_TYPE:
+        return serialization.loads(body)
+    if msgpack is None:
+        raise RuntimeError("Decoding MessagePack messages requires the 'msgpack' package.")
+    try:
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    except Exception as e:
+        raise ValueError(str(e)) from e
+
+
+def encode_sqs_message(
+    obj: Any,
+    content_type: str = JSON_CONTENT_TYPE,
+    compression: str | None = None,
+    min_bytes: int = 0,
+) -> tuple[str, dict[str, dict[str, str]]]:
+    """Encode a message for SQS, which only accepts text bodies.
+
+    Args:
+        obj (Any): Message payload.
+        content_type (str): Content type to encode as.
+        compression (Optional[str]): 'gzip', 'zstd', or None to disable.
+        min_bytes (int): Bodies smaller than this are sent uncompressed.
+
+    Compression is kept only if the base64 text of the compressed body is
+    smaller than the body would be sent uncompressed.
+
+    Returns:
+        tuple[str, dict[str, dict[str, str]]]: Message body (JSON text, or base64
+        for binary or compressed bodies) and its MessageAttributes.
+
+    """
+    body = encode(obj, content_type)
+    is_text = _normalize(content_type) == JSON_CONTENT_TYPE
+    plain_size = len(body) if is_text else _base64_size(len(body))
+    body, content_encoding = compress(
+        body, compression, min_bytes, wire_size=_base64_size, plain_size=plain_size
+    )
+    attributes = sqs_message_attributes(content_type, content_encoding)
+    if content_encoding is None and is_text:
+        return body.decode("utf-8"), attributes
+    return base64.b64encode(body).decode("ascii"), attributes
+
+
+def _base64_size(length: int) -> int:
+    """Return the length of the base64 encoding of `length` bytes."""
+    return 4 * ((length + 2) // 3)
+
+
+def sqs_message_attributes(
+    content_type: str, content_encoding: str | None = None
+) -> dict[str, dict[str, str]]:
+    """Build the SQS message attributes that tag a message's codec.
+
+    Args:
+        content_type (str): Content type of the message body.
+        content_encoding (Optional[str]): Compression applied to the body, if any.
+
+    Returns:
+        dict[str, dict[str, str]]: Value for the MessageAttributes parameter.
+
+    """
+    attributes = {CONTENT_TYPE_ATTRIBUTE: {"DataType": "String", "StringValue": content_type}}
+    if content_encoding:
+        attributes[CONTENT_ENCODING_ATTRIBUTE] = {
+            "DataType": "String",
+            "StringValue": content_encoding,
+        }
+    return attributes
+
+
+def decode_sqs_message(message: dict[str, Any]) -> Any:
+    """Decode a received SQS message using its content type attribute.
+
+    Args:
+        message (dict[str, Any]): Message from ReceiveMessage.
+
+    Returns:
+        Any: Decoded payload.
+
+    Raises:
+        ValueError: If the body cannot be decompressed or decoded.
+
+    """
+    attributes = message.get("MessageAttributes", {})
+    content_type = _decode_content_type(
+        attributes.get(CONTENT_TYPE_ATTRIBUTE, {}).get("StringValue")
+    )
+    content_encoding = attributes.get(CONTENT_ENCODING_ATTRIBUTE, {}).get("StringValue")
+    body = message["Body"]
+    if content_encoding or content_type != JSON_CONTENT_TYPE:
+        try:
+            body = base64.b64decode(body, validate=True)
+        except Exception as e:
+            raise ValueError(str(e)) from e
+    return decode(body, content_type, content_encoding)
+
+
+def published_content_type() -> str:
+    """Return the content type for the configured QUEUE_WIRE_FORMAT.
+
+    Returns:
+        str: Content type published messages are encoded as.
+
+    """
+    return content_type_for(config_shared.get_queue_wire_format())
+
+
+def encode_published_message(data: dict[str, Any]) -> tuple[bytes, str, str | None]:
+    """Encode a message in the configured wire format, compressing it if large.
+
+    Args:
+        data (dict[str, Any]): The message payload.
+
+    Returns:
+        tuple[bytes, str, Optional[str]]: Body, content type, and content encoding.
+
+    """
+    content_type = published_content_type()
+    body, content_encoding = encode_message(
+        data,
+        content_type,
+        validate_compression(config_shared.get_queue_compression()),
+        config_shared.get_queue_compression_min_bytes(),
+    )
+    return body, content_type, content_encoding
+
+
+def encode_published_sqs_message(
+    data: dict[str, Any],
+) -> tuple[str, dict[str, dict[str, str]]]:
+    """Encode a message for SQS in the configured wire format, compressing it if large.
+
+    Args:
+        data (dict[str, Any]): The message payload.
+
+    Returns:
+        tuple[str, dict[str, dict[str, str]]]: Message body and MessageAttributes.
+
+    """
+    return encode_sqs_message(
+        data,
+        published_content_type(),
+        validate_compression(config_shared.get_queue_compression()),
+        config_shared.get_queue_compression_min_bytes(),
+    )
@@ -8,6 +8,8 @@ Exports counters and histograms for:
 - Paper trading
 - Rate limiting
 - Optional sinks: REST, S3, database
+- Vault secret access
+- Pooled client connections
 """
 
 import re
@@ -56,6 +58,14 @@ output_duration = Histogram(
 )
 
 
+output_batch_duration = Histogram(
+    "output_batch_duration_seconds",
+    "End-to-end time to dispatch one batch to every configured output mode.",
+    ["strategy"],
+    buckets=[0.01, 0.1, 0.5, 1, 2, 5, 10, 30],
+)
+
+
 def record_output_metrics(mode: str, success: bool, duration_sec: float) -> None:
     mode = _sanitize_label(mode)
     if success:
@@ -65,6 +75,28 @@ def record_output_metrics(mode: str, success: bool, duration_sec: float) -> None
     output_duration.labels(mode=mode).observe(duration_sec)
 
 
+def record_output_failure(mode: str, count: int = 1) -> None:
+    """Record output that was given up on without a send attempt being timed.
+
+    Args:
+        mode (str): Output mode (e.g., "s3").
+        count (int): Number of failures (e.g., dropped records).
+
+    """
+    output_failures.labels(mode=_sanitize_label(mode)).inc(count)
+
+
+def record_output_batch_metrics(strategy: str, duration_sec: float) -> None:
+    """Record the aggregate latency of dispatching a batch to all output modes.
+
+    Args:
+        strategy (str): Dispatch strategy ("sequential" or "parallel").
+        duration_sec (float): Time taken for all sinks to finish.
+
+    """
+    output_batch_duration.labels(strategy=_sanitize_label(strategy)).observe(duration_sec)
+
+
 # -----------------------------
 # Polling Metrics
 # -----------------------------
@@ -228,6 +260,42 @@ def record_rate_limit_metrics(context: str, blocked: bool, tokens_remaining: flo
     rate_limiter_tokens_remaining.labels(context=context).set(tokens_remaining)
 
 
+rate_limiter_saturation = Gauge(
+    "rate_limiter_saturation",
+    "Fraction of a provider's burst capacity in use (above 1 means callers are queued)",
+    ["provider"],
+)
+
+
+def record_rate_limiter_saturation(provider: str, saturation: float) -> None:
+    """Record how close a provider's rate limiter is to throttling.
+
+    Args:
+        provider (str): Provider name (e.g., "polygon").
+        saturation (float): Fraction of burst capacity in use.
+
+    """
+    rate_limiter_saturation.labels(provider=_sanitize_label(provider)).set(saturation)
+
+
+rate_limiter_effective_rate = Gauge(
+    "rate_limiter_effective_rate",
+    "Current refill rate of an adaptive rate limiter in requests per second",
+    ["limiter"],
+)
+
+
+def record_rate_limiter_effective_rate(limiter: str, rate: float) -> None:
+    """Record the refill rate an adaptive rate limiter is currently using.
+
+    Args:
+        limiter (str): Limiter key (e.g., the provider name).
+        rate (float): Requests per second.
+
+    """
+    rate_limiter_effective_rate.labels(limiter=_sanitize_label(limiter)).set(rate)
+
+
 # -----------------------------
 # Optional Sink Metrics
 # -----------------------------
@@ -308,6 +376,114 @@ def record_sink_metrics(sink: str, status: str, duration_sec: float, failed: boo
             db_dispatch_failures.labels(status=status).inc()
 
 
+s3_buffer_flush_counter = Counter(
+    "s3_buffer_flush_total",
+    "Number of objects written by the buffered S3 sink, by flush trigger.",
+    ["reason"],
+)
+
+s3_object_size = Histogram(
+    "s3_object_size_bytes",
+    "Size of objects written by the buffered S3 sink.",
+    buckets=[1024, 16384, 131072, 1048576, 8388608, 33554432, 134217728],
+)
+
+s3_buffered_records = Gauge(
+    "s3_buffered_records",
+    "Records currently held in the buffered S3 sink.",
+)
+
+
+def record_s3_flush_metrics(reason: str, size_bytes: int) -> None:
+    """Record one object written by the buffered S3 sink.
+
+    Args:
+        reason (str): Flush trigger ("bytes", "records", "age", or "shutdown").
+        size_bytes (int): Size of the written object.
+
+    """
+    s3_buffer_flush_counter.labels(reason=_sanitize_label(reason)).inc()
+    s3_object_size.observe(size_bytes)
+
+
+s3_part_counter = Counter(
+    "s3_multipart_parts_total",
+    "Number of S3 multipart part uploads by status.",
+    ["status"],
+)
+
+s3_part_duration = Histogram(
+    "s3_multipart_part_duration_seconds",
+    "Time taken to upload one S3 multipart part.",
+    buckets=[0.05, 0.1, 0.5, 1, 2, 5, 10, 30],
+)
+
+s3_part_bytes = Counter(
+    "s3_multipart_bytes_total",
+    "Bytes uploaded in S3 multipart parts.",
+)
+
+
+def record_s3_part_metrics(status: str, size_bytes: int, duration_sec: float) -> None:
+    """Record one S3 multipart part upload.
+
+    Args:
+        status (str): Upload status ("success" or "failure").
+        size_bytes (int): Part size.
+        duration_sec (float): Time taken by the upload.
+
+    """
+    s3_part_counter.labels(status=_sanitize_label(status)).inc()
+    s3_part_duration.observe(duration_sec)
+    if status == "success":
+        s3_part_bytes.inc(size_bytes)
+
+
+db_rows_written_counter = Counter(
+    "database_rows_written_total",
+    "Total number of rows written by the database output sink.",
+    ["method"],
+)
+
+db_write_throughput = Histogram(
+    "database_write_rows_per_second",
+    "Rows per second achieved by each database output batch.",
+    ["method"],
+    buckets=[10, 100, 500, 1000, 5000, 10000, 50000, 100000],
+)
+
+db_pool_checkout_duration = Histogram(
+    "database_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the database pool.",
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5],
+)
+
+
+def record_db_write_metrics(method: str, rows: int, duration_sec: float) -> None:
+    """Record rows written and throughput for one database output batch.
+
+    Args:
+        method (str): Write method used (e.g. "insert").
+        rows (int): Number of rows written.
+        duration_sec (float): Time taken to write the batch.
+
+    """
+    method = _sanitize_label(method)
+    db_rows_written_counter.labels(method=method).inc(rows)
+    if rows and duration_sec > 0:
+        db_write_throughput.labels(method=method).observe(rows / duration_sec)
+
+
+def record_db_pool_checkout(duration_sec: float) -> None:
+    """Record how long a database connection checkout waited on the pool.
+
+    Args:
+        duration_sec (float): Checkout wait time in seconds.
+
+    """
+    db_pool_checkout_duration.observe(duration_sec)
+
+
 # -----------------------------
 # Queue Publishing Metrics
 # -----------------------------
@@ -338,3 +514,203 @@ def record_queue_metrics(queue_type: str, status: str, duration_sec: float) -> N
     status = _sanitize_label(status)
     queue_publish_counter.labels(queue_type=queue_type, status=status).inc()
     queue_publish_latency.labels(queue_type=queue_type, status=status).observe(duration_sec)
+
+
+queue_publish_confirms = Counter(
+    "queue_publish_confirms_total",
+    "Broker confirmation outcomes for published messages (ack, nack, returned, timeout, lost).",
+    ["queue_type", "result"],
+)
+
+
+def record_publish_confirms(queue_type: str, result: str, count: int = 1) -> None:
+    """Record broker confirmation outcomes for published messages.
+
+    Args:
+        queue_type (str): Type of the queue system (e.g., "rabbitmq").
+        result (str): Outcome ("ack", "nack", "returned", "timeout", or "lost").
+        count (int): Number of messages the outcome applies to.
+
+    """
+    if count:
+        queue_publish_confirms.labels(
+            queue_type=_sanitize_label(queue_type), result=_sanitize_label(result)
+        ).inc(count)
+
+
+queue_content_type_fallback_counter = Counter(
+    "queue_content_type_fallback_total",
+    "Consumed messages with an unrecognized content type that were decoded as JSON.",
+    ["content_type"],
+)
+
+
+def record_content_type_fallback(content_type: str) -> None:
+    """Count a consumed message whose content type was not recognized.
+
+    Args:
+        content_type (str): Media type the message was tagged with.
+
+    """
+    queue_content_type_fallback_counter.labels(content_type=_sanitize_label(content_type)).inc()
+
+
+# -----------------------------
+# Queue Payload Compression Metrics
+# -----------------------------
+queue_compression_counter = Counter(
+    "queue_compression_total",
+    "Published message bodies by compression algorithm and outcome.",
+    ["algorithm", "outcome"],
+)
+
+queue_compression_ratio = Histogram(
+    "queue_compression_ratio",
+    "Compressed size divided by original size for compressed message bodies.",
+    ["algorithm"],
+    buckets=[0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0],
+)
+
+queue_compression_duration = Histogram(
+    "queue_compression_duration_seconds",
+    "Time taken to compress or decompress a message body.",
+    ["algorithm", "operation"],
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1],
+)
+
+
+def record_compression_metrics(
+    algorithm: str,
+    operation: str,
+    duration_sec: float,
+    original_bytes: int = 0,
+    compressed_bytes: int = 0,
+) -> None:
+    """Record one message body compression or decompression.
+
+    Args:
+        algorithm (str): Compression algorithm (e.g., "gzip", "zstd").
+        operation (str): "compress" or "decompress".
+        duration_sec (float): Time taken by the operation.
+        original_bytes (int): Uncompressed size (used for "compress").
+        compressed_bytes (int): Compressed size (used for "compress").
+
+    """
+    algorithm = _sanitize_label(algorithm)
+    queue_compression_duration.labels(
+        algorithm=algorithm, operation=_sanitize_label(operation)
+    ).observe(duration_sec)
+    if operation == "compress" and original_bytes:
+        queue_compression_ratio.labels(algorithm=algorithm).observe(
+            compressed_bytes / original_bytes
+        )
+
+
+def record_compression_outcome(algorithm: str, outcome: str) -> None:
+    """Count a publish-side compression decision.
+
+    Args:
+        algorithm (str): Configured compression algorithm.
+        outcome (str): "compressed", "below_threshold", or "not_smaller".
+
+    """
+    queue_compression_counter.labels(
+        algorithm=_sanitize_label(algorithm), outcome=_sanitize_label(outcome)
+    ).inc()
+
+
+# -----------------------------
+# Vault Metrics
+# -----------------------------
+vault_request_counter = Counter(
+    "vault_requests_total",
+    "Total number of Vault API calls by operation and status.",
+    ["operation", "status"],
+)
+
+vault_request_duration = Histogram(
+    "vault_request_duration_seconds",
+    "Time taken by Vault API calls by operation.",
+    ["operation"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1, 2, 5],
+)
+
+
+def record_vault_metrics(operation: str, status: str, duration_sec: float) -> None:
+    """Record metrics for a Vault API call.
+
+    Args:
+        operation (str): Vault operation (e.g., "login", "read").
+        status (str): Call status (e.g., "success", "failure").
+        duration_sec (float): Time taken by the call.
+
+    """
+    operation = _sanitize_label(operation)
+    status = _sanitize_label(status)
+    vault_request_counter.labels(operation=operation, status=status).inc()
+    vault_request_duration.labels(operation=operation).observe(duration_sec)
+
+
+# -----------------------------
+# Connection Pool Metrics
+# -----------------------------
+connection_events_counter = Counter(
+    "client_connection_events_total",
+    "Connection lifecycle events for long-lived clients (open, reuse, reconnect).",
+    ["client", "event"],
+)
+
+
+def record_connection_event(client: str, event: str) -> None:
+    """Record a connection lifecycle event for a pooled client.
+
+    Args:
+        client (str): Client name (e.g., "rabbitmq_publisher").
+        event (str): Event type (e.g., "open", "reuse", "reconnect").
+
+    """
+    client = _sanitize_label(client)
+    event = _sanitize_label(event)
+    connection_events_counter.labels(client=client, event=event).inc()
+
+
+# -----------------------------
+# Queue Acknowledgement Metrics
+# -----------------------------
+queue_ack_counter = Counter(
+    "queue_ack_total",
+    "Total number of consumed messages acknowledged by queue type and status.",
+    ["queue_type", "status"],
+)
+
+
+def record_ack_metrics(queue_type: str, status: str, count: int = 1) -> None:
+    """Record acknowledgement outcomes for consumed messages.
+
+    Args:
+        queue_type (str): Type of the queue system (e.g., "rabbitmq", "sqs").
+        status (str): Acknowledgement status (e.g., "success", "failure").
+        count (int): Number of messages the outcome applies to.
+
+    """
+    queue_type = _sanitize_label(queue_type)
+    status = _sanitize_label(status)
+    queue_ack_counter.labels(queue_type=queue_type, status=status).inc(count)
+
+
+queue_inflight_batches = Gauge(
+    "queue_inflight_batches",
+    "Number of consumed batches currently being processed by workers.",
+    ["queue_type"],
+)
+
+
+def set_inflight_batches(queue_type: str, count: int) -> None:
+    """Set the number of batches currently in flight for a consumer.
+
+    Args:
+        queue_type (str): Type of the queue system (e.g., "rabbitmq", "sqs").
+        count (int): Batches submitted to workers and not yet acknowledged.
+
+    """
+    queue_inflight_batches.labels(queue_type=_sanitize_label(queue_type)).set(count)
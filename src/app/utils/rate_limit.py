@@ -1,33 +1,48 @@
 """Thread-safe rate limiter using the token bucket algorithm.
 
-Includes Prometheus metrics and context hashing for structured logs.
+Includes Prometheus metrics and context hashing for structured logs. Callers
+reserve a token under a short lock and sleep outside it, so a throttled
+thread never blocks other threads from taking their own reservations.
+`AsyncRateLimiter` offers the same bucket with an awaitable `acquire`, and
+`RateLimiter` can share one budget across replicas through a backend from
+`app.utils.rate_limit_backends`. An adaptive `RateLimiter` tunes its refill
+rate from provider responses (HTTP 429, Retry-After, X-RateLimit-*) using
+additive-increase/multiplicative-decrease (AIMD).
 """
 
+import asyncio
 import hashlib
+import logging
 import re
 import threading
 import time
-
-from prometheus_client import Counter, Gauge
-
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from app.utils.http_session import parse_retry_after
+from app.utils.metrics import (
+    rate_limiter_blocked_total,
+    rate_limiter_tokens_remaining,
+    record_rate_limiter_effective_rate,
+)
+from app.utils.rate_limit_backends import RateLimitBackend
 from app.utils.setup_logger import setup_logger
 
 logger = setup_logger(__name__)
 
-# Prometheus metrics
-rate_limiter_blocked_total = Counter(
-    "rate_limiter_blocked_total",
-    "Total number of times the rate limiter blocked",
-    ["context"],
-)
+# AIMD tuning for adaptive limiters: halve the rate when throttled, then add
+# 1% of the configured rate per successful response. The rate never drops
+# below 5% of the configured rate.
+ADAPTIVE_DECREASE_FACTOR = 0.5
+ADAPTIVE_INCREASE_FRACTION = 0.01
+ADAPTIVE_MIN_FRACTION = 0.05
 
-rate_limiter_tokens_remaining = Gauge(
-    "rate_limiter_tokens_remaining",
-    "Current number of available tokens in the rate limiter",
-    ["context"],
-)
+# X-RateLimit-Reset values above this are epoch timestamps, not delta-seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
 
 
+@lru_cache(maxsize=1024)
 def _sanitize_context(context: str) -> str:
     """Sanitize a context string for use in Prometheus metric labels.
 
@@ -43,6 +58,7 @@ def _sanitize_context(context: str) -> str:
     return re.sub(r"[^\w\-:.]", "_", context)[:64]
 
 
+@lru_cache(maxsize=1024)
 def _hash_context(context: str) -> str:
     """Hash the context string to produce a short identifier for logs.
 
@@ -56,39 +72,278 @@ def _hash_context(context: str) -> str:
     return hashlib.sha256(context.encode()).hexdigest()[:8]
 
 
-class RateLimiter:
-    """Thread-safe token bucket rate limiter with Prometheus integration.
+@lru_cache(maxsize=1024)
+def _context_metrics(context: str) -> tuple[Any, Any]:
+    """Return the labelled Prometheus children for a context.
+
+    Args:
+        context (str): Original context string.
+
+    Returns:
+        tuple[Any, Any]: Blocked counter and tokens-remaining gauge for the context.
 
-    Allows a maximum number of requests in a defined time window.
     """
+    label = _sanitize_context(context)
+    return (
+        rate_limiter_blocked_total.labels(context=label),
+        rate_limiter_tokens_remaining.labels(context=label),
+    )
 
-    def __init__(self, max_requests: int, time_window: float) -> None:
-        """Initialize a new RateLimiter instance.
+
+def _parse_quota(headers: Mapping[str, str]) -> tuple[float, float] | None:
+    """Parse X-RateLimit-Remaining and X-RateLimit-Reset response headers.
+
+    Args:
+        headers (Mapping[str, str]): Response headers with lower-case names.
+
+    Returns:
+        Optional[tuple[float, float]]: Requests remaining and seconds until the
+        quota resets, or None if either header is absent or invalid.
+
+    """
+    try:
+        remaining = float(headers["x-ratelimit-remaining"])
+        reset = float(headers["x-ratelimit-reset"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(remaining, 0.0), max(reset, 0.0)
+
+
+def _record_acquire(context: str, wait: float, tokens: float) -> None:
+    """Update metrics and logs for one token reservation.
+
+    Args:
+        context (str): Label for Prometheus/logging context.
+        wait (float): Seconds the caller will wait for its token.
+        tokens (float): Token balance after the reservation.
+
+    """
+    blocked_counter, tokens_gauge = _context_metrics(context)
+    if wait > 0:
+        blocked_counter.inc()
+        logger.info(
+            "[ctx:%s] Rate limit hit. Sleeping for %.2f seconds.", _hash_context(context), wait
+        )
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[ctx:%s] Token consumed. Remaining: %.2f", _hash_context(context), tokens)
+    tokens_gauge.set(max(tokens, 0.0))
+
+
+class _TokenBucket:
+    """Token bucket state shared by the blocking and asyncio limiters.
+
+    When the bucket is empty, tokens are borrowed against future refills, so
+    waiting callers are served in the order they reserved.
+    """
+
+    def __init__(self, max_requests: int, time_window: float, capacity: int | None = None) -> None:
+        """Initialize a full bucket.
 
         Args:
             max_requests (int): Maximum number of requests allowed.
             time_window (float): Time window in seconds.
+            capacity (Optional[int]): Burst size (tokens the bucket holds);
+                defaults to max_requests.
 
         Raises:
-            ValueError: If max_requests or time_window is non-positive.
+            ValueError: If max_requests, time_window, or capacity is non-positive.
 
         """
         if max_requests <= 0:
             raise ValueError("max_requests must be greater than 0")
         if time_window <= 0:
             raise ValueError("time_window must be greater than 0")
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
 
         self._max_requests = max_requests
         self._time_window = time_window
-        self._tokens: float = float(max_requests)
-        self._last_check: float = time.time()
+        self._capacity: float = float(capacity or max_requests)
+        self._refill_rate: float = max_requests / time_window
+        self._tokens: float = self._capacity
+        self._last_check: float = time.monotonic()
         self._lock = threading.Lock()
 
+    def _reserve(self) -> tuple[float, float]:
+        """Refill the bucket and take one token, possibly going into debt.
+
+        Returns:
+            tuple[float, float]: Seconds to wait before the token may be used,
+            and the token balance after the reservation.
+
+        """
+        with self._lock:
+            tokens = self._refill(time.monotonic()) - 1
+            self._tokens = tokens
+        return (-tokens / self._refill_rate if tokens < 0 else 0.0), tokens
+
+    def _refill(self, now: float) -> float:
+        """Add tokens accrued since the last check; the caller must hold the lock.
+
+        Args:
+            now (float): Current time.monotonic() value.
+
+        Returns:
+            float: Token balance after the refill.
+
+        """
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_check) * self._refill_rate
+        )
+        self._last_check = now
+        return self._tokens
+
+    def _refund(self) -> None:
+        """Return a reserved token that will not be used."""
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + 1)
+
+    def saturation(self) -> float:
+        """Return how much of the burst capacity is currently in use.
+
+        Returns:
+            float: 0.0 for a full bucket, 1.0 for an empty one; above 1.0 when
+            callers are queued waiting for future refills.
+
+        """
+        with self._lock:
+            tokens = self._tokens + (time.monotonic() - self._last_check) * self._refill_rate
+            return 1.0 - min(self._capacity, tokens) / self._capacity
+
+
+class RateLimiter(_TokenBucket):
+    """Thread-safe token bucket rate limiter with Prometheus integration.
+
+    Allows a maximum number of requests in a defined time window. With a
+    shared `backend`, the bucket lives in that store (one budget for every
+    replica using the same key) and tokens are leased from it `lease_size`
+    at a time. Leased tokens expire after one time window so an idle replica
+    cannot hoard the budget. If the backend fails, the limiter falls back to
+    its local bucket and skips the backend for `backend_retry_after` seconds.
+
+    With `adaptive=True`, `observe()` feeds provider responses back into the
+    refill rate: a 429 halves it (at most once per token interval) and
+    honours Retry-After, X-RateLimit-Remaining/Reset cap it at the quota the
+    provider reports, and each success adds back a small step, up to
+    `max_rate`.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: float,
+        backend: RateLimitBackend | None = None,
+        key: str = "default",
+        lease_size: int | None = None,
+        capacity: int | None = None,
+        adaptive: bool = False,
+        max_rate: float | None = None,
+        backend_retry_after: float = 30.0,
+    ) -> None:
+        """Initialize a new RateLimiter instance.
+
+        Args:
+            max_requests (int): Maximum number of requests allowed.
+            time_window (float): Time window in seconds.
+            backend (Optional[RateLimitBackend]): Shared token store; None keeps
+                the bucket in this process.
+            key (str): Bucket key in the shared store (e.g., the provider name).
+            lease_size (Optional[int]): Tokens taken from the backend per round
+                trip; defaults to 10% of max_requests (between 1 and 100).
+            capacity (Optional[int]): Burst size; defaults to max_requests.
+            adaptive (bool): Adjust the refill rate from `observe()` feedback.
+            max_rate (Optional[float]): Upper bound in requests per second for
+                an adaptive limiter; defaults to max_requests / time_window.
+            backend_retry_after (float): Seconds to use the local bucket after
+                a backend failure before trying the backend again.
+
+        Raises:
+            ValueError: If max_requests, time_window, or capacity is non-positive.
+
+        """
+        super().__init__(max_requests, time_window, capacity)
+        self._backend = backend
+        self._key = key
+        self._lease_size = lease_size or min(max(1, max_requests // 10), 100)
+        self._leased = 0
+        self._lease_expires_at = 0.0
+        self._backend_retry_after = backend_retry_after
+        self._backend_down_until = 0.0
+
+        self._adaptive = adaptive
+        self._base_rate = self._refill_rate
+        self._min_rate = self._base_rate * ADAPTIVE_MIN_FRACTION
+        self._max_rate = max(max_rate or self._base_rate, self._base_rate)
+        self._backoff_until = 0.0
+        self._paused_until = 0.0
+        if adaptive:
+            record_rate_limiter_effective_rate(key, self._refill_rate)
+
+    @property
+    def effective_rate(self) -> float:
+        """Return the current refill rate in requests per second."""
+        return self._refill_rate
+
+    def observe(self, status_code: int, headers: Mapping[str, str] | None = None) -> None:
+        """Adapt the refill rate to a provider response (no-op unless adaptive).
+
+        Args:
+            status_code (int): HTTP status code of the response.
+            headers (Optional[Mapping[str, str]]): Response headers.
+
+        Returns:
+            None
+
+        """
+        if not self._adaptive:
+            return
+
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        quota = _parse_quota(headers)
+        throttled = status_code == 429
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            rate = self._refill_rate
+            if throttled:
+                if now >= self._backoff_until:
+                    rate = max(self._min_rate, rate * ADAPTIVE_DECREASE_FACTOR)
+                    self._backoff_until = now + 1 / rate
+                pause = parse_retry_after(headers.get("retry-after"))
+            else:
+                if 200 <= status_code < 300 and now >= self._backoff_until:
+                    rate = min(self._max_rate, rate + self._base_rate * ADAPTIVE_INCREASE_FRACTION)
+                pause = None
+
+            if quota is not None:
+                remaining, reset = quota
+                if reset > 0:
+                    rate = max(self._min_rate, min(rate, remaining / reset))
+                if remaining < 1:
+                    pause = max(pause or 0.0, reset)
+
+            self._refill_rate = rate
+            if pause:
+                # Hold the next reservation back until the provider's pause ends.
+                self._tokens = min(self._tokens, 1.0 - pause * rate)
+                self._paused_until = max(self._paused_until, now + pause)
+
+        if throttled:
+            logger.warning(
+                "⚠️ [%s] Throttled by provider; rate now %.3f req/s (pause %.1fs)",
+                self._key,
+                rate,
+                pause or 0.0,
+            )
+        record_rate_limiter_effective_rate(self._key, rate)
+
     def acquire(self, context: str = "RateLimiter") -> None:
         """Acquire a token, blocking if rate limit is exceeded.
 
-        Replenishes tokens based on elapsed time. Updates Prometheus metrics
-        and logs token state per context.
+        The reservation is made under the lock; any wait happens after the
+        lock is released. Updates Prometheus metrics per context.
 
         Args:
             context (str): Label for Prometheus/logging context.
@@ -97,38 +352,100 @@ class RateLimiter:
             None
 
         """
-        context_label = _sanitize_context(context)
-        context_id = _hash_context(context)
+        if self._backend is not None and time.monotonic() >= self._backend_down_until:
+            if self._acquire_shared(self._backend, context):
+                return
 
-        with self._lock:
-            current_time = time.time()
-            elapsed = current_time - self._last_check
-            self._last_check = current_time
-
-            # Replenish tokens based on elapsed time
-            refill_rate = self._max_requests / self._time_window
-            tokens_to_add = elapsed * refill_rate
-            self._tokens = min(self._max_requests, self._tokens + tokens_to_add)
-
-            rate_limiter_tokens_remaining.labels(context=context_label).set(self._tokens)
-            logger.debug(
-                f"[ctx:{context_id}] Replenished {tokens_to_add:.2f} tokens. "
-                f"Available: {self._tokens:.2f}"
-            )
+        wait, tokens = self._reserve()
+        _record_acquire(context, wait, tokens)
+        if wait > 0:
+            time.sleep(wait)
 
-            # If no tokens available, sleep and refill one
-            if self._tokens < 1:
-                sleep_time = (1 - self._tokens) / refill_rate
-                sleep_time = min(sleep_time, self._time_window)
+    def _acquire_shared(self, backend: RateLimitBackend, context: str) -> bool:
+        """Acquire a token from the local lease, refilling it from the backend.
 
-                logger.info(
-                    f"[ctx:{context_id}] Rate limit hit. Sleeping for {sleep_time:.2f} seconds."
+        Args:
+            backend (RateLimitBackend): Shared token bucket to lease from.
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            bool: True if a token was acquired, False if the backend failed and
+            the caller should use the local bucket.
+
+        """
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            _record_acquire(context, pause, 0.0)
+            time.sleep(pause)
+
+        while (remaining := self._take_leased()) is None:
+            try:
+                granted, wait = backend.reserve(
+                    self._key, self._lease_size, self._capacity, self._refill_rate
+                )
+            except Exception as e:
+                self._backend_down_until = time.monotonic() + self._backend_retry_after
+                logger.warning(
+                    "⚠️ Rate limit backend unavailable, using local bucket for %.0fs: %s",
+                    self._backend_retry_after,
+                    e,
                 )
-                rate_limiter_blocked_total.labels(context=context_label).inc()
-                time.sleep(sleep_time)
-                self._tokens = 1.0  # Ensure 1 token is available after sleep
-
-            # Consume a token
-            self._tokens -= 1
-            rate_limiter_tokens_remaining.labels(context=context_label).set(self._tokens)
-            logger.debug(f"[ctx:{context_id}] Token consumed. Remaining: {self._tokens:.2f}")
+                return False
+
+            if granted:
+                with self._lock:
+                    self._leased += granted
+                    self._lease_expires_at = time.monotonic() + self._time_window
+                continue
+            with self._lock:
+                # Mirror the shared balance so saturation() and the local fallback see it.
+                self._tokens = 1.0 - wait * self._refill_rate
+                self._last_check = time.monotonic()
+            _record_acquire(context, wait, 0.0)
+            time.sleep(wait)
+
+        _record_acquire(context, 0.0, remaining)
+        return True
+
+    def _take_leased(self) -> int | None:
+        """Take one token from the local lease.
+
+        Returns:
+            Optional[int]: Leased tokens left after taking one, or None if the
+            lease is empty or expired.
+
+        """
+        with self._lock:
+            if self._leased and time.monotonic() < self._lease_expires_at:
+                self._leased -= 1
+                return self._leased
+            self._leased = 0
+            return None
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """Token bucket rate limiter for asyncio code.
+
+    `await acquire()` suspends only the calling coroutine. Waiters resume in
+    the order they called `acquire`, so many coroutines can share one budget
+    fairly. A waiter that is cancelled gives its token back.
+    """
+
+    async def acquire(self, context: str = "RateLimiter") -> None:
+        """Acquire a token, waiting without blocking the event loop if needed.
+
+        Args:
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            None
+
+        """
+        wait, tokens = self._reserve()
+        _record_acquire(context, wait, tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund()
+                raise
@@ -0,0 +1,189 @@
+"""Shared token-bucket stores for rate limiting across processes and replicas.
+
+A backend holds the authoritative bucket for a key (typically one provider
+API key) and hands out tokens atomically. `RateLimiter` leases tokens from
+it in batches so most `acquire` calls never leave the process.
+
+- InMemoryBackend: process-local store, for tests and single-replica use
+- RedisBackend: one budget shared by every replica, updated by a Lua script
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import redis
+except ImportError:
+    redis = None  # Required only for RATE_LIMIT_BACKEND=redis
+
+# Atomically refill the bucket at KEYS[1] and take up to ARGV[3] tokens.
+# Uses the Redis server clock so replicas with skewed clocks agree.
+# Returns {granted, seconds until one token is available (as a string)}.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+local wait = 0
+if granted == 0 then
+    wait = (1 - tokens) / rate
+end
+return {granted, tostring(wait)}
+"""
+
+
+class RateLimitBackend(ABC):
+    """Base class for token stores shared by rate limiters."""
+
+    @abstractmethod
+    def reserve(
+        self, key: str, requested: int, capacity: float, refill_rate: float
+    ) -> tuple[int, float]:
+        """Refill the bucket for a key and take up to `requested` tokens.
+
+        Args:
+            key (str): Bucket identifier.
+            requested (int): Tokens wanted.
+            capacity (float): Bucket size (burst limit).
+            refill_rate (float): Tokens added per second.
+
+        Returns:
+            tuple[int, float]: Tokens granted, and seconds until one token is
+            available when none were granted (0.0 otherwise).
+
+        """
+
+
+class InMemoryBackend(RateLimitBackend):
+    """Process-local backend with the same semantics as RedisBackend."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self, key: str, requested: int, capacity: float, refill_rate: float
+    ) -> tuple[int, float]:
+        """Refill the bucket for a key and take up to `requested` tokens.
+
+        Args:
+            key (str): Bucket identifier.
+            requested (int): Tokens wanted.
+            capacity (float): Bucket size (burst limit).
+            refill_rate (float): Tokens added per second.
+
+        Returns:
+            tuple[int, float]: Tokens granted, and seconds until one token is
+            available when none were granted (0.0 otherwise).
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - last) * refill_rate)
+            granted = min(requested, int(tokens))
+            tokens -= granted
+            self._buckets[key] = (tokens, now)
+        return granted, (0.0 if granted else (1 - tokens) / refill_rate)
+
+
+class RedisBackend(RateLimitBackend):
+    """Redis-backed token bucket enforcing one budget across all replicas."""
+
+    def __init__(self, client: Any, prefix: str = "ratelimit:") -> None:
+        """Initialize the backend.
+
+        Args:
+            client (Any): A redis.Redis client.
+            prefix (str): Prefix for bucket keys.
+
+        """
+        self._client = client
+        self._prefix = prefix
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "ratelimit:", timeout: float = 0.5) -> "RedisBackend":
+        """Create a backend from a Redis URL.
+
+        Args:
+            url (str): Redis connection URL (e.g., "redis://localhost:6379/0").
+            prefix (str): Prefix for bucket keys.
+            timeout (float): Connect and socket timeout in seconds, so an
+                unreachable Redis fails fast instead of stalling `acquire`.
+
+        Returns:
+            RedisBackend: Backend using a pooled client.
+
+        Raises:
+            RuntimeError: If the redis package is not installed.
+
+        """
+        if redis is None:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package.")
+        client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        return cls(client, prefix)
+
+    def reserve(
+        self, key: str, requested: int, capacity: float, refill_rate: float
+    ) -> tuple[int, float]:
+        """Refill the bucket for a key and take up to `requested` tokens in one round trip.
+
+        Args:
+            key (str): Bucket identifier.
+            requested (int): Tokens wanted.
+            capacity (float): Bucket size (burst limit).
+            refill_rate (float): Tokens added per second.
+
+        Returns:
+            tuple[int, float]: Tokens granted, and seconds until one token is
+            available when none were granted (0.0 otherwise).
+
+        """
+        granted, wait = self._script(
+            keys=[self._prefix + key], args=[capacity, refill_rate, requested]
+        )
+        if isinstance(wait, bytes):
+            wait = wait.decode()
+        return int(granted), float(wait)
+
+
+def create_backend(
+    kind: str, redis_url: str | None = None, timeout: float = 0.5
+) -> RateLimitBackend | None:
+    """Create a backend by name.
+
+    Args:
+        kind (str): 'local' (no shared backend), 'memory', or 'redis'.
+        redis_url (Optional[str]): Connection URL, required for 'redis'.
+        timeout (float): Redis connect and socket timeout in seconds.
+
+    Returns:
+        Optional[RateLimitBackend]: The backend, or None for 'local'.
+
+    Raises:
+        ValueError: If the kind is unknown or a Redis URL is missing.
+
+    """
+    kind = kind.lower()
+    if kind == "local":
+        return None
+    if kind == "memory":
+        return InMemoryBackend()
+    if kind == "redis":
+        if not redis_url:
+            raise ValueError("RATE_LIMIT_BACKEND=redis requires RATE_LIMIT_REDIS_URL.")
+        return RedisBackend.from_url(redis_url, timeout=timeout)
+    raise ValueError(f"Unsupported RATE_LIMIT_BACKEND: {kind}")
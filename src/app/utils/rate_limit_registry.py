@@ -0,0 +1,208 @@
+"""Per-provider rate limiters built lazily from `config_shared`.
+
+A multi-source poller calls `acquire("polygon")`, `acquire("finnhub")`, ...
+and each API is paced by its own token bucket. Limits come from the
+provider's `get_*_rate_limit()` getter, burst capacity from
+`<PROVIDER>_RATE_LIMIT_BURST` (or the getter itself for NewsAPI), and the
+bucket store from RATE_LIMIT_BACKEND so replicas can share each budget. With
+RATE_LIMIT_ADAPTIVE enabled, limiters tune their rate from the responses
+passed to `request_with_timeout(..., rate_limiter=registry.get(provider))`.
+"""
+
+import threading
+from functools import lru_cache
+
+from app import config_shared
+from app.utils.metrics import record_rate_limiter_saturation
+from app.utils.rate_limit import RateLimiter
+from app.utils.rate_limit_backends import RateLimitBackend, create_backend
+
+# Provider -> (config_shared getter, time window in seconds the limit applies to).
+# A getter returns either a request count or (request count, burst capacity).
+PROVIDER_LIMITS: dict[str, tuple[str, float]] = {
+    "alpha_vantage": ("get_alpha_vantage_fill_rate_limit", 60),
+    "barchart": ("get_barchart_fill_rate_limit", 60),
+    "benzinga": ("get_benzinga_fill_rate_limit", 60),
+    "coinapi": ("get_coinapi_fill_rate_limit", 60),
+    "coingecko": ("get_coingecko_fill_rate_limit", 1),
+    "coinmarketcap": ("get_coinmarketcap_fill_rate_limit", 60),
+    "crypto": ("get_crypto_rate_limit", 1),
+    "cryptocompare": ("get_cryptocompare_fill_rate_limit", 60),
+    "finnazon": ("get_finnazon_fill_rate_limit", 60),
+    "finnhub": ("get_finnhub_fill_rate_limit", 60),
+    "iex": ("get_iex_fill_rate_limit", 60),
+    "intrinio": ("get_intrinio_fill_rate_limit", 60),
+    "morningstar": ("get_morningstar_fill_rate_limit", 60),
+    "newsapi": ("get_newsapi_rate_limit", 1),
+    "polygon": ("get_polygon_fill_rate_limit", 60),
+    "quandl": ("get_quandl_fill_rate_limit", 60),
+    "seekingalpha": ("get_seekingalpha_fill_rate_limit", 60),
+    "sentimentinvestor": ("get_sentimentinvestor_fill_rate_limit", 60),
+    "twelvedata": ("get_twelvedata_fill_rate_limit", 60),
+    "yfinance": ("get_yfinance_fill_rate_limit", 60),
+}
+
+
+class RateLimiterRegistry:
+    """Thread-safe registry holding one `RateLimiter` per provider.
+
+    Limiters are created on first use, so only the providers a service
+    actually calls read their configuration.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend | None = None,
+        limits: dict[str, tuple[str, float]] | None = None,
+        adaptive: bool = False,
+        backend_retry_after: float = 30.0,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            backend (Optional[RateLimitBackend]): Shared token store for every
+                limiter; None keeps buckets in this process.
+            limits (Optional[dict]): Provider table; defaults to PROVIDER_LIMITS.
+            adaptive (bool): Build limiters that adapt to provider feedback.
+            backend_retry_after (float): Seconds limiters use their local bucket
+                after a backend failure.
+
+        """
+        self._backend = backend
+        self._adaptive = adaptive
+        self._backend_retry_after = backend_retry_after
+        self._limits = dict(PROVIDER_LIMITS if limits is None else limits)
+        self._limiters: dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, provider: str, max_requests: int, time_window: float, capacity: int | None = None
+    ) -> RateLimiter:
+        """Create (or replace) the limiter for a provider with explicit limits.
+
+        Args:
+            provider (str): Provider name.
+            max_requests (int): Requests allowed per time window (refill rate).
+            time_window (float): Time window in seconds.
+            capacity (Optional[int]): Burst size; defaults to max_requests.
+
+        Returns:
+            RateLimiter: The registered limiter.
+
+        """
+        provider = provider.lower()
+        limiter = RateLimiter(
+            max_requests,
+            time_window,
+            backend=self._backend,
+            key=provider,
+            capacity=capacity,
+            adaptive=self._adaptive,
+            backend_retry_after=self._backend_retry_after,
+        )
+        with self._lock:
+            self._limiters[provider] = limiter
+        return limiter
+
+    def get(self, provider: str) -> RateLimiter:
+        """Return the limiter for a provider, building it from config on first use.
+
+        Args:
+            provider (str): Provider name (e.g., "polygon").
+
+        Returns:
+            RateLimiter: The provider's limiter.
+
+        Raises:
+            ValueError: If the provider is unknown and was never registered.
+
+        """
+        provider = provider.lower()
+        limiter = self._limiters.get(provider)
+        if limiter is not None:
+            return limiter
+
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limiter = self._build(provider)
+                self._limiters[provider] = limiter
+        return limiter
+
+    def acquire(self, provider: str) -> None:
+        """Wait for a token from a provider's limiter and record its saturation.
+
+        Args:
+            provider (str): Provider name (e.g., "polygon").
+
+        Returns:
+            None
+
+        """
+        limiter = self.get(provider)
+        limiter.acquire(context=provider.lower())
+        record_rate_limiter_saturation(provider.lower(), limiter.saturation())
+
+    def saturation(self) -> dict[str, float]:
+        """Report and record the saturation of every limiter built so far.
+
+        Returns:
+            dict[str, float]: Provider name to fraction of burst capacity in use.
+
+        """
+        with self._lock:
+            limiters = list(self._limiters.items())
+        report = {provider: limiter.saturation() for provider, limiter in limiters}
+        for provider, value in report.items():
+            record_rate_limiter_saturation(provider, value)
+        return report
+
+    def _build(self, provider: str) -> RateLimiter:
+        """Build a provider's limiter from its config getter.
+
+        Args:
+            provider (str): Lower-case provider name.
+
+        Returns:
+            RateLimiter: A new limiter for the provider.
+
+        Raises:
+            ValueError: If the provider is unknown.
+
+        """
+        if provider not in self._limits:
+            raise ValueError(f"No rate limit configured for provider: {provider}")
+
+        getter, time_window = self._limits[provider]
+        limit = getattr(config_shared, getter)()
+        max_requests, capacity = limit if isinstance(limit, tuple) else (limit, 0)
+        capacity = capacity or config_shared.get_rate_limit_burst(provider)
+        return RateLimiter(
+            max_requests,
+            time_window,
+            backend=self._backend,
+            key=provider,
+            capacity=capacity or None,
+            adaptive=self._adaptive,
+            backend_retry_after=self._backend_retry_after,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Return the process-wide registry, using the configured RATE_LIMIT_BACKEND.
+
+    Returns:
+        RateLimiterRegistry: Shared registry instance.
+
+    """
+    backend = create_backend(
+        config_shared.get_rate_limit_backend(),
+        config_shared.get_rate_limit_redis_url(),
+        timeout=config_shared.get_rate_limit_redis_timeout(),
+    )
+    return RateLimiterRegistry(
+        backend=backend,
+        adaptive=config_shared.get_rate_limit_adaptive(),
+        backend_retry_after=config_shared.get_rate_limit_backend_retry_seconds(),
+    )
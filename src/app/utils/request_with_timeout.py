@@ -2,23 +2,31 @@
 
 Safely requests JSON data from a URL with a configurable timeout.
 Handles timeouts, HTTP errors, invalid responses, and logs failures.
+An optional rate limiter paces the request and learns from the response.
 """
 
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 
+from app.utils.rate_limit import RateLimiter
 from app.utils.setup_logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def request_with_timeout(url: str, timeout: int = 10) -> dict[str, Any] | None:
+def request_with_timeout(
+    url: str, timeout: int = 10, rate_limiter: RateLimiter | None = None
+) -> dict[str, Any] | None:
     """Perform a GET request to the specified URL with a timeout.
 
     Args:
         url (str): The URL to request.
         timeout (int, optional): Timeout in seconds (default is 10).
+        rate_limiter (RateLimiter, optional): Limiter to acquire a token from
+            before the request; the response status and rate-limit headers
+            are passed to its `observe()`.
 
     Returns:
         dict[str, Any] | None: Parsed JSON response if successful, else None.
@@ -33,7 +41,11 @@ def request_with_timeout(url: str, timeout: int = 10) -> dict[str, Any] | None:
 
     try:
         logger.debug(f"🔗 Sending GET request to {url} with timeout={timeout}")
+        if rate_limiter is not None:
+            rate_limiter.acquire(context=urlsplit(url).netloc or url)
         response = requests.get(url, timeout=timeout)
+        if rate_limiter is not None:
+            rate_limiter.observe(response.status_code, response.headers)
         response.raise_for_status()
 
         content_type = response.headers.get("Content-Type", "")
@@ -0,0 +1,427 @@
+"""Streaming record encoders for S3 output objects.
+
+Each encoder turns batches of records into the bytes of one object
+incrementally: `encode()` may be called many times and returns whatever
+output is ready, and `finish()` returns the trailer. Supported formats:
+
+- json: a single JSON array (the original S3 output format)
+- ndjson: newline-delimited JSON, optionally gzip- or zstd-compressed
+- parquet: columnar Parquet (requires pyarrow) with a schema derived from
+  `ValidatedMessage` and `TradeEvent`; other fields go to an `extra` JSON column
+"""
+
+import typing
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from app.utils import serialization
+from app.utils.types import TradeEvent, ValidatedMessage
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]  # Required only for S3_OUTPUT_FORMAT=ndjson.zst
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None  # Required only for S3_OUTPUT_FORMAT=parquet
+
+SUPPORTED_FORMATS = ("json", "ndjson", "ndjson.gz", "ndjson.zst", "parquet")
+
+
+class RecordEncoder(ABC):
+    """Base class for incremental object encoders."""
+
+    extension = ".json"
+    content_type = "application/json"
+    content_encoding: str | None = None
+
+    @abstractmethod
+    def encode(self, records: list[dict[str, Any]]) -> bytes:
+        """Encode a batch of records.
+
+        Args:
+            records (list[dict[str, Any]]): Records to append to the object.
+
+        Returns:
+            bytes: Encoded output that is ready to be written (may be empty).
+
+        """
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Complete the object.
+
+        Returns:
+            bytes: Remaining output, including any trailer.
+
+        """
+
+
+class JSONArrayEncoder(RecordEncoder):
+    """Encode records as one JSON array."""
+
+    def __init__(self) -> None:
+        """Initialize an empty array."""
+        self._count = 0
+
+    def encode(self, records: list[dict[str, Any]]) -> bytes:
+        """Append records to the array.
+
+        Args:
+            records (list[dict[str, Any]]): Records to append.
+
+        Returns:
+            bytes: Encoded array elements, preceded by "[" or "," as needed.
+
+        """
+        if not records:
+            return b""
+        body = b",".join(serialization.dumps(record) for record in records)
+        prefix = b"," if self._count else b"["
+        self._count += len(records)
+        return prefix + body
+
+    def finish(self) -> bytes:
+        """Close the array.
+
+        Returns:
+            bytes: The closing bracket, or "[]" if no records were written.
+
+        """
+        return b"]" if self._count else b"[]"
+
+
+class NDJSONEncoder(RecordEncoder):
+    """Encode records as newline-delimited JSON with optional gzip or zstd compression."""
+
+    extension = ".ndjson"
+    content_type = "application/x-ndjson"
+
+    def __init__(self, compression: str | None = None) -> None:
+        """Initialize the encoder.
+
+        Args:
+            compression (Optional[str]): None, "gzip", or "zstd".
+
+        Raises:
+            RuntimeError: If zstd is requested but zstandard is not installed.
+            ValueError: If the compression is not supported.
+
+        """
+        self._compressor: Any = None
+        if compression == "gzip":
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            self.extension, self.content_encoding = ".ndjson.gz", "gzip"
+        elif compression == "zstd":
+            if zstandard is None:
+                raise RuntimeError("S3_OUTPUT_FORMAT=ndjson.zst requires the 'zstandard' package.")
+            self._compressor = zstandard.ZstdCompressor().compressobj()
+            self.extension, self.content_encoding = ".ndjson.zst", "zstd"
+        elif compression is not None:
+            raise ValueError(f"Unsupported NDJSON compression: {compression}")
+
+    def encode(self, records: list[dict[str, Any]]) -> bytes:
+        """Encode records as JSON lines.
+
+        Args:
+            records (list[dict[str, Any]]): Records to append.
+
+        Returns:
+            bytes: Encoded (and possibly compressed) lines.
+
+        """
+        if not records:
+            return b""
+        lines = b"".join(serialization.dumps(record) + b"\n" for record in records)
+        if self._compressor is None:
+            return lines
+        compressed: bytes = self._compressor.compress(lines)
+        return compressed
+
+    def finish(self) -> bytes:
+        """Flush the compressor.
+
+        Returns:
+            bytes: Remaining compressed output, or b"" when uncompressed.
+
+        """
+        if self._compressor is None:
+            return b""
+        flushed: bytes = self._compressor.flush()
+        return flushed
+
+
+def _arrow_type(annotation: Any) -> Any:
+    """Map a TypedDict field annotation to an Arrow type.
+
+    Args:
+        annotation (Any): Field type annotation.
+
+    Returns:
+        pyarrow.DataType: Arrow type; nested values are stored as JSON strings.
+
+    """
+    if annotation is float:
+        return pyarrow.float64()
+    if annotation is int:
+        return pyarrow.int64()
+    if annotation is bool:
+        return pyarrow.bool_()
+    return pyarrow.string()
+
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _to_float(value: Any) -> float:
+    """Convert a number or numeric string for a float64 column."""
+    if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f"cannot store {type(value).__name__} as float64")
+
+
+def _to_int(value: Any) -> int:
+    """Convert an integral number or numeric string for an int64 column."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise TypeError(f"cannot store {type(value).__name__} as int64")
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value!r} is not integral")
+    number = int(value)
+    if not _INT64_MIN <= number <= _INT64_MAX:
+        raise OverflowError(f"{value!r} is out of int64 range")
+    return number
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a bool, 0/1, or 'true'/'false' string for a boolean column."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _to_string(value: Any) -> str:
+    """Pass strings through and JSON-encode anything else for a string column."""
+    return value if isinstance(value, str) else serialization.dumps_str(value)
+
+
+def _column_converter(arrow_type: Any) -> Callable[[Any], Any]:
+    """Return the function converting values for a column of the given Arrow type.
+
+    Args:
+        arrow_type (pyarrow.DataType): Column type from `output_schema()`.
+
+    Returns:
+        Callable[[Any], Any]: Converter raising TypeError, ValueError, or
+        OverflowError for values the column cannot hold.
+
+    """
+    if pyarrow.types.is_floating(arrow_type):
+        return _to_float
+    if pyarrow.types.is_integer(arrow_type):
+        return _to_int
+    if pyarrow.types.is_boolean(arrow_type):
+        return _to_bool
+    return _to_string
+
+
+def output_schema() -> Any:
+    """Build the Parquet schema for output records.
+
+    Fields come from `ValidatedMessage` and `TradeEvent`, plus an `extra`
+    column holding any other fields as JSON.
+
+    Returns:
+        pyarrow.Schema: Output schema.
+
+    """
+    fields: dict[str, Any] = {}
+    for typed_dict in (ValidatedMessage, TradeEvent):
+        for name, annotation in typing.get_type_hints(typed_dict).items():
+            fields.setdefault(name, _arrow_type(annotation))
+    fields["extra"] = pyarrow.string()
+    return pyarrow.schema(list(fields.items()))
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back in chunks.
+
+    Unlike a truncated BytesIO, `tell()` keeps counting from the start of the
+    file, which the Parquet writer relies on for footer offsets.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        """Append bytes to the sink."""
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        """Return the total number of bytes written."""
+        return self._position
+
+    def writable(self) -> bool:
+        """Report that the sink is writable."""
+        return True
+
+    def flush(self) -> None:
+        """No-op; data is held in memory until drained."""
+
+    def close(self) -> None:
+        """Mark the sink closed."""
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Return and discard the bytes written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ParquetEncoder(RecordEncoder):
+    """Encode records as a Parquet file, one row group per `row_group_size` records."""
+
+    extension = ".parquet"
+    content_type = "application/vnd.apache.parquet"
+
+    def __init__(self, compression: str = "zstd", row_group_size: int = 10000) -> None:
+        """Initialize the encoder.
+
+        Args:
+            compression (str): Parquet column compression codec.
+            row_group_size (int): Records buffered before a row group is written.
+
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+
+        """
+        if pyarrow is None:
+            raise RuntimeError("S3_OUTPUT_FORMAT=parquet requires the 'pyarrow' package.")
+        self.schema = output_schema()
+        self.row_group_size = row_group_size
+        self._converters = {
+            field.name: _column_converter(field.type)
+            for field in self.schema
+            if field.name != "extra"
+        }
+        self._rows: list[dict[str, Any]] = []
+        self._sink = _ChunkSink()
+        self._writer = pyarrow.parquet.ParquetWriter(
+            self._sink, self.schema, compression=compression
+        )
+
+    def encode(self, records: list[dict[str, Any]]) -> bytes:
+        """Buffer records, writing full row groups.
+
+        Args:
+            records (list[dict[str, Any]]): Records to append.
+
+        Returns:
+            bytes: Parquet bytes written so far and not yet returned.
+
+        """
+        self._rows.extend(self._to_row(record) for record in records)
+        while len(self._rows) >= self.row_group_size:
+            self._write_row_group(self._rows[: self.row_group_size])
+            self._rows = self._rows[self.row_group_size :]
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        """Write the remaining rows and the Parquet footer.
+
+        Returns:
+            bytes: Remaining Parquet bytes.
+
+        """
+        if self._rows:
+            self._write_row_group(self._rows)
+            self._rows = []
+        self._writer.close()
+        return self._sink.drain()
+
+    def _to_row(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Project a record onto the schema columns, converting each value to its column type.
+
+        Numeric strings are cast for numeric columns and nested values are
+        JSON-encoded for string columns. A value its column cannot hold is
+        stored as null and kept, unchanged, in `extra`, so one bad field does
+        not fail the whole object.
+
+        Args:
+            record (dict[str, Any]): Output record.
+
+        Returns:
+            dict[str, Any]: Row matching the schema, with unknown and unconvertible
+            fields in `extra`.
+
+        """
+        row: dict[str, Any] = {}
+        extra: dict[str, Any] = {}
+        for name, convert in self._converters.items():
+            value = record.get(name)
+            if value is not None:
+                try:
+                    value = convert(value)
+                except (TypeError, ValueError, OverflowError):
+                    extra[name] = value
+                    value = None
+            row[name] = value
+        extra.update((key, value) for key, value in record.items() if key not in row)
+        row["extra"] = serialization.dumps_str(extra) if extra else None
+        return row
+
+    def _write_row_group(self, rows: list[dict[str, Any]]) -> None:
+        """Write rows as one Parquet row group.
+
+        Args:
+            rows (list[dict[str, Any]]): Rows matching the schema.
+
+        """
+        self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+
+
+def get_encoder(output_format: str) -> RecordEncoder:
+    """Create a new encoder for an S3 output format.
+
+    Args:
+        output_format (str): One of SUPPORTED_FORMATS.
+
+    Returns:
+        RecordEncoder: Fresh encoder for one object.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    """
+    output_format = output_format.lower()
+    if output_format == "json":
+        return JSONArrayEncoder()
+    if output_format == "ndjson":
+        return NDJSONEncoder()
+    if output_format == "ndjson.gz":
+        return NDJSONEncoder("gzip")
+    if output_format == "ndjson.zst":
+        return NDJSONEncoder("zstd")
+    if output_format == "parquet":
+        return ParquetEncoder()
+    raise ValueError(f"Unsupported S3 output format: {output_format}")
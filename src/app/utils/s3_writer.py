@@ -0,0 +1,453 @@
+"""Buffered S3 writer that batches output records into larger, time-partitioned objects.
+
+Records are encoded as they arrive (see `app.utils.s3_encoders`) and held in
+memory until a size, record count, or age threshold is reached; the buffer is
+then written as a single object under `<prefix>dt=YYYY-MM-DD/hour=HH/`. A
+background thread enforces the age threshold when traffic stops, and `close()`
+flushes whatever is left. Objects that fail to upload are retried, up to a
+retained-bytes cap beyond which the oldest are dropped.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from app.utils.metrics import (
+    record_output_failure,
+    record_s3_flush_metrics,
+    record_s3_part_metrics,
+    record_sink_metrics,
+    s3_buffered_records,
+)
+from app.utils.s3_encoders import RecordEncoder, get_encoder
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# S3 requires every multipart part except the last to be at least 5 MiB.
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class StreamingS3Upload:
+    """Upload one S3 object from a stream of bytes with bounded memory.
+
+    Data is collected into parts of `part_size` bytes. Objects smaller than one
+    part are written with a single PutObject; once the first part fills, the
+    upload switches to a multipart upload and sends parts concurrently, holding
+    at most `max_concurrency` parts in flight plus the part being filled.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the upload without contacting S3.
+
+        Args:
+            client (Any): boto3 S3 client.
+            bucket (str): Target bucket.
+            key (str): Target object key.
+            content_type (str): Content-Type of the object.
+            content_encoding (Optional[str]): Content-Encoding of the object, if any.
+            part_size (int): Part size in bytes (raised to the 5 MiB S3 minimum).
+            max_concurrency (int): Maximum parts uploaded at the same time.
+
+        """
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, S3_MIN_PART_SIZE)
+        self.max_concurrency = max(1, max_concurrency)
+        self._headers: dict[str, str] = {"ContentType": content_type}
+        if content_encoding:
+            self._headers["ContentEncoding"] = content_encoding
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._futures: list[Future[dict[str, Any]]] = []
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total number of bytes written so far."""
+        return self._size
+
+    def write(self, data: bytes) -> None:
+        """Append bytes to the object, uploading every full part.
+
+        Blocks while `max_concurrency` parts are already uploading.
+
+        Args:
+            data (bytes): Next slice of the object.
+
+        """
+        self._buffer += data
+        self._size += len(data)
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            self._submit_part(part)
+
+    def close(self) -> None:
+        """Upload the remaining bytes and complete the object.
+
+        Raises:
+            Exception: If any part or the final request failed; a started
+            multipart upload is aborted first.
+
+        """
+        if self._upload_id is None:
+            self.client.put_object(
+                Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer), **self._headers
+            )
+            self._buffer = bytearray()
+            return
+
+        try:
+            if self._buffer:
+                self._submit_part(bytes(self._buffer))
+                self._buffer = bytearray()
+            parts = [future.result() for future in self._futures]
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._shutdown_executor()
+
+    def abort(self) -> None:
+        """Abort a started multipart upload so S3 discards its parts."""
+        upload_id, self._upload_id = self._upload_id, None
+        self._shutdown_executor()
+        if upload_id is None:
+            return
+        try:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=upload_id)
+        except Exception as e:
+            logger.error("❌ Failed to abort multipart upload %s: %s", self.key, e)
+
+    def _submit_part(self, part: bytes) -> None:
+        """Start the multipart upload if needed and queue one part.
+
+        Args:
+            part (bytes): Part body.
+
+        """
+        if self._upload_id is None:
+            response = self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, **self._headers
+            )
+            self._upload_id = response["UploadId"]
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="s3-part"
+            )
+
+        failed = next((f for f in self._futures if f.done() and f.exception()), None)
+        if failed is not None:
+            error = failed.exception()
+            assert error is not None
+            raise error
+
+        assert self._executor is not None
+        self._slots.acquire()
+        part_number = len(self._futures) + 1
+        future = self._executor.submit(self._upload_part, part_number, part)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    def _upload_part(self, part_number: int, body: bytes) -> dict[str, Any]:
+        """Upload one part, retrying transient failures.
+
+        Args:
+            part_number (int): 1-based part number.
+            body (bytes): Part body.
+
+        Returns:
+            dict[str, Any]: Part entry for CompleteMultipartUpload.
+
+        """
+        start = time.perf_counter()
+        try:
+            response = self.client.upload_part(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+        except Exception:
+            record_s3_part_metrics("failure", len(body), time.perf_counter() - start)
+            raise
+        record_s3_part_metrics("success", len(body), time.perf_counter() - start)
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def _shutdown_executor(self) -> None:
+        """Wait for queued part uploads and release the part upload threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class BufferedS3Writer:
+    """Accumulate records and write them to S3 as one encoded object per flush.
+
+    Thread-safe: batches may be written concurrently from worker threads.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        max_bytes: int = 8 * 1024 * 1024,
+        max_records: int = 10000,
+        max_age: float = 60.0,
+        client: Any = None,
+        output_format: str = "json",
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        max_failed_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            bucket (str): Target S3 bucket.
+            prefix (str): Key prefix for written objects.
+            max_bytes (int): Flush once this many encoded (possibly compressed) bytes
+                are buffered.
+            max_records (int): Flush once this many records are buffered.
+            max_age (float): Flush once the oldest buffered record is this many seconds old.
+            client (Any): boto3 S3 client; created on first flush if omitted.
+            output_format (str): Object format (see `s3_encoders.SUPPORTED_FORMATS`).
+            part_size (int): Multipart part size for objects larger than one part.
+            max_concurrency (int): Maximum concurrent part uploads per object.
+            max_failed_bytes (int): Bytes of failed objects kept for retry; the
+                oldest are dropped once this is exceeded.
+
+        """
+        self.bucket = bucket
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.max_age = max_age
+        self._client = client
+        self.output_format = output_format
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.max_failed_bytes = max_failed_bytes
+        self._lock = threading.Lock()
+        self._encoder: RecordEncoder = get_encoder(output_format)
+        self._chunks: list[bytes] = []
+        self._count = 0
+        self._size = 0
+        self._failed: list[tuple[str, bytes, RecordEncoder, int]] = []
+        self._started_at: float | None = None
+        self._started_wall: datetime | None = None
+        self._stop_event = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Buffer records, writing an object if a size or count threshold is reached.
+
+        Args:
+            records (list[dict[str, Any]]): Records to append.
+
+        """
+        if not records:
+            return
+        with self._lock:
+            if not self._count:
+                self._started_at = time.monotonic()
+                self._started_wall = datetime.now(timezone.utc)
+            chunk = self._encoder.encode(records)
+            self._chunks.append(chunk)
+            self._count += len(records)
+            self._size += len(chunk)
+            s3_buffered_records.set(self._count)
+
+            reason = None
+            if self._size >= self.max_bytes:
+                reason = "bytes"
+            elif self._count >= self.max_records:
+                reason = "records"
+        self._start_flush_thread()
+
+        if reason:
+            self.flush(reason)
+
+    def flush(self, reason: str = "manual") -> None:
+        """Write all buffered records to a single S3 object.
+
+        Objects that fail to upload are kept and retried on the next flush,
+        up to `max_failed_bytes`.
+
+        Args:
+            reason (str): Flush trigger, recorded as a metric label.
+
+        """
+        with self._lock:
+            pending, self._failed = self._failed, []
+            if self._count:
+                encoder, chunks, count = self._encoder, self._chunks, self._count
+                key = self._build_key(self._started_wall or datetime.now(timezone.utc))
+                self._encoder, self._chunks = get_encoder(self.output_format), []
+                self._count, self._size = 0, 0
+                self._started_at, self._started_wall = None, None
+                s3_buffered_records.set(0)
+                pending.append((key, b"".join(chunks) + encoder.finish(), encoder, count))
+
+        for key, body, encoder, count in pending:
+            self._upload(key, body, encoder, count, reason)
+
+    def close(self) -> None:
+        """Stop the age-based flush thread and write any remaining records."""
+        self._stop_event.set()
+        thread = self._flush_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._flush_thread = None
+        self.flush("shutdown")
+
+    def _upload(
+        self, key: str, body: bytes, encoder: RecordEncoder, count: int, reason: str
+    ) -> None:
+        """Upload one encoded object, keeping it for a later retry on failure.
+
+        Args:
+            key (str): Object key.
+            body (bytes): Encoded object.
+            encoder (RecordEncoder): Encoder that produced the body (for content headers).
+            count (int): Number of records in the object.
+            reason (str): Flush trigger, recorded as a metric label.
+
+        """
+        upload = StreamingS3Upload(
+            self._get_client(),
+            self.bucket,
+            key,
+            content_type=encoder.content_type,
+            content_encoding=encoder.content_encoding,
+            part_size=self.part_size,
+            max_concurrency=self.max_concurrency,
+        )
+        start = time.perf_counter()
+        try:
+            upload.write(body)
+            upload.close()
+        except Exception as e:
+            upload.abort()
+            logger.error("❌ Buffered S3 upload failed, keeping %d record(s): %s", count, e)
+            record_sink_metrics("s3", "exception", time.perf_counter() - start, failed=True)
+            self._retain_failed(key, body, encoder, count)
+            return
+
+        record_sink_metrics("s3", "200", time.perf_counter() - start, failed=False)
+        record_s3_flush_metrics(reason, len(body))
+        logger.info("🚚 Uploaded %d buffered record(s) to S3: %s/%s", count, self.bucket, key)
+
+    def _retain_failed(self, key: str, body: bytes, encoder: RecordEncoder, count: int) -> None:
+        """Keep a failed object for retry, dropping the oldest beyond `max_failed_bytes`.
+
+        Args:
+            key (str): Object key.
+            body (bytes): Encoded object.
+            encoder (RecordEncoder): Encoder that produced the body.
+            count (int): Number of records in the object.
+
+        """
+        with self._lock:
+            self._failed.append((key, body, encoder, count))
+            retained = sum(len(entry[1]) for entry in self._failed)
+            dropped = []
+            while retained > self.max_failed_bytes and self._failed:
+                entry = self._failed.pop(0)
+                retained -= len(entry[1])
+                dropped.append(entry)
+
+        for dropped_key, _, _, dropped_count in dropped:
+            record_output_failure("s3", dropped_count)
+            logger.error(
+                "❌ S3 retry buffer full, dropped %d record(s) for %s", dropped_count, dropped_key
+            )
+
+    def _build_key(self, partition_time: datetime) -> str:
+        """Build a time-partitioned object key.
+
+        Args:
+            partition_time (datetime): UTC time of the oldest record in the object.
+
+        Returns:
+            str: Object key under the configured prefix.
+
+        """
+        return (
+            f"{self.prefix}dt={partition_time:%Y-%m-%d}/hour={partition_time:%H}/"
+            f"{partition_time:%Y%m%dT%H%M%S}-{uuid.uuid4().hex}{self._encoder.extension}"
+        )
+
+    def _get_client(self) -> Any:
+        """Return the S3 client, creating it on first use.
+
+        Returns:
+            Any: boto3 S3 client.
+
+        """
+        if self._client is None:
+            import boto3
+
+            self._client = boto3.client("s3")
+        return self._client
+
+    def _start_flush_thread(self) -> None:
+        """Start the daemon thread that enforces the age threshold."""
+        if self.max_age <= 0 or self._stop_event.is_set():
+            return
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        with self._lock:
+            if self._flush_thread is None or not self._flush_thread.is_alive():
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="s3-buffer-flush", daemon=True
+                )
+                self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Flush the buffer when its oldest record reaches the age threshold.
+
+        Objects whose upload failed are retried on the same schedule.
+        """
+        while not self._stop_event.wait(self._seconds_until_due()):
+            started_at = self._started_at
+            if started_at is not None and time.monotonic() - started_at >= self.max_age:
+                self.flush("age")
+            elif self._failed:
+                self.flush("retry")
+
+    def _seconds_until_due(self) -> float:
+        """Compute how long the flush thread can sleep.
+
+        Returns:
+            float: Seconds until the buffer reaches the age threshold, at least 0.1.
+
+        """
+        started_at = self._started_at
+        if started_at is None:
+            return self.max_age
+        return max(started_at + self.max_age - time.monotonic(), 0.1)
@@ -0,0 +1,154 @@
+"""Fast JSON serialization shared by the queue, output, and logging paths.
+
+Uses orjson when installed, then msgspec, and falls back to the standard
+library. Every backend produces compact UTF-8 JSON (no spaces, non-ASCII
+characters kept as-is), and JSON-native values (str, int, finite float, bool,
+None, list, and dict with str keys) decode to the same value whichever
+backend is active. The bytes are not always identical, and the backends
+differ outside that set:
+
+- float exponents are written as 1e-7 by orjson/msgspec and 1e-07 by json
+- NaN and Infinity become null with orjson/msgspec; json writes NaN and
+  Infinity, which strict JSON parsers reject
+- datetime, UUID, and dataclass values are encoded by orjson/msgspec but
+  raise TypeError with json
+- orjson rejects integers outside the 64-bit range
+
+`dumps_pretty` writes the same values indented by two spaces for logs.
+
+Set JSON_BACKEND to 'orjson', 'msgspec', or 'json' to force a backend.
+"""
+
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]  # Optional: fastest backend
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]  # Optional: second choice when orjson is not installed
+
+JSON_BACKEND_SETTING: str = os.getenv("JSON_BACKEND", "auto").lower()
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _select_backend(
+    setting: str,
+) -> tuple[str, Callable[[Any], bytes], Callable[[bytes | bytearray | str], Any]]:
+    """Pick the serialization backend.
+
+    Args:
+        setting (str): 'auto' or an explicit backend name.
+
+    Returns:
+        tuple: Backend name, dumps function, and loads function.
+
+    Raises:
+        ValueError: If the requested backend is unknown or not installed.
+
+    """
+    if setting in ("auto", "orjson") and orjson is not None:
+        return "orjson", _orjson_dumps, orjson.loads
+    if setting in ("auto", "msgspec") and msgspec is not None:
+        return "msgspec", msgspec.json.encode, msgspec.json.decode
+    if setting in ("auto", "json"):
+        return "json", _stdlib_dumps, json.loads
+    raise ValueError(f"JSON_BACKEND '{setting}' is not installed or not supported")
+
+
+BACKEND, _dumps, _loads = _select_backend(JSON_BACKEND_SETTING)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes.
+
+    Args:
+        obj (Any): JSON-serializable object.
+
+    Returns:
+        bytes: Encoded JSON.
+
+    Raises:
+        TypeError: If the object is not JSON-serializable.
+
+    """
+    try:
+        return _dumps(obj)
+    except TypeError:
+        raise
+    except Exception as e:
+        raise TypeError(str(e)) from e
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize an object to a compact JSON string (for APIs that require text).
+
+    Args:
+        obj (Any): JSON-serializable object.
+
+    Returns:
+        str: Encoded JSON.
+
+    """
+    return dumps(obj).decode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object to JSON text indented by two spaces, for logs and consoles.
+
+    Args:
+        obj (Any): JSON-serializable object.
+
+    Returns:
+        str: Indented JSON.
+
+    Raises:
+        TypeError: If the object is not JSON-serializable.
+
+    """
+    if BACKEND == "json":
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    try:
+        if BACKEND == "orjson":
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode()
+        return msgspec.json.format(msgspec.json.encode(obj), indent=2).decode("utf-8")
+    except TypeError:
+        raise
+    except Exception as e:
+        raise TypeError(str(e)) from e
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON from bytes or text.
+
+    Args:
+        data (bytes | bytearray | memoryview | str): Encoded JSON.
+
+    Returns:
+        Any: Decoded object.
+
+    Raises:
+        ValueError: If the input is not valid JSON.
+
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    try:
+        return _loads(data)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(str(e)) from e
@@ -0,0 +1,237 @@
+"""SendMessageBatch and DeleteMessageBatch helpers shared by the SQS backends.
+
+The threaded (`app.queue_sender`, `app.queue_handler`) and asyncio
+(`app.async_queue_sender`, `app.async_queue_handler`) backends only differ in
+how they call SQS; batching, per-entry retry decisions, logging, and metrics
+live here so both behave the same.
+"""
+
+from typing import Any
+
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+from app.utils import message_codec
+from app.utils.metrics import queue_publish_counter, queue_publish_latency, record_ack_metrics
+from app.utils.safe_logger import safe_error
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# SendMessageBatch limits: at most 10 entries and 256 KB of bodies per call.
+SQS_MAX_BATCH_ENTRIES: int = 10
+SQS_MAX_BATCH_BYTES: int = 256 * 1024
+SQS_BATCH_MAX_ATTEMPTS: int = 3
+# Errors raised by a whole SendMessageBatch call; the call is retried, then its
+# entries count as failed.
+SQS_CALL_ERRORS = (BotoCoreError, ClientError, NoCredentialsError)
+
+# DeleteMessageBatch accepts at most 10 entries per call.
+SQS_DELETE_BATCH_SIZE: int = 10
+# Entries that fail for a non-sender reason are sent once more.
+SQS_DELETE_MAX_ATTEMPTS: int = 2
+
+
+def attributes_size(attributes: dict[str, dict[str, str]] | None) -> int:
+    """Return the bytes SQS counts toward the message size for message attributes.
+
+    Args:
+        attributes (Optional[dict[str, dict[str, str]]]): String message attributes.
+
+    Returns:
+        int: Total size of attribute names, data types, and values.
+
+    """
+    if not attributes:
+        return 0
+    return sum(
+        len(name.encode("utf-8"))
+        + len(value["DataType"].encode("utf-8"))
+        + len(value["StringValue"].encode("utf-8"))
+        for name, value in attributes.items()
+    )
+
+
+def chunk_send_entries(
+    bodies: list[str],
+    attributes: list[dict[str, dict[str, str]]] | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Group message bodies into SendMessageBatch-sized chunks.
+
+    Each chunk holds at most SQS_MAX_BATCH_ENTRIES entries and SQS_MAX_BATCH_BYTES
+    of message bodies and attributes. A body larger than the byte limit is placed
+    in its own chunk so SQS reports it as a failed entry.
+
+    Args:
+        bodies (list[str]): Serialized message bodies.
+        attributes (Optional[list[dict[str, dict[str, str]]]]): Message attributes for
+            each body, in the same order.
+
+    Returns:
+        list[list[dict[str, Any]]]: Batch entries with unique Ids.
+
+    """
+    chunks: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    current_bytes = 0
+
+    for index, body in enumerate(bodies):
+        entry_attributes = attributes[index] if attributes else None
+        size = len(body.encode("utf-8")) + attributes_size(entry_attributes)
+        if current and (
+            len(current) >= SQS_MAX_BATCH_ENTRIES or current_bytes + size > SQS_MAX_BATCH_BYTES
+        ):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        entry: dict[str, Any] = {"Id": str(index), "MessageBody": body}
+        if entry_attributes:
+            entry["MessageAttributes"] = entry_attributes
+        current.append(entry)
+        current_bytes += size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_send_batches(payload: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Encode messages and group them into SendMessageBatch chunks.
+
+    Args:
+        payload (list[dict[str, Any]]): Messages to send.
+
+    Returns:
+        list[list[dict[str, Any]]]: Batch entries with unique Ids.
+
+    """
+    bodies, attributes = zip(
+        *(message_codec.encode_published_sqs_message(message) for message in payload)
+    )
+    return chunk_send_entries(list(bodies), list(attributes))
+
+
+def record_send_error(
+    error: Exception, pending: list[dict[str, Any]], attempt: int, duration: float
+) -> int:
+    """Log and record a SendMessageBatch call that raised.
+
+    Args:
+        error (Exception): The client or service error.
+        pending (list[dict[str, Any]]): Entries of the failed call.
+        attempt (int): 1-based attempt number.
+        duration (float): Call duration in seconds.
+
+    Returns:
+        int: Entries given up on; 0 while attempts remain.
+
+    """
+    queue_publish_latency.labels(queue_type="sqs", status="exception").observe(duration)
+    safe_error("SQS batch client error", {"error": str(error), "attempt": attempt})
+    if attempt < SQS_BATCH_MAX_ATTEMPTS:
+        return 0
+    queue_publish_counter.labels(queue_type="sqs", status="exception").inc(len(pending))
+    return len(pending)
+
+
+def handle_send_response(
+    response: dict[str, Any], pending: list[dict[str, Any]], attempt: int, duration: float
+) -> tuple[int, list[dict[str, Any]]]:
+    """Record a SendMessageBatch response and pick the entries to retry.
+
+    Entries rejected with SenderFault, or still failing on the last attempt,
+    count as permanently failed.
+
+    Args:
+        response (dict[str, Any]): SendMessageBatch response.
+        pending (list[dict[str, Any]]): Entries sent in this attempt.
+        attempt (int): 1-based attempt number.
+        duration (float): Call duration in seconds.
+
+    Returns:
+        tuple[int, list[dict[str, Any]]]: Permanently failed count and entries to retry.
+
+    """
+    succeeded = response.get("Successful", [])
+    failures = response.get("Failed", [])
+    status = "failure" if failures else "success"
+    queue_publish_latency.labels(queue_type="sqs", status=status).observe(duration)
+    if succeeded:
+        queue_publish_counter.labels(queue_type="sqs", status="success").inc(len(succeeded))
+
+    rejected = 0
+    retry_ids = set()
+    for failure in failures:
+        if failure.get("SenderFault") or attempt == SQS_BATCH_MAX_ATTEMPTS:
+            queue_publish_counter.labels(queue_type="sqs", status="failure").inc()
+            rejected += 1
+            safe_error(
+                "SQS batch entry rejected",
+                {"code": failure.get("Code"), "sender_fault": failure.get("SenderFault")},
+            )
+        else:
+            retry_ids.add(failure["Id"])
+
+    return rejected, [entry for entry in pending if entry["Id"] in retry_ids]
+
+
+def delete_entries(receipt_handles: list[str]) -> list[list[dict[str, str]]]:
+    """Split receipt handles into DeleteMessageBatch entry lists.
+
+    Args:
+        receipt_handles (list[str]): Receipt handles of processed messages.
+
+    Returns:
+        list[list[dict[str, str]]]: Entries of at most SQS_DELETE_BATCH_SIZE, with Ids
+        unique within each list.
+
+    """
+    return [
+        [
+            {"Id": str(index), "ReceiptHandle": handle}
+            for index, handle in enumerate(receipt_handles[offset : offset + SQS_DELETE_BATCH_SIZE])
+        ]
+        for offset in range(0, len(receipt_handles), SQS_DELETE_BATCH_SIZE)
+    ]
+
+
+def record_delete_error(entries: list[dict[str, str]]) -> int:
+    """Log and count a DeleteMessageBatch call that raised.
+
+    Args:
+        entries (list[dict[str, str]]): Entries of the failed call.
+
+    Returns:
+        int: Number of messages that could not be deleted.
+
+    """
+    logger.error("❌ SQS delete batch failed (details redacted)")
+    record_ack_metrics("sqs", "failure", len(entries))
+    return len(entries)
+
+
+def handle_delete_response(
+    response: dict[str, Any], entries: list[dict[str, str]], attempt: int
+) -> tuple[int, list[dict[str, str]]]:
+    """Record a DeleteMessageBatch response and pick the entries to retry.
+
+    Entries rejected with SenderFault, or still failing on the last attempt,
+    count as permanently failed.
+
+    Args:
+        response (dict[str, Any]): DeleteMessageBatch response.
+        entries (list[dict[str, str]]): Entries sent in this attempt.
+        attempt (int): 1-based attempt number.
+
+    Returns:
+        tuple[int, list[dict[str, str]]]: Permanently failed count and entries to retry.
+
+    """
+    record_ack_metrics("sqs", "success", len(response.get("Successful", [])))
+    failures = response.get("Failed", [])
+    retry_ids = set()
+    if attempt < SQS_DELETE_MAX_ATTEMPTS:
+        retry_ids = {f["Id"] for f in failures if not f.get("SenderFault")}
+    permanent = len(failures) - len(retry_ids)
+    if permanent:
+        logger.warning("⚠️ SQS: %d message(s) could not be deleted", permanent)
+        record_ack_metrics("sqs", "failure", permanent)
+    return permanent, [entry for entry in entries if entry["Id"] in retry_ids]
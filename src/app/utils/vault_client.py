@@ -1,15 +1,22 @@
 """Vault client for secure secret retrieval using AppRole authentication.
 
 Supports KV v2 secrets engine and includes environment-aware namespace handling.
+Secrets are loaded once per process into an in-memory snapshot so that config
+lookups do not trigger additional Vault logins or reads. A background thread
+keeps the token renewed and periodically re-reads the snapshot so rotated
+secrets are picked up without a restart.
 """
 
 import os
-from functools import lru_cache
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
 import hvac
 from tenacity import retry, stop_after_attempt, wait_fixed
 
+from app.utils.metrics import record_vault_metrics
 from app.utils.safe_logger import safe_info, safe_warning
 
 VAULT_ADDR: str = os.getenv("VAULT_ADDR", "http://127.0.0.1:8200")
@@ -17,6 +24,8 @@ VAULT_ROLE_ID: str | None = os.getenv("VAULT_ROLE_ID")
 VAULT_SECRET_ID: str | None = os.getenv("VAULT_SECRET_ID")
 POLLER_NAME: str | None = os.getenv("POLLER_NAME")
 ENVIRONMENT: str = os.getenv("ENVIRONMENT", "dev")
+VAULT_REFRESH_INTERVAL: float = float(os.getenv("VAULT_REFRESH_INTERVAL", "300"))
+VAULT_TOKEN_RENEW_THRESHOLD: float = float(os.getenv("VAULT_TOKEN_RENEW_THRESHOLD", "60"))
 
 
 class VaultClient:
@@ -30,6 +39,9 @@ class VaultClient:
 
         """
         self.client: hvac.Client = hvac.Client(url=VAULT_ADDR)
+        self.token_expires_at: float | None = None
+        self.token_renewable = True
+        self._login_lease = 0.0
         self._authenticate()
 
     @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
@@ -41,18 +53,120 @@ class VaultClient:
 
         """
         if VAULT_ROLE_ID and VAULT_SECRET_ID:
+            start = time.perf_counter()
             try:
-                response: dict[str, Any] = self.client.auth_approle(VAULT_ROLE_ID, VAULT_SECRET_ID)
+                response: dict[str, Any] = self.client.auth.approle.login(
+                    role_id=VAULT_ROLE_ID, secret_id=VAULT_SECRET_ID
+                )
                 if not response["auth"].get("client_token"):
                     raise RuntimeError("❌ Failed to retrieve Vault token from response.")
+                self._set_token_expiry(response)
+                self._login_lease = float(response["auth"].get("lease_duration") or 0)
+                record_vault_metrics("login", "success", time.perf_counter() - start)
                 safe_info("🔐 Vault AppRole authentication successful.")
             except Exception as e:
+                record_vault_metrics("login", "failure", time.perf_counter() - start)
                 safe_warning("⚠️ Vault authentication failed.", data={"error": str(e)})
                 raise
         else:
             safe_warning("⚠️ VAULT_ROLE_ID or VAULT_SECRET_ID not provided. Vault auth skipped.")
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
+    def _set_token_expiry(self, response: dict[str, Any]) -> None:
+        """Track when the current token expires based on an auth response.
+
+        Args:
+            response (dict[str, Any]): Login or renewal response from Vault.
+
+        """
+        lease_duration = float(response["auth"].get("lease_duration") or 0)
+        self.token_renewable = bool(response["auth"].get("renewable", True))
+        if lease_duration:
+            self.token_expires_at = time.monotonic() + lease_duration
+        else:
+            self.token_expires_at = None
+
+    def renewal_due_at(self, threshold: float = VAULT_TOKEN_RENEW_THRESHOLD) -> float | None:
+        """Return when the token should be renewed or replaced.
+
+        The threshold is capped at half the lease granted at login, so a
+        short-lived token is not treated as permanently due.
+
+        Args:
+            threshold (float): Seconds of TTL left at which to act.
+
+        Returns:
+            Optional[float]: Monotonic time, or None if the token does not expire.
+
+        """
+        if self.token_expires_at is None:
+            return None
+        if self._login_lease:
+            threshold = min(threshold, self._login_lease / 2)
+        return self.token_expires_at - threshold
+
+    def renew_token_if_needed(self, threshold: float = VAULT_TOKEN_RENEW_THRESHOLD) -> None:
+        """Keep the token valid, renewing it or logging in again near expiry.
+
+        Non-renewable tokens, tokens whose renewal fails, and tokens that
+        renewal can no longer extend (max TTL reached) are replaced by a new
+        AppRole login.
+
+        Args:
+            threshold (float): Act when fewer than this many seconds of TTL remain.
+
+        """
+        due_at = self.renewal_due_at(threshold)
+        if due_at is None or time.monotonic() < due_at:
+            return
+
+        if not self.token_renewable:
+            safe_info("🔐 Vault token is not renewable. Logging in again.")
+            self._authenticate()
+            return
+
+        start = time.perf_counter()
+        try:
+            response: dict[str, Any] = self.client.auth.token.renew_self()
+            self._set_token_expiry(response)
+            record_vault_metrics("renew", "success", time.perf_counter() - start)
+            safe_info("🔐 Vault token renewed.")
+        except Exception as e:
+            record_vault_metrics("renew", "failure", time.perf_counter() - start)
+            safe_warning("⚠️ Vault token renewal failed. Re-authenticating.", data={"error": str(e)})
+            self._authenticate()
+            return
+
+        due_at = self.renewal_due_at(threshold)
+        if due_at is not None and time.monotonic() >= due_at:
+            safe_info("🔐 Vault token reached its max TTL. Logging in again.")
+            self._authenticate()
+
+    def read_secrets(self) -> dict[str, Any]:
+        """Read the full KV v2 secret document for this poller and environment.
+
+        A single attempt is made so startup fails fast when Vault is
+        unreachable; the background refresh is what retries.
+
+        Returns:
+            dict[str, Any]: All key/value pairs stored at the secret path, or an
+            empty dict if POLLER_NAME is not set.
+
+        """
+        if not POLLER_NAME:
+            safe_warning("⚠️ POLLER_NAME not set. Skipping Vault lookup.")
+            return {}
+
+        start = time.perf_counter()
+        try:
+            secret: dict[str, Any] = self.client.secrets.kv.v2.read_secret_version(
+                path=f"{POLLER_NAME}/{ENVIRONMENT}"
+            )
+        except Exception:
+            record_vault_metrics("read", "failure", time.perf_counter() - start)
+            raise
+        record_vault_metrics("read", "success", time.perf_counter() - start)
+        return dict(secret["data"]["data"])
+
     def get(self, key: str, fallback: str | None = None) -> str | None:
         """Retrieve a value from Vault for the given key.
 
@@ -64,17 +178,10 @@ class VaultClient:
             Optional[str]: The retrieved value or fallback if not found.
 
         """
-        if not POLLER_NAME:
-            safe_warning("⚠️ POLLER_NAME not set. Skipping Vault lookup.", data={"key": key})
-            return fallback
-
         secret_path: str = f"secret/data/{POLLER_NAME}/{ENVIRONMENT}"
 
         try:
-            secret: dict[str, Any] = self.client.secrets.kv.v2.read_secret_version(
-                path=f"{POLLER_NAME}/{ENVIRONMENT}"
-            )
-            value: Any | None = secret["data"]["data"].get(key)
+            value: Any | None = self.read_secrets().get(key)
             if value is not None:
                 safe_info("🔑 Vault value retrieved.", data={"key": key})
                 return str(value)
@@ -85,9 +192,229 @@ class VaultClient:
         return fallback
 
 
-@lru_cache
+class VaultSecretStore:
+    """Process-wide, in-memory snapshot of the secrets stored for this poller.
+
+    The first lookup authenticates once and reads the whole KV v2 document in a
+    single call; every later lookup is a plain dictionary read. An optional
+    background thread renews the token and re-reads the document, swapping in
+    the new snapshot atomically so readers never take a lock.
+    """
+
+    def __init__(self, refresh_interval: float = VAULT_REFRESH_INTERVAL) -> None:
+        """Initialize an empty, not-yet-loaded secret store.
+
+        Args:
+            refresh_interval (float): Seconds between background re-reads (0 disables).
+
+        """
+        self._refresh_interval = refresh_interval
+        self._client: VaultClient | None = None
+        self._snapshot: dict[str, str] | None = None
+        self._last_good: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[], None]] = []
+        self._stop_event = threading.Event()
+        self._refresh_thread: threading.Thread | None = None
+
+    def get(self, key: str) -> str | None:
+        """Return the secret value for a key, loading the snapshot on first use.
+
+        Args:
+            key (str): The secret key to look up.
+
+        Returns:
+            Optional[str]: The secret value, or None if the key is not stored in Vault.
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.load()
+        return snapshot.get(key)
+
+    def load(self) -> dict[str, str]:
+        """Load the secret snapshot if it has not been loaded yet.
+
+        Starts the background refresh thread after the first load when Vault
+        is configured and a refresh interval is set. If the read fails, the
+        last good snapshot (empty if there is none) is served until the
+        refresh thread succeeds; without a refresh thread nothing is cached,
+        so the next lookup tries Vault again.
+
+        Returns:
+            dict[str, str]: The current secret snapshot.
+
+        Raises:
+            Exception: If Vault authentication fails; the store stays unloaded so
+            the next lookup retries.
+
+        """
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+
+            if self._client is None:
+                self._client = VaultClient()
+            refresh_enabled = self._refresh_interval > 0 and bool(POLLER_NAME)
+            try:
+                snapshot = self._fetch(self._client)
+            except Exception as e:
+                safe_warning(
+                    "⚠️ Vault read failure. Using last known secrets.",
+                    data={"error": str(e), "keys": len(self._last_good)},
+                )
+                if not refresh_enabled:
+                    return self._last_good
+                snapshot = self._last_good
+            else:
+                self._last_good = snapshot
+
+            self._snapshot = snapshot
+            if refresh_enabled:
+                self._start_refresh_thread()
+            return snapshot
+
+    def refresh(self) -> bool:
+        """Renew the token if needed and re-read the secret document.
+
+        The previous snapshot is kept if the read fails.
+
+        Returns:
+            bool: True if the snapshot changed.
+
+        """
+        try:
+            with self._lock:
+                if self._client is None:
+                    self._client = VaultClient()
+                client = self._client
+            client.renew_token_if_needed()
+            secrets = client.read_secrets()
+        except Exception as e:
+            safe_warning(
+                "⚠️ Vault refresh failed. Keeping previous secrets.", data={"error": str(e)}
+            )
+            return False
+
+        snapshot = {key: str(value) for key, value in secrets.items() if value is not None}
+        if snapshot == self._snapshot:
+            return False
+
+        self._snapshot = self._last_good = snapshot
+        safe_info("🔄 Vault secrets refreshed.", data={"keys": len(snapshot)})
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception as e:
+                safe_warning("⚠️ Vault refresh listener failed.", data={"error": str(e)})
+        return True
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callable to run whenever a refresh changes the snapshot.
+
+        Args:
+            listener (Callable[[], None]): Callback with no arguments.
+
+        """
+        self._listeners.append(listener)
+
+    def stop(self) -> None:
+        """Stop the background refresh thread, if running."""
+        self._stop_event.set()
+        thread = self._refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._refresh_thread = None
+
+    def reset(self) -> None:
+        """Drop the cached client and snapshot so the next lookup reloads from Vault.
+
+        The last good snapshot is kept as the fallback if that reload fails.
+        """
+        self.stop()
+        with self._lock:
+            self._client = None
+            self._snapshot = None
+            self._stop_event = threading.Event()
+
+    def _fetch(self, client: VaultClient) -> dict[str, str]:
+        """Read all secrets through the shared, authenticated client.
+
+        Args:
+            client (VaultClient): Authenticated client to read with.
+
+        Returns:
+            dict[str, str]: Secret values converted to strings.
+
+        Raises:
+            Exception: If the read fails.
+
+        """
+        secrets = client.read_secrets()
+        snapshot = {key: str(value) for key, value in secrets.items() if value is not None}
+        safe_info("🔑 Vault secrets loaded.", data={"keys": len(snapshot)})
+        return snapshot
+
+    def _start_refresh_thread(self) -> None:
+        """Start the daemon thread that keeps the token and snapshot fresh."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="vault-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _refresh_loop(self) -> None:
+        """Renew the token before it expires and re-read secrets every refresh interval."""
+        stop_event = self._stop_event
+        next_read = time.monotonic() + self._refresh_interval
+
+        while not stop_event.wait(self._seconds_until_next_wakeup(next_read)):
+            if time.monotonic() >= next_read:
+                self.refresh()
+                next_read = time.monotonic() + self._refresh_interval
+            elif self._client is not None:
+                try:
+                    self._client.renew_token_if_needed()
+                except Exception as e:
+                    safe_warning("⚠️ Vault token renewal failed.", data={"error": str(e)})
+
+    def _seconds_until_next_wakeup(self, next_read: float) -> float:
+        """Compute how long the refresh loop can sleep.
+
+        Args:
+            next_read (float): Monotonic time of the next scheduled secret read.
+
+        Returns:
+            float: Seconds until the next read or token renewal, whichever is sooner.
+
+        """
+        wakeup = next_read
+        client = self._client
+        due_at = client.renewal_due_at() if client is not None else None
+        if due_at is not None:
+            wakeup = min(wakeup, due_at)
+        return max(wakeup - time.monotonic(), 1.0)
+
+
+_secret_store = VaultSecretStore()
+
+
+def get_secret_store() -> VaultSecretStore:
+    """Return the process-wide Vault secret store.
+
+    Returns:
+        VaultSecretStore: Shared secret store instance.
+
+    """
+    return _secret_store
+
+
 def get_config_value_cached(key: str, default: str | None = None) -> str:
-    """Retrieve a configuration value from Vault, environment variable, or fallback, with caching.
+    """Retrieve a configuration value from Vault, environment variable, or fallback.
+
+    Vault values are served from the shared secret snapshot, so lookups stay
+    in-memory while still reflecting rotated secrets after a refresh.
 
     Args:
         key (str): The config key to look up.
@@ -100,7 +427,9 @@ def get_config_value_cached(key: str, default: str | None = None) -> str:
         ValueError: If no value is found and no default is provided.
 
     """
-    val = VaultClient().get(key, fallback=os.getenv(key, default))
+    val = get_secret_store().get(key)
+    if val is None:
+        val = os.getenv(key, default)
     if val is None:
         raise ValueError(f"❌ Missing required config value for key: {key}")
     return str(val)
@@ -0,0 +1,56 @@
+"""Benchmarks for the database output sink write modes.
+
+Run with `pytest tests/benchmarks --benchmark-only`. The insert mode runs
+against a temporary SQLite file; the COPY mode needs a PostgreSQL database
+in BENCHMARK_POSTGRES_URL and is skipped otherwise.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app import output_handler
+
+pytest.importorskip("pytest_benchmark")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+ROWS = [{"symbol": f"SYM{i % 500}", "text": f"signal {i}", "score": i / 7} for i in range(5000)]
+CREATE_SQL = "CREATE TABLE {} (symbol TEXT, text TEXT, score FLOAT)"
+INSERT_SQL = "INSERT INTO {} (symbol, text, score) VALUES (:symbol, :text, :score)"
+
+
+def _target(request, tmp_path, mode):
+    if mode == "copy":
+        url = os.getenv("BENCHMARK_POSTGRES_URL")
+        if not url:
+            pytest.skip("BENCHMARK_POSTGRES_URL not set")
+        table = "benchmark_signals"
+    else:
+        url = f"sqlite:///{tmp_path / 'benchmark.db'}"
+        table = "signals"
+
+    engine = sqlalchemy.create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text(f"DROP TABLE IF EXISTS {table}"))
+        conn.execute(sqlalchemy.text(CREATE_SQL.format(table)))
+    request.addfinalizer(engine.dispose)
+    request.addfinalizer(output_handler.dispose_database_engines)
+    return url, table
+
+
+@pytest.mark.parametrize("mode", ["insert", "copy"])
+def test_database_output_write_modes(benchmark, request, tmp_path, mode):
+    url, table = _target(request, tmp_path, mode)
+    with (
+        patch("app.output_handler.config_shared.get_output_modes", return_value=["database"]),
+        patch("app.output_handler.config_shared.get_database_output_url", return_value=url),
+        patch("app.output_handler.config_shared.get_database_write_mode", return_value=mode),
+        patch("app.output_handler.config_shared.get_database_copy_table", return_value=table),
+        patch(
+            "app.output_handler.config_shared.get_database_insert_sql",
+            return_value=INSERT_SQL.format(table),
+        ),
+    ):
+        dispatcher = output_handler.OutputDispatcher()
+        benchmark(dispatcher._output_to_database, ROWS)
@@ -0,0 +1,38 @@
+"""Contention benchmark for RateLimiter.acquire.
+
+Run with `pytest tests/benchmarks --benchmark-only`. The limit is set far above
+the achievable call rate, so the numbers measure per-call overhead and lock
+contention at 1, 8, and 64 threads rather than throttling.
+"""
+
+import threading
+
+import pytest
+
+from app.utils.rate_limit import RateLimiter
+
+pytest.importorskip("pytest_benchmark")
+
+CALLS_PER_ROUND = 6400
+
+
+def _acquire_concurrently(limiter: RateLimiter, threads: int) -> None:
+    calls = CALLS_PER_ROUND // threads
+    start = threading.Barrier(threads)
+
+    def worker():
+        start.wait()
+        for _ in range(calls):
+            limiter.acquire("benchmark")
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+
+@pytest.mark.parametrize("threads", [1, 8, 64])
+def test_acquire_contention(benchmark, threads):
+    limiter = RateLimiter(max_requests=10_000_000, time_window=1)
+    benchmark.pedantic(_acquire_concurrently, args=(limiter, threads), rounds=10)
@@ -0,0 +1,85 @@
+"""Benchmarks for the JSON serialization backends on representative payloads.
+
+Run with `pytest tests/benchmarks --benchmark-only`; every installed backend
+(orjson, msgspec, stdlib json) is measured for encoding and decoding, and the
+JSON and MessagePack queue wire formats are compared on a full round trip.
+"""
+
+import pytest
+
+from app.utils import serialization
+
+pytest.importorskip("pytest_benchmark")
+
+STOCK_TICKS = [
+    {
+        "symbol": f"SYM{i % 500}",
+        "timestamp": f"2024-03-05T14:30:{i % 60:02d}Z",
+        "data": {
+            "open": 100 + i / 10,
+            "high": 101 + i / 10,
+            "low": 99 + i / 10,
+            "close": 100.5 + i / 10,
+            "volume": 10_000 + i,
+            "indicators": {"rsi": 55.2, "macd": [0.12, 0.08, 0.04], "sma_20": 100.1},
+        },
+    }
+    for i in range(500)
+]
+
+TRADE_EVENTS = [
+    {
+        "symbol": f"SYM{i % 50}",
+        "action": "BUY" if i % 2 else "SELL",
+        "quantity": float(i % 100 + 1),
+        "price": 100 + i / 100,
+        "timestamp": "2024-03-05T14:30:00Z",
+        "strategy_id": "momentum-v2",
+        "notes": "Signal confidence 0.82; sentiment positive",
+    }
+    for i in range(500)
+]
+
+PAYLOADS = {"stock_ticks": STOCK_TICKS, "trade_events": TRADE_EVENTS}
+BACKENDS = [
+    name
+    for name, module in (
+        ("orjson", serialization.orjson),
+        ("msgspec", serialization.msgspec),
+        ("json", True),
+    )
+    if module is not None
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps(benchmark, backend, payload):
+    _, dumps, _ = serialization._select_backend(backend)
+    messages = PAYLOADS[payload]
+    benchmark(lambda: [dumps(message) for message in messages])
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loads(benchmark, backend, payload):
+    _, dumps, loads = serialization._select_backend(backend)
+    bodies = [dumps(message) for message in PAYLOADS[payload]]
+    benchmark(lambda: [loads(body) for body in bodies])
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("wire_format", ["json", "msgpack"])
+def test_wire_format_round_trip(benchmark, wire_format, payload):
+    from app.utils import message_codec
+
+    if wire_format == "msgpack" and message_codec.msgpack is None:
+        pytest.skip("msgpack not installed")
+    content_type = message_codec.content_type_for(wire_format)
+    messages = PAYLOADS[payload]
+    benchmark(
+        lambda: [
+            message_codec.decode(message_codec.encode(message, content_type), content_type)
+            for message in messages
+        ]
+    )
@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.async_queue_handler import _collect_batch, _process_rabbitmq_batch
+
+
+def test_collect_batch_stops_at_max_size():
+    async def run():
+        deliveries = asyncio.Queue()
+        for n in range(5):
+            deliveries.put_nowait(n)
+        return await _collect_batch(deliveries, max_size=3, max_wait=1)
+
+    assert asyncio.run(run()) == [0, 1, 2]
+
+
+def test_collect_batch_returns_partial_batch_after_max_wait():
+    async def run():
+        deliveries = asyncio.Queue()
+        deliveries.put_nowait("only")
+        return await _collect_batch(deliveries, max_size=10, max_wait=0.01)
+
+    assert asyncio.run(run()) == ["only"]
+
+
+def test_process_rabbitmq_batch_acks_each_message_after_async_callback():
+    messages = [
+        MagicMock(body=b'{"n": 1}', content_type=None, content_encoding=None, ack=AsyncMock()),
+        MagicMock(
+            body=b'{"n": 2}',
+            content_type="application/json",
+            content_encoding=None,
+            ack=AsyncMock(),
+        ),
+    ]
+    callback = AsyncMock()
+
+    asyncio.run(_process_rabbitmq_batch(callback, messages))
+
+    callback.assert_awaited_once_with([{"n": 1}, {"n": 2}])
+    for message in messages:
+        message.ack.assert_awaited_once()
+
+
+def test_delete_sqs_messages_retries_failed_entries():
+    from app.async_queue_handler import _delete_sqs_messages
+
+    sqs = MagicMock()
+    sqs.delete_message_batch = AsyncMock(
+        side_effect=[
+            {
+                "Successful": [{"Id": "0"}],
+                "Failed": [{"Id": "1"}, {"Id": "2", "SenderFault": True}],
+            },
+            {"Successful": [{"Id": "1"}], "Failed": []},
+        ]
+    )
+
+    assert asyncio.run(_delete_sqs_messages(sqs, "url", ["a", "b", "c"])) == 1
+    retried = sqs.delete_message_batch.call_args_list[1].kwargs["Entries"]
+    assert retried == [{"Id": "1", "ReceiptHandle": "b"}]
+
+
+def test_consume_messages_closes_publishers_on_exit():
+    from unittest.mock import patch
+
+    from app.async_queue_handler import consume_messages
+
+    with (
+        patch("app.async_queue_handler.config.get_queue_type", return_value="sqs"),
+        patch("app.async_queue_handler._consume_sqs", AsyncMock()),
+        patch("app.async_queue_handler.run_shutdown_hooks") as mock_hooks,
+        patch("app.async_queue_handler.close_publishers", AsyncMock()) as mock_close,
+    ):
+        asyncio.run(consume_messages(AsyncMock()))
+
+    mock_hooks.assert_called_once()
+    mock_close.assert_awaited_once()
+
+
+def test_sync_callback_publishes_on_consumer_loop():
+    from unittest.mock import patch
+
+    from app import async_queue_sender
+    from app.async_queue_handler import consume_messages
+
+    published = []
+
+    async def publish_to_queue(payload, queue=None, exchange=None):
+        published.append((asyncio.get_running_loop(), payload))
+
+    async def consume(callback, stop_event):
+        await asyncio.to_thread(async_queue_sender.publish_from_thread, [{"id": 1}])
+
+    with (
+        patch("app.async_queue_handler.config.get_queue_type", return_value="sqs"),
+        patch("app.async_queue_handler._consume_sqs", consume),
+        patch("app.async_queue_handler.run_shutdown_hooks"),
+        patch("app.async_queue_handler.close_publishers", AsyncMock()),
+        patch("app.async_queue_sender.publish_to_queue", publish_to_queue),
+    ):
+        asyncio.run(consume_messages(AsyncMock()))
+
+    assert [payload for _, payload in published] == [[{"id": 1}]]
+    with pytest.raises(RuntimeError):
+        async_queue_sender.publish_from_thread([{"id": 2}])
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.async_queue_sender import AsyncRabbitMQPublisher, RabbitMQPublishError
+
+
+def _publisher_with_exchange(exchange):
+    publisher = AsyncRabbitMQPublisher()
+    publisher._get_exchange = AsyncMock(return_value=exchange)
+    return publisher
+
+
+@patch("app.async_queue_sender.aio_pika")
+def test_publish_batch_publishes_every_body(mock_aio_pika):
+    exchange = MagicMock(publish=AsyncMock())
+    publisher = _publisher_with_exchange(exchange)
+
+    asyncio.run(publisher.publish_batch([b"a", b"b", b"c"], "exchange", "key"))
+
+    assert exchange.publish.await_count == 3
+
+
+@patch("app.async_queue_sender.config_shared.get_rabbitmq_max_unconfirmed", return_value=2)
+@patch("app.async_queue_sender.aio_pika")
+def test_publish_batch_bounds_unconfirmed_messages(mock_aio_pika, mock_window):
+    in_flight = []
+    peak = []
+
+    async def publish(*args, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.pop()
+
+    exchange = MagicMock(publish=publish)
+    publisher = _publisher_with_exchange(exchange)
+
+    asyncio.run(publisher.publish_batch([b"a", b"b", b"c", b"d", b"e"], "exchange", "key"))
+
+    assert len(peak) == 5
+    assert max(peak) == 2
+
+
+@patch("app.async_queue_sender.asyncio.sleep", new_callable=AsyncMock)
+@patch("app.async_queue_sender.aio_pika")
+def test_publish_batch_raises_when_any_publish_fails(mock_aio_pika, mock_sleep):
+    exchange = MagicMock(publish=AsyncMock(side_effect=[None] + [RuntimeError("nack")] * 3))
+    publisher = _publisher_with_exchange(exchange)
+
+    with pytest.raises(RabbitMQPublishError):
+        asyncio.run(publisher.publish_batch([b"a", b"b"], "exchange", "key"))
+
+    assert exchange.publish.await_count == 4
+
+
+@patch("app.async_queue_sender.asyncio.sleep", new_callable=AsyncMock)
+@patch("app.async_queue_sender.aio_pika")
+def test_publish_batch_republishes_only_failed_messages(mock_aio_pika, mock_sleep):
+    exchange = MagicMock(publish=AsyncMock(side_effect=[None, RuntimeError("nack"), None, None]))
+    publisher = _publisher_with_exchange(exchange)
+
+    asyncio.run(publisher.publish_batch([b"a", b"b", b"c"], "exchange", "key"))
+
+    assert exchange.publish.await_count == 4
+    republished = mock_aio_pika.Message.call_args_list[-1].kwargs["body"]
+    assert republished == b"b"
+
+
+@patch("app.async_queue_sender.asyncio.sleep", new_callable=AsyncMock)
+def test_send_sqs_batch_chunk_counts_chunk_failed_on_client_error(mock_sleep):
+    from botocore.exceptions import ClientError
+
+    from app.async_queue_sender import _send_sqs_batch_chunk
+
+    client = MagicMock()
+    client.send_message_batch = AsyncMock(
+        side_effect=ClientError({"Error": {"Code": "AccessDenied"}}, "SendMessageBatch")
+    )
+    entries = [{"Id": str(i), "MessageBody": "{}"} for i in range(3)]
+
+    assert asyncio.run(_send_sqs_batch_chunk(client, "url", entries)) == 3
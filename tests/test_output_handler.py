@@ -18,3 +18,306 @@ def test_send_print(mock_modes, mock_logger):
 def test_send_noop(mock_modes, mock_logger):
     output_handler.send({"test": "value"})
     mock_logger.warning.assert_called()
+
+
+def _dispatcher(modes, parallel):
+    with (
+        patch("app.output_handler.config_shared.get_output_modes", return_value=modes),
+        patch("app.output_handler.config_shared.get_output_parallel", return_value=parallel),
+    ):
+        return output_handler.OutputDispatcher()
+
+
+@patch("app.output_handler.config_shared.get_paper_trading_enabled", return_value=False)
+def test_parallel_send_isolates_failing_sink(mock_paper):
+    dispatcher = _dispatcher(["log", "rest"], parallel=True)
+    with (
+        patch.object(dispatcher, "_output_to_log") as mock_log,
+        patch.object(dispatcher, "_output_to_rest", side_effect=RuntimeError("down")),
+        patch("app.output_handler.record_output_metrics") as mock_metrics,
+    ):
+        dispatcher.send([{"text": "a"}])
+    dispatcher.close()
+
+    mock_log.assert_called_once_with([{"text": "a"}])
+    outcomes = {call.args[0]: call.kwargs["success"] for call in mock_metrics.call_args_list}
+    assert outcomes == {"log": True, "rest": False}
+
+
+@patch("app.output_handler.config_shared.get_paper_trading_enabled", return_value=False)
+@patch("app.output_handler.config_shared.get_output_sink_timeout", return_value=0.05)
+def test_parallel_send_times_out_slow_sink(mock_timeout, mock_paper):
+    import threading
+
+    release = threading.Event()
+    dispatcher = _dispatcher(["log", "rest"], parallel=True)
+    with (
+        patch.object(dispatcher, "_output_to_log"),
+        patch.object(dispatcher, "_output_to_rest", side_effect=lambda data: release.wait(5)),
+        patch("app.output_handler.record_output_metrics") as mock_metrics,
+    ):
+        dispatcher.send([{"text": "a"}])
+        mock_metrics.assert_any_call("rest", success=False, duration_sec=0.05)
+        release.set()
+        dispatcher.close()
+
+    rest_calls = [call for call in mock_metrics.call_args_list if call.args[0] == "rest"]
+    assert len(rest_calls) == 1
+
+
+@patch("app.output_handler.config_shared.get_paper_trading_enabled", return_value=False)
+@patch("app.output_handler.config_shared.get_output_sink_timeout", return_value=5)
+def test_parallel_send_applies_per_sink_timeout(mock_timeout, mock_paper):
+    import threading
+
+    release = threading.Event()
+    dispatcher = _dispatcher(["log", "rest"], parallel=True)
+    with (
+        patch(
+            "app.output_handler.config_shared.get_output_sink_timeout_override",
+            side_effect=lambda mode: 0.05 if mode == "rest" else 0,
+        ),
+        patch.object(dispatcher, "_output_to_log"),
+        patch.object(dispatcher, "_output_to_rest", side_effect=lambda data: release.wait(5)),
+        patch("app.output_handler.record_output_metrics") as mock_metrics,
+    ):
+        dispatcher.send([{"text": "a"}])
+        release.set()
+        dispatcher.close()
+
+    outcomes = {call.args[0]: call.kwargs for call in mock_metrics.call_args_list}
+    assert outcomes["rest"] == {"success": False, "duration_sec": 0.05}
+    assert outcomes["log"]["success"] is True
+
+
+@patch("app.output_handler.config_shared.get_paper_trading_enabled", return_value=False)
+def test_sink_that_fails_internally_is_reported_as_failed(mock_paper):
+    dispatcher = _dispatcher(["s3"], parallel=False)
+    client = MagicMock()
+    client.put_object.side_effect = RuntimeError("access denied")
+    dispatcher._s3_client = client
+    with (
+        patch("app.output_handler.config_shared.get_s3_buffered_output", return_value=False),
+        patch("app.output_handler.config_shared.get_s3_output_bucket", return_value="bucket"),
+        patch("app.output_handler.config_shared.get_s3_output_format", return_value="json"),
+        patch("app.output_handler.record_output_metrics") as mock_metrics,
+    ):
+        dispatcher.send([{"text": "a"}])
+
+    mock_metrics.assert_called_once()
+    assert mock_metrics.call_args.kwargs["success"] is False
+
+
+@patch("app.output_handler.config_shared.get_paper_trade_mode", return_value="log")
+@patch("app.output_handler.config_shared.get_paper_trading_enabled", return_value=True)
+def test_paper_trading_resolves_mode_by_value(mock_paper, mock_mode):
+    dispatcher = _dispatcher(["queue"], parallel=False)
+    with patch.object(dispatcher, "_output_to_log") as mock_log:
+        dispatcher.send([{"text": "a"}])
+
+    mock_log.assert_called_once_with([{"text": "a"}])
+
+
+def test_database_output_bulk_inserts_with_cached_engine(tmp_path):
+    import sqlalchemy
+
+    url = f"sqlite:///{tmp_path / 'out.db'}"
+    with sqlalchemy.create_engine(url).begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE outputs (text TEXT)"))
+
+    dispatcher = _dispatcher(["database"], parallel=False)
+    with (
+        patch("app.output_handler.config_shared.get_database_output_url", return_value=url),
+        patch(
+            "app.output_handler.config_shared.get_database_insert_sql",
+            return_value="INSERT INTO outputs (text) VALUES (:text)",
+        ),
+        patch("app.output_handler.record_db_write_metrics") as mock_metrics,
+    ):
+        dispatcher._output_to_database([{"text": "a"}, {"text": "b"}])
+        dispatcher._output_to_database([{"text": "c"}])
+
+    assert output_handler._get_database_engine(url) is output_handler._get_database_engine(url)
+    output_handler.dispose_database_engines()
+    with sqlalchemy.create_engine(url).connect() as conn:
+        count = conn.execute(sqlalchemy.text("SELECT COUNT(*) FROM outputs")).scalar()
+    assert count == 3
+    assert mock_metrics.call_args_list[0].args[:2] == ("insert", 2)
+
+
+def _copy_connection():
+    cursor = MagicMock()
+    conn = MagicMock()
+    conn.dialect.identifier_preparer.quote = lambda name: f'"{name}"'
+    conn.connection.dbapi_connection.cursor.return_value = cursor
+    captured = {}
+    cursor.copy_expert.side_effect = lambda sql, buf: captured.update(sql=sql, body=buf.read())
+    return conn, cursor, captured
+
+
+def test_copy_rows_streams_csv_through_copy_expert():
+    conn, cursor, captured = _copy_connection()
+
+    written = output_handler._copy_rows(
+        conn,
+        "analytics.signals",
+        [{"text": "a,b", "score": 1.5, "meta": {"k": 1}}, {"text": "c", "flag": True}],
+    )
+
+    assert written == 2
+    assert captured["sql"] == (
+        'COPY "analytics"."signals" ("text", "score", "meta", "flag") '
+        "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    assert captured["body"].splitlines() == ['"a,b",1.5,"{""k"":1}",\\N', "c,\\N,\\N,true"]
+    cursor.close.assert_called_once()
+
+
+def test_copy_rows_rejects_rows_outside_configured_columns():
+    conn, _, captured = _copy_connection()
+
+    written = output_handler._copy_rows(
+        conn,
+        "signals",
+        [{"text": "a", "score": 1}, {"text": "b", "extra": 2}, {"score": 3}],
+        columns=["text", "score"],
+    )
+
+    assert written == 2
+    assert captured["sql"].startswith('COPY "signals" ("text", "score") ')
+    assert captured["body"].splitlines() == ["a,1", "\\N,3"]
+
+
+@pytest.mark.parametrize(
+    "mode, dialect, table, expected",
+    [
+        ("auto", "postgresql", "signals", "copy"),
+        ("auto", "postgresql", "", "insert"),
+        ("auto", "sqlite", "signals", "insert"),
+        ("copy", "sqlite", "signals", "insert"),
+        ("insert", "postgresql", "signals", "insert"),
+    ],
+)
+def test_select_database_write_method(mode, dialect, table, expected):
+    engine = MagicMock()
+    engine.dialect.name = dialect
+    with (
+        patch("app.output_handler.config_shared.get_database_write_mode", return_value=mode),
+        patch("app.output_handler.config_shared.get_database_copy_table", return_value=table),
+    ):
+        assert output_handler._select_database_write_method(engine) == expected
+
+
+def test_rest_output_reuses_session_and_gzips_large_bodies():
+    import gzip
+    import json
+
+    dispatcher = _dispatcher(["rest"], parallel=False)
+    session = MagicMock()
+    session.post.return_value = MagicMock(ok=True, status_code=200)
+    data = [{"text": "x" * 2000}]
+    with (
+        patch("app.output_handler.create_session", return_value=session) as mock_create,
+        patch("app.output_handler.config_shared.get_rest_output_url", return_value="http://sink"),
+        patch("app.output_handler.config_shared.get_rest_gzip", return_value=True),
+        patch("app.output_handler.config_shared.get_rest_timeout", return_value=3),
+    ):
+        dispatcher._output_to_rest(data)
+        dispatcher._output_to_rest(data)
+
+    mock_create.assert_called_once()
+    kwargs = session.post.call_args.kwargs
+    assert kwargs["timeout"] == 3
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == data
+
+
+def test_rest_output_retries_only_throttled_chunk_honoring_retry_after():
+    import json
+
+    dispatcher = _dispatcher(["rest"], parallel=False)
+    session = MagicMock()
+    attempts = {}
+
+    def post(url, data, headers, timeout):
+        first = json.loads(data)[0]["text"]
+        attempts[first] = attempts.get(first, 0) + 1
+        if first == "c" and attempts[first] == 1:
+            return MagicMock(ok=False, status_code=429, headers={"Retry-After": "7"})
+        return MagicMock(ok=True, status_code=200)
+
+    session.post.side_effect = post
+    data = [{"text": t} for t in "abcde"]
+    with (
+        patch("app.output_handler.create_session", return_value=session),
+        patch("app.output_handler.config_shared.get_rest_output_url", return_value="http://sink"),
+        patch("app.output_handler.config_shared.get_rest_gzip", return_value=False),
+        patch("app.output_handler.config_shared.get_rest_chunk_size", return_value=2),
+        patch("app.output_handler.time.sleep") as mock_sleep,
+        patch("app.output_handler.record_sink_metrics") as mock_metrics,
+    ):
+        dispatcher._output_to_rest(data)
+
+    assert attempts == {"a": 1, "c": 2, "e": 1}
+    mock_sleep.assert_called_once_with(7.0)
+    statuses = sorted(call.args[1] for call in mock_metrics.call_args_list)
+    assert statuses == ["200", "200", "200", "429"]
+
+
+def test_rest_output_does_not_retry_client_errors():
+    dispatcher = _dispatcher(["rest"], parallel=False)
+    session = MagicMock()
+    session.post.return_value = MagicMock(ok=False, status_code=400, headers={})
+    with (
+        patch("app.output_handler.create_session", return_value=session),
+        patch("app.output_handler.config_shared.get_rest_output_url", return_value="http://sink"),
+        patch("app.output_handler.config_shared.get_rest_gzip", return_value=False),
+        patch("app.output_handler.time.sleep") as mock_sleep,
+    ):
+        assert dispatcher._post_rest_chunk([{"text": "a"}]) is False
+
+    session.post.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize("backend", ["blocking", "asyncio"])
+def test_queue_sink_uses_configured_queue_backend(backend):
+    with (
+        patch("app.output_handler.config_shared.get_queue_backend", return_value=backend),
+        patch("app.output_handler.publish_to_queue") as mock_blocking,
+        patch("app.output_handler.publish_from_thread") as mock_async,
+    ):
+        output_handler._publish_to_queue([{"id": 1}], queue="q")
+
+    used, unused = (
+        (mock_async, mock_blocking) if backend == "asyncio" else (mock_blocking, mock_async)
+    )
+    used.assert_called_once_with([{"id": 1}], queue="q", exchange=None)
+    unused.assert_not_called()
+
+
+def test_concurrent_parallel_sends_share_one_executor():
+    import threading
+    import time
+
+    dispatcher = _dispatcher(["log", "rest"], parallel=True)
+    barrier = threading.Barrier(8)
+
+    def get_executor():
+        barrier.wait(5)
+        return dispatcher._get_executor()
+
+    def slow_pool(**kwargs):
+        time.sleep(0.01)
+        return MagicMock()
+
+    with patch("app.output_handler.ThreadPoolExecutor", side_effect=slow_pool) as mock_pool:
+        threads = [threading.Thread(target=get_executor) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+    mock_pool.assert_called_once()
+    dispatcher.close()
+    assert dispatcher._executor is None
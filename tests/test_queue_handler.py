@@ -1,2 +1,169 @@
 def test_queue_handler_imports():
     import app.queue_handler
+
+
+def test_delete_sqs_messages_batches_and_retries_failures():
+    from unittest.mock import MagicMock
+
+    from app.queue_handler import _delete_sqs_messages
+
+    sqs = MagicMock()
+    sqs.delete_message_batch.side_effect = [
+        {"Successful": [{"Id": str(i)} for i in range(9)], "Failed": [{"Id": "9"}]},
+        {"Successful": [{"Id": "9"}], "Failed": []},
+        {"Successful": [{"Id": "0"}, {"Id": "1"}], "Failed": []},
+    ]
+
+    handles = [f"handle-{i}" for i in range(12)]
+    assert _delete_sqs_messages(sqs, "url", handles) == 0
+    assert sqs.delete_message_batch.call_count == 3
+    retried = sqs.delete_message_batch.call_args_list[1].kwargs["Entries"]
+    assert retried == [{"Id": "9", "ReceiptHandle": "handle-9"}]
+
+
+def test_sqs_ack_worker_flushes_on_stop():
+    from unittest.mock import MagicMock
+
+    from app.queue_handler import _SQSAckWorker
+
+    sqs = MagicMock()
+    sqs.delete_message_batch.return_value = {"Successful": [], "Failed": []}
+    worker = _SQSAckWorker(sqs, "url")
+    worker.submit(["a", "b"])
+    worker.submit(["c"])
+    worker.stop()
+
+    deleted = [
+        entry["ReceiptHandle"]
+        for call in sqs.delete_message_batch.call_args_list
+        for entry in call.kwargs["Entries"]
+    ]
+    assert deleted == ["a", "b", "c"]
+
+
+def test_rabbitmq_batch_acks_once_when_full():
+    from unittest.mock import MagicMock
+
+    from app.queue_handler import _RabbitMQBatch
+
+    channel = MagicMock()
+    callback = MagicMock()
+    batch = _RabbitMQBatch(channel, callback, max_size=3, max_wait=60)
+    for tag in (1, 2, 3):
+        batch.add(tag, {"n": tag})
+
+    callback.assert_called_once_with([{"n": 1}, {"n": 2}, {"n": 3}])
+    channel.basic_ack.assert_called_once_with(delivery_tag=3, multiple=True)
+
+
+def test_rabbitmq_batch_nacks_on_callback_failure():
+    from unittest.mock import MagicMock
+
+    from app.queue_handler import _RabbitMQBatch
+
+    channel = MagicMock()
+    batch = _RabbitMQBatch(channel, MagicMock(side_effect=RuntimeError), max_size=10, max_wait=0)
+    batch.add(1, {})
+    batch.add(2, {})
+    batch.flush_if_due()
+
+    channel.basic_nack.assert_called_once_with(delivery_tag=2, multiple=True, requeue=False)
+    channel.basic_ack.assert_not_called()
+
+
+def test_rabbitmq_batch_acks_worker_results_in_delivery_order():
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event
+    from unittest.mock import MagicMock
+
+    from app.queue_handler import _RabbitMQBatch
+
+    release_first = Event()
+
+    def callback(messages):
+        if messages[0]["n"] == 1:
+            release_first.wait(5)
+
+    channel = MagicMock()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        batch = _RabbitMQBatch(channel, callback, 1, 60, executor=executor, max_inflight=2)
+        batch.add(1, {"n": 1})
+        batch.add(2, {"n": 2})
+        batch.add(3, {"n": 3})  # held back: two batches already in flight
+
+        batch.acknowledge_completed()
+        channel.basic_ack.assert_not_called()
+
+        release_first.set()
+        batch.drain()
+
+    acked = [call.kwargs["delivery_tag"] for call in channel.basic_ack.call_args_list]
+    assert acked == [1, 2, 3]
+
+
+def test_shutdown_hooks_run_after_consumer_stops():
+    from unittest.mock import MagicMock, patch
+
+    from app import queue_handler
+
+    hook = MagicMock()
+    queue_handler.register_shutdown_hook(hook)
+    try:
+        with (
+            patch("app.queue_handler.config.get_queue_type", return_value="sqs"),
+            patch("app.queue_handler._start_sqs_listener") as mock_listener,
+            patch("app.queue_handler._create_executor", return_value=None),
+            patch("app.queue_handler.signal.signal"),
+        ):
+            queue_handler.consume_messages(MagicMock())
+        mock_listener.assert_called_once()
+        hook.assert_called_once_with()
+    finally:
+        queue_handler._shutdown_hooks.remove(hook)
+
+
+def test_process_workers_run_their_own_shutdown_hooks():
+    from unittest.mock import MagicMock, patch
+
+    from app import queue_handler
+
+    inherited = MagicMock()
+    queue_handler.register_shutdown_hook(inherited)
+    try:
+        with patch("app.queue_handler.multiprocessing.util.Finalize") as mock_finalize:
+            queue_handler._init_worker_process()
+
+        assert queue_handler._shutdown_hooks == []
+        mock_finalize.assert_called_once_with(
+            None, queue_handler.run_shutdown_hooks, exitpriority=10
+        )
+    finally:
+        queue_handler._shutdown_hooks.clear()
+
+
+def test_sqs_ack_worker_survives_unexpected_errors():
+    import threading
+    from unittest.mock import MagicMock
+
+    from app.queue_handler import _SQSAckWorker
+    from app.utils import healthcheck
+
+    first_call = threading.Event()
+
+    def delete_message_batch(QueueUrl, Entries):
+        if not first_call.is_set():
+            first_call.set()
+            raise RuntimeError("boom")
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries], "Failed": []}
+
+    sqs = MagicMock()
+    sqs.delete_message_batch.side_effect = delete_message_batch
+    worker = _SQSAckWorker(sqs, "url")
+    assert "sqs-ack" in healthcheck._liveness_checks
+    worker.submit(["a"])
+    assert first_call.wait(timeout=5)
+    worker.submit(["b"])
+    worker.stop()
+
+    assert sqs.delete_message_batch.call_count == 2
+    assert "sqs-ack" not in healthcheck._liveness_checks
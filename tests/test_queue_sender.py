@@ -0,0 +1,384 @@
+from unittest.mock import MagicMock, patch
+
+import heapq
+import itertools
+from collections import deque
+from types import SimpleNamespace
+
+import pika
+from pika.exceptions import AMQPConnectionError, StreamLostError
+
+from app.queue_sender import ConfirmingRabbitMQPublisher, RabbitMQPublisher
+
+
+@patch("app.queue_sender._rabbitmq_connection_parameters")
+@patch("app.queue_sender.pika.BlockingConnection")
+def test_rabbitmq_publisher_reuses_connection(mock_connection, mock_params):
+    publisher = RabbitMQPublisher()
+    publisher.publish("exchange", "key", b"{}")
+    publisher.publish("exchange", "key", b"{}")
+
+    mock_connection.assert_called_once()
+    channel = mock_connection.return_value.channel.return_value
+    assert channel.basic_publish.call_count == 2
+
+
+@patch("app.queue_sender._rabbitmq_connection_parameters")
+@patch("app.queue_sender.pika.BlockingConnection")
+def test_rabbitmq_publisher_reconnects_on_lost_stream(mock_connection, mock_params):
+    stale_channel = MagicMock()
+    stale_channel.basic_publish.side_effect = StreamLostError("gone")
+    fresh_channel = MagicMock()
+    mock_connection.return_value.channel.side_effect = [stale_channel, fresh_channel]
+
+    publisher = RabbitMQPublisher()
+    publisher.publish("exchange", "key", b"{}")
+
+    assert mock_connection.call_count == 2
+    fresh_channel.basic_publish.assert_called_once()
+
+
+@patch("app.queue_sender.time.sleep")
+def test_send_sqs_batch_chunk_retries_only_failed_entries(mock_sleep):
+    from app.queue_sender import _send_sqs_batch_chunk
+
+    client = MagicMock()
+    client.send_message_batch.side_effect = [
+        {
+            "Successful": [{"Id": "0"}],
+            "Failed": [
+                {"Id": "1", "SenderFault": False, "Code": "InternalError"},
+                {"Id": "2", "SenderFault": True, "Code": "InvalidMessageContents"},
+            ],
+        },
+        {"Successful": [{"Id": "1"}], "Failed": []},
+    ]
+    entries = [{"Id": str(i), "MessageBody": "{}"} for i in range(3)]
+
+    assert _send_sqs_batch_chunk(client, "url", entries) == 1
+    retried = client.send_message_batch.call_args_list[1].kwargs["Entries"]
+    assert [entry["Id"] for entry in retried] == ["1"]
+
+
+@patch("app.queue_sender.time.sleep")
+@patch("app.queue_sender._get_sqs_client")
+def test_send_batch_to_sqs_counts_chunk_failed_on_client_error(mock_get_client, mock_sleep):
+    import pytest
+    from botocore.exceptions import ClientError
+
+    from app.queue_sender import SQSMessageSendError, _send_batch_to_sqs
+
+    def send_message_batch(QueueUrl, Entries):
+        if Entries[0]["Id"] == "0":
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "SendMessageBatch")
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries], "Failed": []}
+
+    client = mock_get_client.return_value
+    client.send_message_batch.side_effect = send_message_batch
+
+    with pytest.raises(SQSMessageSendError, match="10 of 12"):
+        _send_batch_to_sqs([{"n": i} for i in range(12)], "url")
+
+    sent_chunks = {
+        call.kwargs["Entries"][0]["Id"] for call in client.send_message_batch.call_args_list
+    }
+    assert sent_chunks == {"0", "10"}
+
+
+@patch("app.queue_sender.config_shared.get_queue_wire_format", return_value="msgpack")
+@patch("app.queue_sender.get_rabbitmq_publisher")
+def test_send_batch_to_rabbitmq_tags_content_type(mock_get_publisher, mock_wire_format):
+    from app.queue_sender import _send_batch_to_rabbitmq
+    from app.utils import message_codec
+
+    mock_get_publisher.return_value.publish_batch.return_value = []
+
+    _send_batch_to_rabbitmq([{"n": 1}], "key", "exchange")
+
+    exchange, routing_key, messages = mock_get_publisher.return_value.publish_batch.call_args.args
+    assert (exchange, routing_key) == ("exchange", "key")
+    body, properties = messages[0]
+    assert properties.content_type == "application/msgpack"
+    assert properties.content_encoding is None
+    assert message_codec.decode(body, properties.content_type) == {"n": 1}
+
+
+@patch("app.queue_sender._get_sqs_client")
+def test_send_batch_to_sqs_tags_content_type(mock_get_client):
+    from app.queue_sender import _send_batch_to_sqs
+    from app.utils import message_codec
+
+    client = mock_get_client.return_value
+    client.send_message_batch.return_value = {"Successful": [{"Id": "0"}], "Failed": []}
+
+    _send_batch_to_sqs([{"n": 1}], "url")
+
+    kwargs = client.send_message_batch.call_args.kwargs
+    assert kwargs["QueueUrl"] == "url"
+    entry = kwargs["Entries"][0]
+    assert entry["MessageAttributes"]["content_type"]["StringValue"] == "application/json"
+    assert message_codec.decode_sqs_message(
+        {"Body": entry["MessageBody"], "MessageAttributes": entry["MessageAttributes"]}
+    ) == {"n": 1}
+
+
+def test_close_rabbitmq_publishers_runs_as_shutdown_hook():
+    import threading
+
+    from app import queue_handler, queue_sender
+
+    publishers = []
+
+    def create():
+        publishers.append(queue_sender.get_rabbitmq_publisher())
+
+    thread = threading.Thread(target=create)
+    thread.start()
+    thread.join()
+    publishers.append(queue_sender.get_rabbitmq_publisher())
+
+    try:
+        assert queue_sender.close_rabbitmq_publishers in queue_handler._shutdown_hooks
+        with (
+            patch.object(RabbitMQPublisher, "close") as mock_close,
+            patch.object(ConfirmingRabbitMQPublisher, "close", mock_close),
+        ):
+            queue_sender.close_rabbitmq_publishers()
+        assert mock_close.call_count == 2
+    finally:
+        queue_handler._shutdown_hooks.remove(queue_sender.close_rabbitmq_publishers)
+        queue_sender._publisher_local.publisher = None
+
+
+@patch("app.queue_sender.config_shared.get_queue_compression_min_bytes", return_value=256)
+@patch("app.queue_sender.config_shared.get_queue_compression", return_value="gzip")
+@patch("app.queue_sender._get_sqs_client")
+def test_send_batch_to_sqs_compresses_only_large_messages(
+    mock_get_client, mock_compression, mock_min_bytes
+):
+    from app.queue_sender import _send_batch_to_sqs
+    from app.utils import message_codec
+
+    client = mock_get_client.return_value
+    client.send_message_batch.return_value = {"Successful": [], "Failed": []}
+    payload = [{"n": 1}, {"text": "breaking news " * 100}]
+
+    _send_batch_to_sqs(payload, "url")
+
+    entries = client.send_message_batch.call_args.kwargs["Entries"]
+    assert "content_encoding" not in entries[0]["MessageAttributes"]
+    assert entries[1]["MessageAttributes"]["content_encoding"]["StringValue"] == "gzip"
+    assert [
+        message_codec.decode_sqs_message(
+            {"Body": entry["MessageBody"], "MessageAttributes": entry["MessageAttributes"]}
+        )
+        for entry in entries
+    ] == payload
+
+
+class _FakeIOLoop:
+    """Runs scheduled callbacks, then timers, until stopped."""
+
+    def __init__(self):
+        self.ready = deque()
+        self.timers = []
+        self.counter = itertools.count()
+        self.stopped = False
+
+    def call_later(self, delay, callback):
+        timer = (delay, next(self.counter), callback)
+        heapq.heappush(self.timers, timer)
+        return timer
+
+    def remove_timeout(self, timer):
+        self.timers.remove(timer)
+        heapq.heapify(self.timers)
+
+    def stop(self):
+        self.stopped = True
+
+    def start(self):
+        self.stopped = False
+        while not self.stopped:
+            if self.ready:
+                self.ready.popleft()()
+            elif self.timers:
+                heapq.heappop(self.timers)[2]()
+            else:
+                raise AssertionError("I/O loop has nothing left to run")
+
+
+class _FakeBroker:
+    """Confirms everything published since its last turn with one multiple=True ack."""
+
+    def __init__(self, nack=(), unroutable=(), silent=False, refuse=False):
+        self.nack, self.unroutable = set(nack), set(unroutable)
+        self.silent, self.refuse = silent, refuse
+        self.connections = []
+        self.published = []
+        self.ack_frames = 0
+        self.max_in_flight = 0
+
+    def connect(self, params, on_open_callback, on_open_error_callback, on_close_callback):
+        connection = _FakeSelectConnection(
+            self, on_open_callback, on_open_error_callback, on_close_callback
+        )
+        self.connections.append(connection)
+        return connection
+
+
+class _FakeSelectConnection:
+    def __init__(self, broker, on_open, on_open_error, on_close):
+        self.broker, self.on_close = broker, on_close
+        self.ioloop = _FakeIOLoop()
+        self.is_open, self.is_closed, self.is_closing = not broker.refuse, broker.refuse, False
+        if broker.refuse:
+            self.ioloop.ready.append(lambda: on_open_error(self, AMQPConnectionError("refused")))
+        else:
+            self.ioloop.ready.append(lambda: on_open(self))
+
+    def channel(self, on_open_callback):
+        channel = _FakeChannel(self)
+        self.ioloop.ready.append(lambda: on_open_callback(channel))
+
+    def close(self):
+        self.is_open, self.is_closed = False, True
+        self.ioloop.ready.append(lambda: self.on_close(self, Exception("closed")))
+
+
+class _FakeChannel:
+    def __init__(self, connection):
+        self.connection, self.broker = connection, connection.broker
+        self.is_open = True
+        self.tag = 0
+        self.unconfirmed = []
+        self.turn_scheduled = False
+
+    def add_on_close_callback(self, callback):
+        pass
+
+    def add_on_return_callback(self, callback):
+        self.on_return = callback
+
+    def confirm_delivery(self, ack_nack_callback, callback):
+        self.on_confirm = ack_nack_callback
+        self.connection.ioloop.ready.append(lambda: callback(None))
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        assert mandatory is True
+        self.tag += 1
+        self.unconfirmed.append((self.tag, body))
+        self.broker.published.append(body)
+        self.broker.max_in_flight = max(self.broker.max_in_flight, len(self.unconfirmed))
+        if not self.turn_scheduled and not self.broker.silent:
+            self.turn_scheduled = True
+            self.connection.ioloop.ready.append(self._turn)
+
+    def _turn(self):
+        self.turn_scheduled = False
+        unconfirmed, self.unconfirmed = self.unconfirmed, []
+        for tag, body in unconfirmed:
+            if body in self.broker.unroutable:
+                self.on_return(self, None, None, body)
+            if body in self.broker.nack:
+                self.on_confirm(SimpleNamespace(method=pika.spec.Basic.Nack(tag, False)))
+        self.broker.ack_frames += 1
+        last_tag = unconfirmed[-1][0]
+        self.on_confirm(SimpleNamespace(method=pika.spec.Basic.Ack(last_tag, True)))
+
+
+def _confirming_publisher(broker, **kwargs):
+    patches = (
+        patch("app.queue_sender._rabbitmq_connection_parameters"),
+        patch("app.queue_sender.pika.SelectConnection", side_effect=broker.connect),
+    )
+    for active in patches:
+        active.start()
+    return ConfirmingRabbitMQPublisher(**kwargs), patches
+
+
+def test_confirming_publisher_pipelines_within_window_and_bulk_acks():
+    broker = _FakeBroker()
+    publisher, patches = _confirming_publisher(broker, max_unconfirmed=3, confirm_timeout=5)
+    try:
+        messages = [(bytes([n]), None) for n in range(7)]
+        assert publisher.publish_batch("exchange", "key", messages) == []
+        assert publisher.publish_batch("exchange", "key", messages[:2]) == []
+    finally:
+        for active in patches:
+            active.stop()
+
+    assert len(broker.connections) == 1
+    assert len(broker.published) == 9
+    assert broker.max_in_flight == 3
+    assert broker.ack_frames < len(broker.published)
+
+
+def test_confirming_publisher_reports_nacked_and_returned_messages():
+    broker = _FakeBroker(nack={b"b"}, unroutable={b"c"})
+    publisher, patches = _confirming_publisher(broker, max_unconfirmed=10, confirm_timeout=5)
+    try:
+        failed = publisher.publish_batch(
+            "exchange", "key", [(b"a", None), (b"b", None), (b"c", None), ("d", None)]
+        )
+    finally:
+        for active in patches:
+            active.stop()
+
+    assert failed == [1, 2]
+
+
+def test_confirming_publisher_reports_all_messages_when_broker_unreachable():
+    broker = _FakeBroker(refuse=True)
+    publisher, patches = _confirming_publisher(broker, confirm_timeout=5)
+    try:
+        failed = publisher.publish_batch("exchange", "key", [(b"a", None), (b"b", None)])
+    finally:
+        for active in patches:
+            active.stop()
+
+    assert failed == [0, 1]
+
+
+def test_confirming_publisher_gives_up_and_reconnects_after_confirm_timeout():
+    broker = _FakeBroker(silent=True)
+    publisher, patches = _confirming_publisher(broker, max_unconfirmed=1, confirm_timeout=5)
+    try:
+        assert publisher.publish_batch("exchange", "key", [(b"a", None), (b"b", None)]) == [0, 1]
+        broker.silent = False
+        assert publisher.publish_batch("exchange", "key", [(b"a", None)]) == []
+    finally:
+        for active in patches:
+            active.stop()
+
+    assert len(broker.connections) == 2
+    assert broker.connections[0].is_closed
+
+
+@patch("app.queue_sender.config_shared.get_rabbitmq_publisher_confirms")
+def test_get_rabbitmq_publisher_follows_confirms_setting(mock_confirms):
+    from app import queue_handler, queue_sender
+
+    try:
+        for confirms, expected in ((True, ConfirmingRabbitMQPublisher), (False, RabbitMQPublisher)):
+            mock_confirms.return_value = confirms
+            queue_sender._publisher_local.publisher = None
+            assert type(queue_sender.get_rabbitmq_publisher()) is expected
+    finally:
+        queue_sender._publisher_local.publisher = None
+        while queue_sender.close_rabbitmq_publishers in queue_handler._shutdown_hooks:
+            queue_handler._shutdown_hooks.remove(queue_sender.close_rabbitmq_publishers)
+
+
+@patch("app.queue_sender.time.sleep")
+@patch("app.queue_sender.get_rabbitmq_publisher")
+def test_send_batch_to_rabbitmq_republishes_only_unconfirmed(mock_get_publisher, mock_sleep):
+    from app.queue_sender import _send_batch_to_rabbitmq
+
+    publisher = mock_get_publisher.return_value
+    publisher.publish_batch.side_effect = [[1], []]
+
+    _send_batch_to_rabbitmq([{"n": 0}, {"n": 1}, {"n": 2}], "key", "exchange")
+
+    retried = publisher.publish_batch.call_args_list[1].args[2]
+    assert [body for body, _ in retried] == [b'{"n":1}']
@@ -25,3 +25,15 @@ def test_ready_endpoint():
     client = TestClient(app)
     response = client.get("/ready")
     assert response.status_code == 503
+
+
+def test_liveness_check_failure_marks_service_unhealthy():
+    alive = True
+    healthcheck.register_liveness_check("worker", lambda: alive)
+    try:
+        assert healthcheck.is_healthy() is True
+        alive = False
+        assert healthcheck.is_healthy() is False
+    finally:
+        healthcheck.unregister_liveness_check("worker")
+    assert healthcheck.is_healthy() is True
@@ -0,0 +1,51 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from app.utils.http_session import create_session
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_reuses_pooled_connection():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        session = create_session("test", pool_size=2)
+        with patch("app.utils.http_session.record_connection_event") as mock_event:
+            for _ in range(3):
+                assert session.post(url, data=b"{}", timeout=5).ok
+        session.close()
+    finally:
+        server.shutdown()
+
+    events = [call.args for call in mock_event.call_args_list]
+    assert events == [("test", "open"), ("test", "reuse"), ("test", "reuse")]
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+
+    from app.utils.http_session import parse_retry_after
+
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(future) <= 30
@@ -0,0 +1,127 @@
+import base64
+import os
+
+import pytest
+
+from app.utils import message_codec
+
+PAYLOAD = {"symbol": "AAPL", "price": 189.25, "volume": 1200, "indicators": {"rsi": [55.2, 56.1]}}
+
+msgpack_required = pytest.mark.skipif(message_codec.msgpack is None, reason="msgpack not installed")
+
+
+def test_untagged_messages_decode_as_json():
+    assert message_codec.decode(b'{"n":1}') == {"n": 1}
+    assert message_codec.decode(b'{"n":1}', "application/json; charset=utf-8") == {"n": 1}
+
+
+@msgpack_required
+def test_msgpack_round_trip_is_smaller_than_json():
+    body = message_codec.encode(PAYLOAD, message_codec.MSGPACK_CONTENT_TYPE)
+
+    assert message_codec.decode(body, "application/x-msgpack") == PAYLOAD
+    assert len(body) < len(message_codec.encode(PAYLOAD))
+
+
+@msgpack_required
+def test_sqs_messages_decode_by_content_type_attribute():
+    messages = []
+    for wire_format in ("json", "msgpack"):
+        content_type = message_codec.content_type_for(wire_format)
+        body, attributes = message_codec.encode_sqs_message(PAYLOAD, content_type)
+        messages.append({"Body": body, "MessageAttributes": attributes})
+    messages.append({"Body": '{"legacy":true}'})
+
+    decoded = [message_codec.decode_sqs_message(message) for message in messages]
+
+    assert decoded == [PAYLOAD, PAYLOAD, {"legacy": True}]
+
+
+@pytest.mark.parametrize(
+    "content_type", ["text/plain", "application/octet-stream", "application/vnd.acme+json"]
+)
+def test_legacy_content_types_are_decoded_as_json(content_type):
+    from unittest.mock import patch
+
+    with patch("app.utils.message_codec.record_content_type_fallback") as mock_metric:
+        assert message_codec.decode(b'{"n":1}', content_type) == {"n": 1}
+        assert message_codec.decode_sqs_message(
+            {
+                "Body": '{"n":2}',
+                "MessageAttributes": {"content_type": {"StringValue": content_type}},
+            }
+        ) == {"n": 2}
+
+    assert mock_metric.call_count == 2
+    mock_metric.assert_called_with(content_type)
+
+
+def test_unknown_formats_are_rejected():
+    with pytest.raises(ValueError):
+        message_codec.content_type_for("xml")
+    with pytest.raises(ValueError):
+        message_codec.decode(b"<n/>", "application/xml")
+
+
+def _installed_compression():
+    algorithms = ["gzip"]
+    if message_codec.zstandard is not None:
+        algorithms.append("zstd")
+    return algorithms
+
+
+@pytest.mark.parametrize("algorithm", _installed_compression())
+def test_large_bodies_are_compressed_and_flagged(algorithm):
+    payload = {"headline": "Markets rally " * 200}
+
+    body, encoding = message_codec.encode_message(payload, compression=algorithm, min_bytes=1024)
+
+    assert encoding == algorithm
+    assert len(body) < len(message_codec.encode(payload))
+    assert message_codec.decode(body, message_codec.JSON_CONTENT_TYPE, encoding) == payload
+
+    sqs_body, attributes = message_codec.encode_sqs_message(
+        payload, compression=algorithm, min_bytes=1024
+    )
+    assert attributes["content_encoding"]["StringValue"] == algorithm
+    assert (
+        message_codec.decode_sqs_message({"Body": sqs_body, "MessageAttributes": attributes})
+        == payload
+    )
+
+
+def test_small_or_incompressible_bodies_are_sent_uncompressed():
+    body, encoding = message_codec.encode_message({"n": 1}, compression="gzip", min_bytes=1024)
+    assert (body, encoding) == (b'{"n":1}', None)
+
+    random_bytes = os.urandom(512)
+    assert message_codec.compress(random_bytes, "gzip") == (random_bytes, None)
+
+
+def test_sqs_compression_must_pay_off_after_base64():
+    import random
+    import string
+    from unittest.mock import patch
+
+    rng = random.Random(0)
+    payload = {"blob": "".join(rng.choices(string.ascii_letters + string.digits + "+/", k=4000))}
+    text = message_codec.encode(payload)
+    compressed, encoding = message_codec.compress(text, "gzip")
+    assert encoding == "gzip" and len(compressed) < len(text)
+
+    with patch("app.utils.message_codec.record_compression_metrics") as mock_metrics:
+        sqs_body, attributes = message_codec.encode_sqs_message(
+            payload, compression="gzip", min_bytes=1024
+        )
+
+    assert sqs_body == text.decode("utf-8")
+    assert "content_encoding" not in attributes
+    original, wire = mock_metrics.call_args.args[3:]
+    assert original == len(text)
+    assert wire == len(base64.b64encode(compressed))
+
+
+def test_charset_content_encoding_is_not_treated_as_compression():
+    assert message_codec.decode(b'{"n":1}', None, "utf-8") == {"n": 1}
+    with pytest.raises(ValueError):
+        message_codec.decode(b'{"n":1}', None, "br")
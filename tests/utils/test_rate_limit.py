@@ -1,9 +1,140 @@
+import asyncio
 import time
+from unittest.mock import patch
 
-from app.utils.rate_limit import RateLimiter
+import pytest
+
+from app.utils.rate_limit import AsyncRateLimiter, RateLimiter
 
 
 def test_rate_limiter_allows():
     limiter = RateLimiter(5, 1)
     for _ in range(5):
         limiter.acquire()
+
+
+def test_rate_limiter_sleeps_outside_the_lock():
+    limiter = RateLimiter(1, 1)
+    limiter.acquire()
+    sleeps = []
+
+    def fake_sleep(seconds):
+        assert not limiter._lock.locked()
+        sleeps.append(seconds)
+
+    with patch("app.utils.rate_limit.time.sleep", side_effect=fake_sleep):
+        limiter.acquire()
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 1
+
+
+def test_rate_limiter_queues_waiters_in_arrival_order():
+    limiter = RateLimiter(2, 1)
+
+    with patch("app.utils.rate_limit.time.sleep") as mock_sleep:
+        for _ in range(4):
+            limiter.acquire("test")
+
+    waits = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(waits) == 2
+    assert waits[0] == pytest.approx(0.5, abs=0.05)
+    assert waits[1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_async_rate_limiter_wakes_waiters_in_fifo_order_without_blocking_the_loop():
+    limiter = AsyncRateLimiter(10, 0.1)
+    finished = []
+    ticks = []
+
+    async def worker(index):
+        await limiter.acquire("async")
+        finished.append(index)
+
+    async def ticker():
+        while len(finished) < 30:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(ticker(), *(worker(index) for index in range(30)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+
+    assert finished == list(range(30))
+    assert elapsed >= 0.18
+    assert len(ticks) > 5
+
+
+def test_async_rate_limiter_refunds_cancelled_reservations():
+    limiter = AsyncRateLimiter(1, 1)
+
+    async def run():
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+
+    assert limiter._tokens > -1
+
+
+def test_adaptive_rate_limiter_backs_off_on_429_and_recovers():
+    limiter = RateLimiter(10, 1, adaptive=True, max_rate=12)
+
+    limiter.observe(429)
+    assert limiter.effective_rate == pytest.approx(5)
+
+    limiter._backoff_until = 0.0
+    for _ in range(10):
+        limiter.observe(200)
+    assert limiter.effective_rate == pytest.approx(6)
+
+    for _ in range(1000):
+        limiter.observe(200)
+    assert limiter.effective_rate == pytest.approx(12)
+
+
+def test_adaptive_rate_limiter_halves_once_per_burst_of_429s():
+    limiter = RateLimiter(10, 1, adaptive=True)
+
+    for _ in range(5):
+        limiter.observe(429)
+
+    assert limiter.effective_rate == pytest.approx(5)
+
+
+def test_adaptive_rate_limiter_honours_retry_after():
+    limiter = RateLimiter(10, 1, adaptive=True)
+    limiter.observe(429, {"Retry-After": "3"})
+    sleeps = []
+
+    with patch("app.utils.rate_limit.time.sleep", side_effect=sleeps.append):
+        limiter.acquire()
+
+    assert sleeps[0] == pytest.approx(3, abs=0.05)
+
+
+def test_adaptive_rate_limiter_caps_rate_at_reported_quota():
+    limiter = RateLimiter(10, 1, adaptive=True)
+
+    limiter.observe(200, {"x-ratelimit-remaining": "20", "x-ratelimit-reset": "10"})
+    assert limiter.effective_rate == pytest.approx(2)
+
+    reset_at = time.time() + 40
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)})
+    assert limiter.effective_rate == pytest.approx(0.5)
+    assert limiter._paused_until - time.monotonic() == pytest.approx(40, abs=1)
+
+
+def test_static_rate_limiter_ignores_feedback():
+    limiter = RateLimiter(10, 1)
+
+    limiter.observe(429, {"Retry-After": "30"})
+
+    assert limiter.effective_rate == 10
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.rate_limit import RateLimiter
+from app.utils.rate_limit_backends import (
+    InMemoryBackend,
+    RateLimitBackend,
+    RedisBackend,
+    create_backend,
+)
+
+
+def test_in_memory_backend_grants_up_to_available_tokens():
+    backend = InMemoryBackend()
+
+    assert backend.reserve("polygon", 4, capacity=5, refill_rate=1) == (4, 0.0)
+    assert backend.reserve("polygon", 4, capacity=5, refill_rate=1) == (1, 0.0)
+    granted, wait = backend.reserve("polygon", 4, capacity=5, refill_rate=1)
+    assert granted == 0
+    assert 0 < wait <= 1
+    assert backend.reserve("finnhub", 1, capacity=5, refill_rate=1) == (1, 0.0)
+
+
+def test_redis_backend_runs_the_token_bucket_script():
+    client = MagicMock()
+    script = client.register_script.return_value
+    script.return_value = [0, b"0.25"]
+
+    backend = RedisBackend(client)
+
+    assert backend.reserve("polygon", 10, capacity=100.0, refill_rate=5.0) == (0, 0.25)
+    script.assert_called_once_with(keys=["ratelimit:polygon"], args=[100.0, 5.0, 10])
+
+
+def test_limiters_sharing_a_backend_enforce_one_budget_with_leases():
+    backend = InMemoryBackend()
+    reserve = MagicMock(side_effect=backend.reserve)
+    backend.reserve = reserve
+    replicas = [RateLimiter(10, 60, backend=backend, key="polygon", lease_size=5) for _ in "ab"]
+
+    with patch("app.utils.rate_limit.time.sleep", side_effect=RuntimeError("throttled")):
+        for _ in range(5):
+            for replica in replicas:
+                replica.acquire("polygon")
+        assert reserve.call_count == 2
+
+        with pytest.raises(RuntimeError, match="throttled"):
+            replicas[0].acquire("polygon")
+
+
+def test_limiter_falls_back_to_local_bucket_when_backend_fails():
+    backend = MagicMock()
+    backend.reserve.side_effect = ConnectionError("redis down")
+    limiter = RateLimiter(5, 1, backend=backend)
+
+    for _ in range(5):
+        limiter.acquire()
+
+    backend.reserve.assert_called_once()
+
+
+def test_limiter_retries_backend_after_cooldown():
+    backend = MagicMock()
+    backend.reserve.side_effect = [ConnectionError("redis down"), (5, 0.0)]
+    limiter = RateLimiter(5, 1, backend=backend, backend_retry_after=30)
+
+    limiter.acquire()
+    limiter._backend_down_until = 0.0
+    limiter.acquire()
+
+    assert backend.reserve.call_count == 2
+    assert limiter._leased == 4
+
+
+def test_redis_backend_from_url_sets_timeouts():
+    with patch("app.utils.rate_limit_backends.redis") as mock_redis:
+        RedisBackend.from_url("redis://cache:6379/0", timeout=0.2)
+
+    mock_redis.Redis.from_url.assert_called_once_with(
+        "redis://cache:6379/0", socket_timeout=0.2, socket_connect_timeout=0.2
+    )
+
+
+def test_backend_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+
+def test_create_backend_rejects_unknown_kinds():
+    assert create_backend("local") is None
+    assert isinstance(create_backend("memory"), InMemoryBackend)
+    with pytest.raises(ValueError):
+        create_backend("memcached")
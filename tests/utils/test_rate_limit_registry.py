@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.rate_limit_backends import InMemoryBackend
+from app.utils.rate_limit_registry import RateLimiterRegistry
+
+
+@patch("app.config_shared.get_rate_limit_burst", return_value=0)
+@patch("app.config_shared.get_finnhub_fill_rate_limit", return_value=30)
+@patch("app.config_shared.get_polygon_fill_rate_limit", return_value=5)
+def test_registry_builds_one_limiter_per_provider_lazily(mock_polygon, mock_finnhub, _burst):
+    registry = RateLimiterRegistry()
+
+    polygon = registry.get("polygon")
+
+    assert registry.get("POLYGON") is polygon
+    assert registry.get("finnhub") is not polygon
+    mock_polygon.assert_called_once()
+    assert polygon._refill_rate == pytest.approx(5 / 60)
+    assert polygon._capacity == 5
+
+
+@patch("app.config_shared.get_newsapi_rate_limit", return_value=(5, 10))
+def test_registry_uses_separate_burst_capacity_and_refill_rate(_newsapi):
+    limiter = RateLimiterRegistry().get("newsapi")
+
+    assert limiter._refill_rate == 5
+    assert limiter._capacity == 10
+
+
+@patch("app.config_shared.get_rate_limit_burst", return_value=20)
+@patch("app.config_shared.get_iex_fill_rate_limit", return_value=60)
+def test_registry_reads_burst_override(_iex, mock_burst):
+    limiter = RateLimiterRegistry().get("iex")
+
+    mock_burst.assert_called_once_with("iex")
+    assert limiter._refill_rate == 1
+    assert limiter._capacity == 20
+
+
+def test_registry_rejects_unknown_provider():
+    with pytest.raises(ValueError, match="No rate limit configured"):
+        RateLimiterRegistry().get("unknown")
+
+
+def test_registry_reports_per_provider_saturation():
+    registry = RateLimiterRegistry(backend=None, limits={})
+    registry.register("polygon", 4, 60)
+    registry.register("finnhub", 4, 60, capacity=8)
+
+    with patch("app.utils.rate_limit_registry.record_rate_limiter_saturation") as mock_record:
+        registry.acquire("polygon")
+        registry.acquire("polygon")
+        registry.acquire("finnhub")
+
+    mock_record.assert_called_with("finnhub", pytest.approx(1 / 8, abs=1e-3))
+    report = registry.saturation()
+    assert report["polygon"] == pytest.approx(0.5, abs=1e-3)
+    assert report["finnhub"] == pytest.approx(1 / 8, abs=1e-3)
+
+
+def test_registry_shares_backend_keyed_by_provider():
+    backend = InMemoryBackend()
+    registry = RateLimiterRegistry(backend=backend, limits={})
+    registry.register("polygon", 10, 60)
+
+    registry.acquire("polygon")
+
+    assert "polygon" in backend._buckets
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 from app.utils.request_with_timeout import request_with_timeout
 
@@ -7,6 +8,20 @@ class TestRequestWithTimeout(unittest.TestCase):
     def test_request_with_invalid_url(self):
         self.assertIsNone(request_with_timeout(""))
 
+    @patch("app.utils.request_with_timeout.requests.get")
+    def test_request_feeds_response_to_rate_limiter(self, mock_get):
+        response = mock_get.return_value
+        response.status_code = 200
+        response.headers = {"Content-Type": "application/json", "X-RateLimit-Remaining": "9"}
+        response.json.return_value = {"ok": True}
+        limiter = MagicMock()
+
+        result = request_with_timeout("https://api.example.com/v1/quote", rate_limiter=limiter)
+
+        self.assertEqual(result, {"ok": True})
+        limiter.acquire.assert_called_once_with(context="api.example.com")
+        limiter.observe.assert_called_once_with(200, response.headers)
+
 
 if __name__ == "__main__":
     unittest.main()
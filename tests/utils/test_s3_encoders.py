@@ -0,0 +1,114 @@
+import gzip
+import json
+
+import pytest
+
+from app.utils.s3_encoders import SUPPORTED_FORMATS, get_encoder
+
+RECORDS = [
+    {"symbol": "AAPL", "timestamp": "2024-01-01T00:00:00Z", "data": {"rsi": 70}, "text": "hi"},
+    {"symbol": "MSFT", "action": "BUY", "quantity": 5, "price": 1.5},
+    {"symbol": "TSLA", "timestamp": "2024-01-01T00:01:00Z"},
+]
+
+
+def _encode(output_format, batches, **attrs):
+    encoder = get_encoder(output_format)
+    for name, value in attrs.items():
+        setattr(encoder, name, value)
+    return encoder, b"".join(encoder.encode(batch) for batch in batches) + encoder.finish()
+
+
+def test_json_array_matches_single_dump():
+    _, body = _encode("json", [RECORDS[:1], RECORDS[1:]])
+    assert json.loads(body) == RECORDS
+
+
+def test_gzip_ndjson_round_trips():
+    encoder, body = _encode("ndjson.gz", [RECORDS[:2], RECORDS[2:]])
+    lines = gzip.decompress(body).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+    assert encoder.extension == ".ndjson.gz" and encoder.content_encoding == "gzip"
+
+
+def test_zstd_ndjson_round_trips():
+    zstandard = pytest.importorskip("zstandard")
+    _, body = _encode("ndjson.zst", [RECORDS])
+    decoded = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    assert [json.loads(line) for line in decoded.splitlines()] == RECORDS
+
+
+def test_parquet_uses_typed_columns_and_row_groups():
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    _, body = _encode("parquet", [RECORDS[:2], RECORDS[2:]], row_group_size=2)
+    parquet_file = pq.ParquetFile(pyarrow.BufferReader(body))
+    table = parquet_file.read()
+
+    assert parquet_file.num_row_groups == 2
+    assert table.schema.field("price").type == pyarrow.float64()
+    assert table.column("symbol").to_pylist() == ["AAPL", "MSFT", "TSLA"]
+    first = table.to_pylist()[0]
+    assert json.loads(first["data"]) == {"rsi": 70}
+    assert json.loads(first["extra"]) == {"text": "hi"}
+
+
+def test_unknown_format_rejected():
+    assert "parquet" in SUPPORTED_FORMATS
+    with pytest.raises(ValueError):
+        get_encoder("csv")
+
+
+def test_record_encoder_is_abstract():
+    from app.utils.s3_encoders import RecordEncoder
+
+    with pytest.raises(TypeError):
+        RecordEncoder()
+
+
+def test_arrow_type_keeps_integers_integral():
+    pyarrow = pytest.importorskip("pyarrow")
+    from app.utils.s3_encoders import _arrow_type
+
+    assert _arrow_type(int) == pyarrow.int64()
+    assert _arrow_type(float) == pyarrow.float64()
+    assert _arrow_type(bool) == pyarrow.bool_()
+
+
+def test_parquet_converts_mixed_type_values_per_field():
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    mixed = {
+        "symbol": "AAPL",
+        "price": "101.25",
+        "quantity": "lots",
+        "notes": {"source": "manual"},
+        "strategy_id": 7,
+    }
+    _, body = _encode("parquet", [[mixed, RECORDS[1]]])
+    rows = pq.ParquetFile(pyarrow.BufferReader(body)).read().to_pylist()
+
+    assert rows[0]["price"] == 101.25
+    assert rows[0]["quantity"] is None
+    assert json.loads(rows[0]["notes"]) == {"source": "manual"}
+    assert rows[0]["strategy_id"] == "7"
+    assert json.loads(rows[0]["extra"]) == {"quantity": "lots"}
+    assert (rows[1]["quantity"], rows[1]["price"]) == (5.0, 1.5)
+
+
+def test_column_converters_cast_or_reject_values():
+    pyarrow = pytest.importorskip("pyarrow")
+    from app.utils.s3_encoders import _column_converter
+
+    to_int = _column_converter(pyarrow.int64())
+    assert [to_int(v) for v in (3, "4", "5.0", 6.0)] == [3, 4, 5, 6]
+    for bad in ("4.5", True, 2**63, [1]):
+        with pytest.raises((TypeError, ValueError, OverflowError)):
+            to_int(bad)
+
+    to_bool = _column_converter(pyarrow.bool_())
+    assert [to_bool(v) for v in (True, 0, "TRUE")] == [True, False, True]
+    with pytest.raises(ValueError):
+        to_bool("maybe")
@@ -0,0 +1,160 @@
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from app.utils.s3_writer import BufferedS3Writer
+
+
+def _bodies(client):
+    return [json.loads(call.kwargs["Body"]) for call in client.put_object.call_args_list]
+
+
+def test_flushes_when_record_threshold_reached():
+    client = MagicMock()
+    writer = BufferedS3Writer("bucket", "output/", max_records=3, max_age=0, client=client)
+
+    writer.write([{"n": 1}, {"n": 2}])
+    client.put_object.assert_not_called()
+    writer.write([{"n": 3}])
+
+    assert _bodies(client) == [[{"n": 1}, {"n": 2}, {"n": 3}]]
+    key = client.put_object.call_args.kwargs["Key"]
+    assert key.startswith("output/dt=") and "/hour=" in key and key.endswith(".json")
+
+
+def test_flushes_when_byte_threshold_reached():
+    client = MagicMock()
+    writer = BufferedS3Writer("bucket", max_bytes=20, max_age=0, client=client)
+
+    writer.write([{"text": "0123456789abcdef"}])
+
+    assert client.put_object.call_count == 1
+
+
+def test_age_threshold_flushes_in_background():
+    client = MagicMock()
+    writer = BufferedS3Writer("bucket", max_age=0.05, client=client)
+
+    writer.write([{"n": 1}])
+    deadline = time.monotonic() + 2
+    while not client.put_object.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.close()
+
+    assert _bodies(client) == [[{"n": 1}]]
+
+
+def test_failed_upload_is_retried_on_close():
+    client = MagicMock()
+    client.put_object.side_effect = [RuntimeError("throttled"), None]
+    writer = BufferedS3Writer("bucket", max_records=1, max_age=0, client=client)
+
+    writer.write([{"n": 1}])
+    writer.close()
+
+    assert client.put_object.call_count == 2
+    assert json.loads(client.put_object.call_args.kwargs["Body"]) == [{"n": 1}]
+
+
+def test_failed_uploads_beyond_retention_cap_drop_the_oldest():
+    from unittest.mock import patch
+
+    client = MagicMock()
+    client.put_object.side_effect = RuntimeError("s3 down")
+    writer = BufferedS3Writer(
+        "bucket", max_records=1, max_age=0, client=client, max_failed_bytes=15
+    )
+
+    with patch("app.utils.s3_writer.record_output_failure") as mock_failure:
+        writer.write([{"n": 1}])
+        writer.write([{"n": 2}])
+        writer.write([{"n": 3}])
+
+    retained = [json.loads(body) for _, body, _, _ in writer._failed]
+    assert retained == [[{"n": 3}]]
+    assert mock_failure.call_count == 2
+    mock_failure.assert_called_with("s3", 1)
+
+
+def test_build_key_uses_partition_time():
+    writer = BufferedS3Writer("bucket", "p/", client=MagicMock())
+    key = writer._build_key(datetime(2024, 3, 5, 14, 30, tzinfo=timezone.utc))
+    assert key.startswith("p/dt=2024-03-05/hour=14/20240305T143000-")
+
+
+def test_gzip_ndjson_format_sets_extension_and_content_encoding():
+    import gzip
+
+    client = MagicMock()
+    writer = BufferedS3Writer("bucket", max_age=0, client=client, output_format="ndjson.gz")
+    writer.write([{"n": 1}])
+    writer.write([{"n": 2}])
+    writer.close()
+
+    kwargs = client.put_object.call_args.kwargs
+    assert kwargs["Key"].endswith(".ndjson.gz")
+    assert kwargs["ContentEncoding"] == "gzip"
+    assert gzip.decompress(kwargs["Body"]).splitlines() == [b'{"n":1}', b'{"n":2}']
+
+
+def test_streaming_upload_uses_put_object_below_one_part():
+    from app.utils.s3_writer import StreamingS3Upload
+
+    client = MagicMock()
+    upload = StreamingS3Upload(client, "bucket", "key", content_type="application/json")
+    upload.write(b"[1,")
+    upload.write(b"2]")
+    upload.close()
+
+    client.put_object.assert_called_once_with(
+        Bucket="bucket", Key="key", Body=b"[1,2]", ContentType="application/json"
+    )
+    client.create_multipart_upload.assert_not_called()
+
+
+def test_streaming_upload_switches_to_multipart_with_ordered_parts():
+    from unittest.mock import patch
+
+    from app.utils.s3_writer import StreamingS3Upload
+
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "u1"}
+    client.upload_part.side_effect = lambda **kw: {"ETag": f"etag-{kw['PartNumber']}"}
+
+    with patch("app.utils.s3_writer.S3_MIN_PART_SIZE", 1):
+        upload = StreamingS3Upload(client, "bucket", "key", part_size=4, max_concurrency=2)
+    for chunk in (b"abcdef", b"ghij", b"k"):
+        upload.write(chunk)
+    upload.close()
+
+    bodies = {c.kwargs["PartNumber"]: c.kwargs["Body"] for c in client.upload_part.call_args_list}
+    assert bodies == {1: b"abcd", 2: b"efgh", 3: b"ijk"}
+    client.complete_multipart_upload.assert_called_once_with(
+        Bucket="bucket",
+        Key="key",
+        UploadId="u1",
+        MultipartUpload={"Parts": [{"PartNumber": n, "ETag": f"etag-{n}"} for n in (1, 2, 3)]},
+    )
+    client.put_object.assert_not_called()
+
+
+def test_streaming_upload_aborts_when_completion_fails():
+    from unittest.mock import patch
+
+    import pytest
+
+    from app.utils.s3_writer import StreamingS3Upload
+
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "u1"}
+    client.upload_part.return_value = {"ETag": "e"}
+    client.complete_multipart_upload.side_effect = RuntimeError("boom")
+
+    with patch("app.utils.s3_writer.S3_MIN_PART_SIZE", 1):
+        upload = StreamingS3Upload(client, "bucket", "key", part_size=2)
+    upload.write(b"abc")
+    with pytest.raises(RuntimeError):
+        upload.close()
+
+    client.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="key", UploadId="u1")
@@ -0,0 +1,89 @@
+import datetime
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import serialization
+
+PAYLOAD = {"symbol": "ÅAPL", "price": 189.25, "volume": 1200, "tags": ["a"], 7: None}
+
+
+def _installed_backends():
+    backends = ["json"]
+    if serialization.orjson is not None:
+        backends.append("orjson")
+    if serialization.msgspec is not None:
+        backends.append("msgspec")
+    return backends
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_backends_produce_identical_compact_utf8(backend):
+    name, dumps, loads = serialization._select_backend(backend)
+
+    encoded = dumps(PAYLOAD)
+
+    assert name == backend
+    assert (
+        encoded == '{"symbol":"ÅAPL","price":189.25,"volume":1200,"tags":["a"],"7":null}'.encode()
+    )
+    assert loads(encoded) == {**{k: v for k, v in PAYLOAD.items() if k != 7}, "7": None}
+
+
+PARITY_VALUES = [
+    PAYLOAD,
+    {"small": 1e-7, "large": 1e16, "negative": -2.5, "zero": 0.0},
+    {"max_int": 2**63 - 1, "min_int": -(2**63), "flag": False, "nothing": None},
+    {"text": 'line\nbreak "quoted" \\ tab\t ☃', "nested": [{"a": [1, [2, {}]]}, []]},
+]
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_backends_decode_to_the_same_value(backend):
+    _, dumps, _ = serialization._select_backend(backend)
+
+    for value in PARITY_VALUES:
+        assert json.loads(dumps(value)) == json.loads(serialization._stdlib_dumps(value))
+
+
+@pytest.mark.parametrize("backend", [b for b in _installed_backends() if b != "json"])
+def test_native_backends_differ_from_stdlib_as_documented(backend):
+    _, dumps, _ = serialization._select_backend(backend)
+    moment = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+    assert dumps({"x": float("nan"), "y": float("inf")}) == b'{"x":null,"y":null}'
+    assert json.loads(dumps({"t": moment}))["t"].startswith("2024-01-01T00:00:00")
+    assert serialization._stdlib_dumps({"x": float("nan")}) == b'{"x":NaN}'
+    with pytest.raises(TypeError):
+        serialization._stdlib_dumps({"t": moment})
+
+
+def test_dumps_and_loads_round_trip_bytes_and_text():
+    body = serialization.dumps({"a": [1, 2]})
+    assert isinstance(body, bytes)
+    assert serialization.loads(body) == {"a": [1, 2]}
+    assert serialization.loads(serialization.dumps_str({"a": 1})) == {"a": 1}
+    assert serialization.loads(memoryview(b'{"b":2}')) == {"b": 2}
+
+
+def test_errors_are_normalized():
+    with pytest.raises(TypeError):
+        serialization.dumps({"a": object()})
+    with pytest.raises(ValueError):
+        serialization.loads(b"{not json")
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        serialization._select_backend("simdjson")
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_dumps_pretty_indents_the_same_for_every_backend(backend):
+    value = {"symbol": "ÅAPL", "price": 189.25, "tags": ["a"], "nested": {"empty": []}, 7: None}
+
+    with patch.object(serialization, "BACKEND", backend):
+        text = serialization.dumps_pretty(value)
+
+    assert text == json.dumps(value, ensure_ascii=False, indent=2)
@@ -0,0 +1,47 @@
+from app.utils.message_codec import sqs_message_attributes
+from app.utils.sqs_batching import (
+    SQS_MAX_BATCH_BYTES,
+    chunk_send_entries,
+    delete_entries,
+    handle_delete_response,
+)
+
+
+def test_chunk_send_entries_respects_count_and_size_limits():
+    chunks = chunk_send_entries(["x"] * 25)
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+    big = "y" * (SQS_MAX_BATCH_BYTES // 2)
+    chunks = chunk_send_entries([big, big, big])
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+
+def test_chunk_send_entries_counts_message_attributes():
+    attributes = sqs_message_attributes("application/msgpack")
+    body = "y" * (SQS_MAX_BATCH_BYTES // 2 - 10)
+
+    chunks = chunk_send_entries([body, body], [attributes, attributes])
+
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert chunks[0][0]["MessageAttributes"] == attributes
+
+
+def test_delete_entries_splits_into_batches_with_unique_ids():
+    batches = delete_entries([f"handle-{i}" for i in range(12)])
+
+    assert [len(batch) for batch in batches] == [10, 2]
+    assert batches[1] == [
+        {"Id": "0", "ReceiptHandle": "handle-10"},
+        {"Id": "1", "ReceiptHandle": "handle-11"},
+    ]
+
+
+def test_handle_delete_response_retries_only_transient_failures():
+    entries = [{"Id": str(i), "ReceiptHandle": f"h{i}"} for i in range(3)]
+    response = {
+        "Successful": [{"Id": "0"}],
+        "Failed": [{"Id": "1", "SenderFault": False}, {"Id": "2", "SenderFault": True}],
+    }
+
+    assert handle_delete_response(response, entries, 1) == (1, [entries[1]])
+    assert handle_delete_response(response, entries, 2) == (2, [])
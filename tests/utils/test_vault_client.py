@@ -1,6 +1,8 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from app.utils.vault_client import get_config_value_cached
 
 
@@ -14,3 +16,154 @@ def test_get_config_value_cached_returns_env():
 def test_get_config_value_cached_uses_default():
     value = get_config_value_cached("MISSING_KEY", default="default")
     assert value == "default"
+
+
+def test_secret_store_reads_vault_once():
+    from app.utils.vault_client import VaultSecretStore
+
+    with patch("app.utils.vault_client.VaultClient") as mock_client:
+        mock_client.return_value.read_secrets.return_value = {"A": "1", "B": 2}
+        store = VaultSecretStore()
+        assert store.get("A") == "1"
+        assert store.get("B") == "2"
+        assert store.get("MISSING") is None
+
+    mock_client.assert_called_once()
+    mock_client.return_value.read_secrets.assert_called_once()
+
+
+def test_secret_store_refresh_swaps_snapshot_and_notifies():
+    from unittest.mock import MagicMock
+
+    from app.utils.vault_client import VaultSecretStore
+
+    with patch("app.utils.vault_client.VaultClient") as mock_client:
+        mock_client.return_value.read_secrets.return_value = {"RABBITMQ_PASS": "old"}
+        store = VaultSecretStore(refresh_interval=0)
+        listener = MagicMock()
+        store.add_listener(listener)
+        assert store.get("RABBITMQ_PASS") == "old"
+
+        mock_client.return_value.read_secrets.return_value = {"RABBITMQ_PASS": "new"}
+        assert store.refresh() is True
+        assert store.get("RABBITMQ_PASS") == "new"
+        assert store.refresh() is False
+
+    listener.assert_called_once()
+
+
+def test_vault_client_renews_token_near_expiry():
+    import time
+
+    from app.utils.vault_client import VaultClient
+
+    with patch("app.utils.vault_client.hvac.Client") as mock_hvac:
+        mock_hvac.return_value.auth.token.renew_self.return_value = {
+            "auth": {"lease_duration": 3600, "renewable": True}
+        }
+        client = VaultClient()
+        client.token_expires_at = time.monotonic() + 5
+        client.renew_token_if_needed(threshold=60)
+
+    mock_hvac.return_value.auth.token.renew_self.assert_called_once()
+    assert client.token_expires_at > time.monotonic() + 3000
+
+
+def test_vault_client_logs_in_again_when_token_is_not_renewable():
+    import time
+
+    from app.utils.vault_client import VaultClient
+
+    with (
+        patch("app.utils.vault_client.hvac.Client") as mock_hvac,
+        patch("app.utils.vault_client.VAULT_ROLE_ID", "role"),
+        patch("app.utils.vault_client.VAULT_SECRET_ID", "secret"),
+    ):
+        approle = mock_hvac.return_value.auth.approle
+        approle.login.return_value = {
+            "auth": {"client_token": "t", "lease_duration": 600, "renewable": False}
+        }
+        client = VaultClient()
+        assert client.token_expires_at is not None
+        client.token_expires_at = time.monotonic() + 5
+        client.renew_token_if_needed(threshold=60)
+
+    assert approle.login.call_count == 2
+    mock_hvac.return_value.auth.token.renew_self.assert_not_called()
+    assert client.token_expires_at > time.monotonic() + 500
+
+
+def test_vault_client_logs_in_again_when_renewal_cannot_extend_lease():
+    import time
+
+    from app.utils.vault_client import VaultClient
+
+    with (
+        patch("app.utils.vault_client.hvac.Client") as mock_hvac,
+        patch("app.utils.vault_client.VAULT_ROLE_ID", "role"),
+        patch("app.utils.vault_client.VAULT_SECRET_ID", "secret"),
+    ):
+        approle = mock_hvac.return_value.auth.approle
+        approle.login.return_value = {
+            "auth": {"client_token": "t", "lease_duration": 3600, "renewable": True}
+        }
+        mock_hvac.return_value.auth.token.renew_self.return_value = {
+            "auth": {"lease_duration": 10, "renewable": True}
+        }
+        client = VaultClient()
+        client.token_expires_at = time.monotonic() + 30
+        client.renew_token_if_needed(threshold=60)
+
+    mock_hvac.return_value.auth.token.renew_self.assert_called_once()
+    assert approle.login.call_count == 2
+    assert client.token_expires_at > time.monotonic() + 3000
+
+
+def test_secret_store_read_failure_without_refresh_is_not_cached():
+    from app.utils.vault_client import VaultSecretStore
+
+    with patch("app.utils.vault_client.VaultClient") as mock_client:
+        mock_client.return_value.read_secrets.side_effect = [ConnectionError("down"), {"A": "1"}]
+        store = VaultSecretStore(refresh_interval=0)
+        assert store.get("A") is None
+        assert store.get("A") == "1"
+
+    mock_client.assert_called_once()
+    assert mock_client.return_value.read_secrets.call_count == 2
+
+
+def test_secret_store_reload_failure_keeps_last_good_snapshot():
+    from app.utils.vault_client import VaultSecretStore
+
+    with (
+        patch("app.utils.vault_client.VaultClient") as mock_client,
+        patch("app.utils.vault_client.POLLER_NAME", "poller"),
+        patch.object(VaultSecretStore, "_start_refresh_thread") as mock_start,
+    ):
+        mock_client.return_value.read_secrets.return_value = {"A": "1"}
+        store = VaultSecretStore(refresh_interval=60)
+        assert store.get("A") == "1"
+
+        store.reset()
+        mock_client.return_value.read_secrets.side_effect = ConnectionError("down")
+        assert store.get("A") == "1"
+        assert store.refresh() is False
+        assert store.get("A") == "1"
+
+    assert mock_start.call_count == 2
+
+
+def test_vault_client_read_secrets_fails_fast():
+    from app.utils.vault_client import VaultClient
+
+    with (
+        patch("app.utils.vault_client.hvac.Client") as mock_hvac,
+        patch("app.utils.vault_client.POLLER_NAME", "poller"),
+    ):
+        kv = mock_hvac.return_value.secrets.kv.v2
+        kv.read_secret_version.side_effect = ConnectionError("down")
+        client = VaultClient()
+        with pytest.raises(ConnectionError):
+            client.read_secrets()
+
+    kv.read_secret_version.assert_called_once()